@@ -4,7 +4,8 @@ import com.hitit.app.model.HitsterCard
 
 /**
  * Repository for fetching Hitster card data.
- * In production, this would call the actual server.
+ * RemoteHitsterCardRepository calls the card server (scripts/card_server.py),
+ * MockHitsterCardRepository serves the cards compiled into the app.
  */
 interface HitsterCardRepository {
     /**
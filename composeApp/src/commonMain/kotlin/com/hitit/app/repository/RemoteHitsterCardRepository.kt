@@ -0,0 +1,98 @@
+package com.hitit.app.repository
+
+import com.hitit.app.model.HitsterCard
+import io.ktor.client.*
+import io.ktor.client.call.*
+import io.ktor.client.plugins.contentnegotiation.*
+import io.ktor.client.request.*
+import io.ktor.client.statement.*
+import io.ktor.http.*
+import io.ktor.serialization.kotlinx.json.*
+import kotlinx.coroutines.sync.Mutex
+import kotlinx.coroutines.sync.withLock
+import kotlinx.serialization.Serializable
+import kotlinx.serialization.json.Json
+
+@Serializable
+private data class CardBatchRequest(val ids: List<String>)
+
+@Serializable
+private data class CardBatchResponse(
+    val cards: Map<String, HitsterCard> = emptyMap(),
+    val etags: Map<String, String> = emptyMap(),
+    val missing: List<String> = emptyList()
+)
+
+/**
+ * HitsterCardRepository backed by scripts/card_server.py.
+ * Cards are kept with their ETag and revalidated on the next lookup,
+ * so an unchanged card costs a 304 without a body.
+ */
+class RemoteHitsterCardRepository(
+    private val baseUrl: String
+) : HitsterCardRepository {
+
+    private val httpClient = HttpClient {
+        install(ContentNegotiation) {
+            json(Json {
+                ignoreUnknownKeys = true
+            })
+        }
+    }
+
+    private class CachedCard(val etag: String?, val card: HitsterCard)
+
+    private val cache = mutableMapOf<String, CachedCard>()
+    private val cacheMutex = Mutex()
+
+    override suspend fun getCardById(cardId: String): HitsterCard? {
+        // Same normalization as the server and MockHitsterCardRepository
+        val normalizedId = cardId.padStart(5, '0')
+        val cached = cacheMutex.withLock { cache[normalizedId] }
+
+        return try {
+            val response: HttpResponse = httpClient.get("$baseUrl/cards/$normalizedId") {
+                cached?.etag?.let { header(HttpHeaders.IfNoneMatch, it) }
+            }
+            when (response.status) {
+                HttpStatusCode.NotModified -> cached?.card
+                HttpStatusCode.OK -> {
+                    val card: HitsterCard = response.body()
+                    cacheMutex.withLock {
+                        cache[normalizedId] = CachedCard(response.headers[HttpHeaders.ETag], card)
+                    }
+                    card
+                }
+                else -> null
+            }
+        } catch (e: Exception) {
+            println("RemoteHitsterCardRepository: Error fetching card $normalizedId: ${e.message}")
+            // Offline: fall back to what we have
+            cached?.card
+        }
+    }
+
+    /**
+     * Load a whole deck in one request, so later lookups only revalidate.
+     * @return The number of cards found
+     */
+    suspend fun prefetch(cardIds: List<String>): Int {
+        return try {
+            val response: CardBatchResponse = httpClient.post("$baseUrl/cards/batch") {
+                contentType(ContentType.Application.Json)
+                setBody(CardBatchRequest(cardIds.map { it.padStart(5, '0') }))
+            }.body()
+            cacheMutex.withLock {
+                response.cards.forEach { (id, card) -> cache[id] = CachedCard(response.etags[id], card) }
+            }
+            response.cards.size
+        } catch (e: Exception) {
+            println("RemoteHitsterCardRepository: Error prefetching ${cardIds.size} cards: ${e.message}")
+            0
+        }
+    }
+
+    fun close() {
+        httpClient.close()
+    }
+}
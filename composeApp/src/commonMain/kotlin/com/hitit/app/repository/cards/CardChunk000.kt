@@ -0,0 +1,1392 @@
+// Generated by scripts/generate_full_repository.py. Do not edit.
+package com.hitit.app.repository.cards
+
+internal object CardChunk000 : CardChunk(
+    ids = arrayOf(
+        "00001", "00002", "00003", "00004", "00005", "00006", "00007", "00008",
+        "00009", "00010", "00011", "00012", "00013", "00014", "00015", "00016",
+        "00017", "00018", "00019", "00020", "00021", "00022", "00023", "00024",
+        "00025", "00026", "00027", "00028", "00029", "00030", "00031", "00032",
+        "00033", "00034", "00035", "00036", "00037", "00038", "00039", "00040",
+        "00041", "00042", "00043", "00044", "00045", "00046", "00047", "00048",
+        "00049", "00050", "00051", "00052", "00053", "00054", "00055", "00056",
+        "00057", "00058", "00059", "00060", "00061", "00062", "00063", "00064",
+        "00065", "00066", "00067", "00068", "00069", "00070", "00071", "00072",
+        "00073", "00074", "00075", "00076", "00077", "00078", "00079", "00080",
+        "00081", "00082", "00083", "00084", "00085", "00086", "00087", "00088",
+        "00089", "00090", "00091", "00092", "00093", "00094", "00095", "00096",
+        "00097", "00098", "00099", "00100", "00101", "00102", "00103", "00104",
+        "00105", "00106", "00107", "00108", "00109", "00110", "00111", "00112",
+        "00113", "00114", "00115", "00116", "00117", "00118", "00119", "00120",
+        "00121", "00122", "00123", "00124", "00125", "00126", "00127", "00128",
+        "00129", "00130", "00131", "00132", "00133", "00134", "00135", "00136",
+        "00137", "00138", "00139", "00140", "00141", "00142", "00143", "00144",
+        "00145", "00146", "00147", "00148", "00149", "00150", "00151", "00152",
+        "00153", "00154", "00155", "00156", "00157", "00158", "00159", "00160",
+        "00161", "00162", "00163", "00164", "00165", "00166", "00167", "00168",
+        "00169", "00170", "00171", "00172", "00173", "00174", "00175", "00176",
+        "00177", "00178", "00179", "00180", "00181", "00182", "00183", "00184",
+        "00185", "00186", "00187", "00188", "00189", "00190", "00191", "00192",
+        "00193", "00194", "00195", "00196", "00197", "00198", "00199", "00200",
+        "00201", "00202", "00203", "00204", "00205", "00206", "00207", "00208",
+        "00209", "00210", "00211", "00212", "00213", "00214", "00215", "00216",
+        "00217", "00218", "00219", "00220", "00221", "00222", "00223", "00224",
+        "00225", "00226", "00227", "00228", "00229", "00230", "00231", "00232",
+        "00233", "00234", "00235", "00236", "00237", "00238", "00239", "00240",
+        "00241", "00242", "00243", "00244", "00245", "00246", "00247", "00248",
+        "00249", "00250", "00251", "00252", "00253", "00254", "00255", "00256"
+    ),
+    titles = arrayOf(
+        "Wann wird's mal wieder richtig Sommer?",
+        "You Can Call Me Al",
+        "Start Me Up",
+        "The Twist",
+        "Blurred Lines",
+        "Hangover",
+        "One More Time",
+        "China In Your Hand",
+        "The Best",
+        "The Hustle",
+        "Piece Of My Heart",
+        "Hungry Eyes",
+        "Karma Chameleon",
+        "99 Luftballons",
+        "Beinhart",
+        "In Da Club",
+        "Don't Go",
+        "I Wanna Dance With Somebody (Who Loves Me)",
+        "7 Years",
+        "Sugar Baby",
+        "Lean On",
+        "Einmal um die Welt",
+        "Ich will keine Schokolade",
+        "80 Millionen",
+        "Friday I'm In Love",
+        "What Is Love",
+        "Auf uns",
+        "Don't Stop Believin'",
+        "Orinoco Flow",
+        "Über den Wolken",
+        "Rehab",
+        "Liebeskummer lohnt sich nicht",
+        "You Make Me Feel (Mighty Real)",
+        "Sweet Home Alabama",
+        "He Ain't Heavy He's My Brother",
+        "Eine neue Liebe ist wie ein neues Leben",
+        "Manic Monday",
+        "Paradise By The Dashboard Light",
+        "Never Ending Story",
+        "Don't Call Me Up",
+        "Under The Bridge",
+        "König von Deutschland",
+        "Upside Down",
+        "Don't Speak",
+        "(I Can't Get No) Satisfaction",
+        "Dilemma",
+        "Lola",
+        "Captain Jack",
+        "True Colors",
+        "Hey Ya!",
+        "Guajira Guantanamera",
+        "La Cintura",
+        "Sick and Tired",
+        "If You Leave Me Now",
+        "Siebzehn Jahr, blondes Haar",
+        "Murder On The Dancefloor",
+        "Sing Hallelujah!",
+        "Set Fire To The Rain",
+        "Herz an Herz",
+        "Tage wie diese",
+        "Sweet Caroline",
+        "Do Wah Diddy Diddy",
+        "Über sieben Brücken musst du gehen",
+        "Don't Leave Me This Way",
+        "Can't Hold Us",
+        "Do You Know? (The Ping Pong Song)",
+        "Warum",
+        "Gimme Hope Jo'anna",
+        "Wind of Change",
+        "Le Freak",
+        "Haus am See",
+        "Poker Face",
+        "It's A Heartache",
+        "Johnny B. Goode",
+        "White Wedding",
+        "La Donna È Mobile (Rigoletto)",
+        "Without You",
+        "Volare (Nel Blu Di Pinto Di Blu)",
+        "Ça Plane Pour Moi",
+        "Born To Be Alive",
+        "Whole Lotta Love",
+        "Ein Kompliment",
+        "In The Mood",
+        "Wahnsinn",
+        "Counting Stars",
+        "Dragostea Din Tei",
+        "Everybody Hurts",
+        "Just Give Me A Reason",
+        "Joyride",
+        "(We're Gonna) Rock Around The Clock",
+        "Bette Davis Eyes",
+        "Lambada",
+        "Ain't Nobody",
+        "Have You Ever Seen the Rain?",
+        "(I've Had) The Time Of My Life",
+        "Più Bella Cosa",
+        "No Son of Mine",
+        "Happy",
+        "Wonderwall",
+        "You Can't Hurry Love",
+        "Gold Digger",
+        "Ich will Spaß",
+        "Lady (Hear Me Tonight)",
+        "She Drives Me Crazy",
+        "Heimweh (Dort wo die Blumen blüh'n)",
+        "Moskau",
+        "Cotton Eye Joe",
+        "I Can Help",
+        "Dancing In The Dark",
+        "Day-O (The Banana Boat Song)",
+        "Ich will 'nen Cowboy als Mann",
+        "Break My Heart",
+        "Wrecking Ball",
+        "Jailhouse Rock",
+        "Adore You",
+        "Good Golly, Miss Molly",
+        "The Ketchup Song (Aserejé)",
+        "Relax, Take It Easy",
+        "I'm A Believer",
+        "Schuld war nur der Bossa Nova",
+        "I Love It",
+        "World, Hold On (Children Of The Sky)",
+        "Born To Be Wild",
+        "Valerie",
+        "(What A) Wonderful World",
+        "Männer",
+        "You Get What You Give",
+        "Mama",
+        "My Heart Will Go On",
+        "Dancing On The Ceiling",
+        "Give It Up",
+        "Feel",
+        "How You Remind Me",
+        "Got My Mind Set On You",
+        "Verdammt, ich lieb' dich",
+        "I Like To Move It",
+        "Don't You Want Me",
+        "Drei Uhr nachts",
+        "Westerland",
+        "Every Breath You Take",
+        "Bitter Sweet Symphony",
+        "Gettin' Jiggy Wit It",
+        "Barbie Girl",
+        "Pack die Badehose ein",
+        "Torn",
+        "The Wanderer",
+        "La Bamba",
+        "Toosie Slide",
+        "Drivers License",
+        "Moves Like Jagger",
+        "Atemlos durch die Nacht",
+        "Stop",
+        "If You Had My Love",
+        "More Than A Feeling",
+        "Disco Inferno",
+        "Someone You Loved",
+        "Mief! (Nimm mich jetzt, auch wenn ich stinke)",
+        "Sweet Child O' Mine",
+        "Your Song",
+        "Congratulations",
+        "You're So Vain",
+        "Easy",
+        "Forever Young",
+        "Maneater",
+        "Rock Me Amadeus",
+        "I Got You Babe",
+        "Junge",
+        "Everywhere",
+        "Zombie",
+        "Barbra Streisand",
+        "No One",
+        "I Knew You Were Waiting (For Me)",
+        "December, 1963 (Oh, What A Night)",
+        "4 Minutes",
+        "Autobahn",
+        "She's A Lady",
+        "Señorita",
+        "Killing Me Softly With His Song",
+        "Oops!... I Did It Again",
+        "Nur noch kurz die Welt retten",
+        "Whatcha Say",
+        "Abenteuerland",
+        "Talk",
+        "Somebody That I Used To Know",
+        "Fast Car",
+        "The Living Years",
+        "Ab in den Süden",
+        "The Boy Is Mine",
+        "All I Have To Do Is Dream",
+        "Surfin' U.S.A.",
+        "Whole Again",
+        "Right Here Waiting",
+        "Geboren um zu leben",
+        "Die Nacht von Freitag auf Montag",
+        "Fallin'",
+        "Firework",
+        "Genie In A Bottle",
+        "Euphoria",
+        "Africa",
+        "At The Hop",
+        "Mr. Vain",
+        "Sweet Dreams (Are Made Of This)",
+        "All About That Bass",
+        "Don't Dream It's Over",
+        "Purple Rain",
+        "All Of Me",
+        "Schöner fremder Mann",
+        "Love Is All Around",
+        "Gangsta's Paradise",
+        "See You Later, Alligator",
+        "Jump Around",
+        "Nothing Compares 2 U",
+        "Engel",
+        "Because Of You",
+        "Du trägst keine Liebe in dir",
+        "Part-Time Lovers",
+        "Walk Of Life",
+        "All That She Wants",
+        "Alles nur geklaut",
+        "Waterloo",
+        "Heaven",
+        "Durch den Monsun",
+        "The Loco-Motion",
+        "Smells Like Teen Spirit",
+        "Fly Away",
+        "Smalltown Boy",
+        "Ring Of Fire",
+        "These Boots Are Made For Walkin'",
+        "Price Tag",
+        "Itsy Bitsy Teenie Weenie Honolulu Strand Bikini",
+        "Informer",
+        "Das Beste",
+        "Celebration",
+        "Believe",
+        "Knock On Wood",
+        "Mercy",
+        "We Are Family",
+        "In The Summertime",
+        "Return Of The Mack",
+        "Zuckerpuppe (aus der Bauchtanz-Truppe)",
+        "Nah Neh Nah",
+        "Emanuela",
+        "Skandal im Sperrbezirk",
+        "It's My Life",
+        "Ganz Paris träumt von der Liebe",
+        "Crazy In Love",
+        "Blinding Lights",
+        "Die Gitarre und das Meer",
+        "Save Tonight",
+        "Holding Back The Years",
+        "Die Eine",
+        "1000 und 1 Nacht (Zoom!)",
+        "Die guten Zeiten",
+        "Circles",
+        "Marmor, Stein und Eisen bricht",
+        "Why"
+    ),
+    artists = arrayOf(
+        "Rudi Carrell",
+        "Paul Simon",
+        "The Rolling Stones",
+        "Chubby Checker",
+        "Robin Thicke, T.I. & Pharrell",
+        "Taio Cruz",
+        "Daft Punk",
+        "T'Pau",
+        "Tina Turner",
+        "Van McCoy",
+        "Erma Franklin",
+        "Eric Carmen",
+        "Culture Club",
+        "Nena",
+        "Torfrock",
+        "50 Cent",
+        "Yazoo",
+        "Whitney Houston",
+        "Lukas Graham",
+        "Peter Kraus",
+        "Major Lazer, DJ Snake & MØ",
+        "Cro",
+        "Trude Herr",
+        "Max Giesinger",
+        "The Cure",
+        "Haddaway",
+        "Andreas Bourani",
+        "Journey",
+        "Enya",
+        "Reinhard Mey",
+        "Amy Winehouse",
+        "Siw Malmkvist",
+        "Sylvester",
+        "Lynyrd Skynyrd",
+        "The Hollies",
+        "Jürgen Marcus",
+        "The Bangles",
+        "Meat Loaf",
+        "Limahl",
+        "Mabel",
+        "Red Hot Chili Peppers",
+        "Rio Reiser",
+        "Diana Ross",
+        "No Doubt",
+        "The Rolling Stones",
+        "Nelly (feat. Kelly Rowland)",
+        "The Kinks",
+        "Captain Jack",
+        "Cyndi Lauper",
+        "Outkast",
+        "Joseíto Fernández",
+        "Álvaro Soler",
+        "Anastacia",
+        "Chicago",
+        "Udo Jürgens",
+        "Sophie Ellis-Bextor",
+        "Dr. Alban",
+        "Adele",
+        "Blümchen",
+        "Die Toten Hosen",
+        "Neil Diamond",
+        "Manfred Mann",
+        "Karat",
+        "Thelma Houston",
+        "Macklemore & Ryan Lewis (feat. Ray Dalton)",
+        "Enrique Iglesias",
+        "Tic Tac Toe",
+        "Eddy Grant",
+        "Scorpions",
+        "Chic",
+        "Peter Fox",
+        "Lady Gaga",
+        "Bonnie Tyler",
+        "Chuck Berry",
+        "Billy Idol",
+        "Enrico Caruso",
+        "Avicii",
+        "Gipsy Kings",
+        "Plastic Bertrand",
+        "Patrick Hernandez",
+        "Led Zeppelin",
+        "Sportfreunde Stiller",
+        "Glenn Miller",
+        "Wolfgang Petry",
+        "OneRepublic",
+        "O-Zone",
+        "R.E.M.",
+        "Pink (feat. Nate Ruess)",
+        "Roxette",
+        "Bill Haley & His Comets",
+        "Kim Carnes",
+        "Kaoma",
+        "Rufus (feat. Chaka Khan)",
+        "Creedence Clearwater Revival",
+        "Bill Medley & Jennifer Warnes",
+        "Eros Ramazzotti",
+        "Genesis",
+        "Pharrell Williams",
+        "Oasis",
+        "The Supremes",
+        "Kanye West (feat. Jamie Foxx)",
+        "Markus",
+        "Modjo",
+        "Fine Young Cannibals",
+        "Freddy Quinn",
+        "Dschinghis Khan",
+        "Rednex",
+        "Billy Swan",
+        "Bruce Springsteen",
+        "Harry Belafonte",
+        "Gitte Hænning",
+        "Dua Lipa",
+        "Miley Cyrus",
+        "Elvis Presley",
+        "Harry Styles",
+        "Little Richard",
+        "Las Ketchup",
+        "Mika",
+        "The Monkees",
+        "Manuela",
+        "Icona Pop (feat. Charli XCX)",
+        "Bob Sinclar (feat. Steve Edwards)",
+        "Steppenwolf",
+        "Mark Ronson (feat. Amy Winehouse)",
+        "Sam Cooke",
+        "Herbert Grönemeyer",
+        "New Radicals",
+        "Heintje",
+        "Céline Dion",
+        "Lionel Richie",
+        "KC And The Sunshine Band",
+        "Robbie Williams",
+        "Nickelback",
+        "George Harrison",
+        "Matthias Reim",
+        "Reel 2 Real (feat. The Mad Stuntman)",
+        "The Human League",
+        "Mark Forster feat. Lea",
+        "Die Ärzte",
+        "The Police",
+        "The Verve",
+        "Will Smith",
+        "Aqua",
+        "Cornelia Froboess",
+        "Natalie Imbruglia",
+        "Dion",
+        "Ritchie Valens",
+        "Drake",
+        "Olivia Rodrigo",
+        "Maroon 5 (feat. Christina Aguilera)",
+        "Helene Fischer",
+        "Spice Girls",
+        "Jennifer Lopez",
+        "Boston",
+        "The Trammps",
+        "Lewis Capaldi",
+        "Die Doofen",
+        "Guns N' Roses",
+        "Elton John",
+        "Cliff Richard",
+        "Carly Simon",
+        "Commodores",
+        "Alphaville",
+        "Daryl Hall & John Oates",
+        "Falco",
+        "Sonny & Cher",
+        "Die Ärzte",
+        "Fleetwood Mac",
+        "The Cranberries",
+        "Duck Sauce",
+        "Alicia Keys",
+        "George Michael & Aretha Franklin",
+        "Frankie Valli & The Four Seasons",
+        "Madonna (feat. Justin Timberlake & Timbaland)",
+        "Kraftwerk",
+        "Tom Jones",
+        "Shawn Mendes & Camila Cabello",
+        "Fugees",
+        "Britney Spears",
+        "Tim Bendzko",
+        "Jason Derulo",
+        "Pur",
+        "Coldplay",
+        "Gotye (feat. Kimbra)",
+        "Tracy Chapman",
+        "Mike & The Mechanics",
+        "Buddy",
+        "Brandy (feat. Monica)",
+        "The Everly Brothers",
+        "The Beach Boys",
+        "Atomic Kitten",
+        "Richard Marx",
+        "Unheilig",
+        "SDP",
+        "Alicia Keys",
+        "Katy Perry",
+        "Christina Aguilera",
+        "Loreen",
+        "Toto",
+        "Danny & The Juniors",
+        "Culture Beat",
+        "Eurythmics",
+        "Meghan Trainor",
+        "Crowded House",
+        "Prince",
+        "John Legend",
+        "Connie Francis",
+        "Wet Wet Wet",
+        "Coolio (feat. L.V.)",
+        "Bill Haley & His Comets",
+        "House Of Pain",
+        "Sinéad O'Connor",
+        "Rammstein",
+        "Kelly Clarkson",
+        "Echt",
+        "Stevie Wonder",
+        "Dire Straits",
+        "Ace Of Base",
+        "Die Prinzen",
+        "ABBA",
+        "Bryan Adams",
+        "Tokio Hotel",
+        "Little Eva",
+        "Nirvana",
+        "Lenny Kravitz",
+        "Bronski Beat",
+        "Johnny Cash",
+        "Nancy Sinatra",
+        "Jessie J (feat. B.O.B)",
+        "Caterina Valente & Silvio Francesco",
+        "Snow",
+        "Silbermond",
+        "Kool & The Gang",
+        "Cher",
+        "Amii Stewart",
+        "Duffy",
+        "Sister Sledge",
+        "Mungo Jerry",
+        "Mark Morrison",
+        "Bill Ramsey",
+        "Vaya Con Dios",
+        "Fettes Brot",
+        "Spider Murphy Gang",
+        "Bon Jovi",
+        "Caterina Valente",
+        "Beyoncé (feat. Jay-Z)",
+        "The Weeknd",
+        "Freddy Quinn",
+        "Eagle-Eye Cherry",
+        "Simply Red",
+        "Die Firma",
+        "Klaus Lage",
+        "Wincent Weiss & Johannes Oerding",
+        "Post Malone",
+        "Drafi Deutscher",
+        "Annie Lennox"
+    ),
+    years = intArrayOf(
+        1975, 1986, 1981, 1960, 2013, 2011, 2000, 1987, 1989, 1975, 1967, 1987, 1983, 1983, 1990, 2003,
+        1982, 1987, 2015, 1958, 2015, 2012, 1960, 2016, 1992, 1993, 2014, 1981, 1988, 1974, 2006, 1964,
+        1978, 1974, 1969, 1972, 1986, 1978, 1984, 2019, 1992, 1986, 1980, 1996, 1965, 2002, 1970, 1995,
+        1986, 2003, 1929, 2018, 2004, 1976, 1965, 2001, 1993, 2011, 1996, 2012, 1969, 1964, 1978, 1976,
+        2011, 2007, 1997, 1988, 1991, 1978, 2008, 2008, 1977, 1958, 1982, 1908, 2017, 1989, 1977, 1978,
+        1969, 2002, 1939, 1983, 2013, 2003, 1992, 2013, 1991, 1954, 1981, 1989, 1983, 1971, 1987, 1996,
+        1991, 2013, 1995, 1966, 2005, 1982, 2000, 1988, 1956, 1979, 1994, 1974, 1984, 1956, 1963, 2020,
+        2013, 1957, 2019, 1958, 2002, 2007, 1966, 1963, 2012, 2006, 1968, 2007, 1960, 1984, 1998, 1968,
+        1997, 1986, 1982, 2002, 2001, 1987, 1990, 1993, 1981, 2021, 1988, 1983, 1997, 1998, 1997, 1951,
+        1997, 1961, 1958, 2020, 2021, 2011, 2013, 1998, 1999, 1976, 1976, 2018, 1995, 1988, 1970, 1968,
+        1972, 1977, 1984, 1982, 1985, 1965, 2007, 1987, 1994, 2010, 2007, 1987, 1975, 2008, 1974, 1971,
+        2019, 1996, 2000, 2011, 2009, 1995, 2005, 2011, 1988, 1988, 2003, 1998, 1958, 1963, 2001, 1989,
+        2010, 2012, 2001, 2010, 1999, 2012, 1982, 1957, 1993, 1983, 2014, 1986, 1984, 2013, 1964, 1994,
+        1995, 1956, 1992, 1990, 1997, 2005, 1999, 1985, 1985, 1992, 1993, 1974, 1985, 2005, 1962, 1991,
+        1998, 1984, 1963, 1965, 2011, 1960, 1992, 2006, 1980, 1998, 1979, 2008, 1979, 1970, 1996, 1961,
+        1990, 2005, 1981, 2000, 1954, 2003, 2019, 1959, 1997, 1985, 1998, 1984, 2021, 2019, 1965, 1992
+    ),
+    deezerIds = longArrayOf(
+        2305104805L, 6599483L, 1522727912L, 64638140L, 65444691L, 14893478L,
+        3135553L, 3152784L, 3142379L, 2739276411L, 9809444L, 13128242L,
+        3152791L, 639505182L, 481901362L, 1141668L, 12650195L, 75981528L,
+        101742167L, 16638774L, 445800112L, 3309927701L, 2322567L, 518107802L,
+        1123014L, 2688767492L, 77045434L, 625643L, 65728152L, 3297738L,
+        2176852L, 28126601L, 891619L, 24949681L, 3161462L, 539083782L,
+        608749L, 125468092L, 3518231L, 616963582L, 785176L, 869747L,
+        4677572L, 24246391L, 815051842L, 2447443L, 2231539207L, 61891432L,
+        6067352L, 628266L, 5214826L, 675340022L, 111772878L, 3616306L,
+        4253142L, 4181750L, 1687250217L, 8086130L, 2888227L, 142393383L,
+        145434430L, 1930318867L, 1135923432L, 3067260L, 61424044L, 2604913L,
+        62379124L, 3510639391L, 927900L, 72060062L, 2200206L, 2603558L,
+        131593760L, 2689636L, 947711032L, 15468696L, 393460732L, 958716372L,
+        12216125L, 67396065L, 2752768171L, 1791078487L, 570273L, 120358320L,
+        78527795L, 1411240392L, 121921372L, 110931632L, 1523248472L, 602444242L,
+        3153065L, 2364224845L, 4094693L, 883644L, 13128250L, 604840L,
+        14638202L, 701326562L, 985745702L, 79621446L, 1184309L, 663173602L,
+        70179720L, 1178372072L, 2308635L, 470543912L, 419139102L, 15273580L,
+        15586246L, 16045403L, 1408767732L, 910173472L, 71137166L, 6596867L,
+        830336932L, 73012063L, 476739462L, 953606L, 764920L, 598445L,
+        69959333L, 2702194582L, 540202122L, 7923756L, 13205914L, 3159913L,
+        2441438L, 456971872L, 14552280L, 905690L, 541998L, 3098217L,
+        71828723L, 2141052707L, 111773080L, 524374752L, 3092940L, 1288053342L,
+        1095340122L, 2525864L, 3138832L, 1038048L, 1115044L, 13437254L,
+        992131L, 3121437L, 104816990L, 919708552L, 1378342592L, 12724819L,
+        72761680L, 3134156L, 15475926L, 1037414L, 721611L, 582143242L,
+        1060193L, 518458172L, 880181L, 3124130L, 766109L, 2177862L,
+        698274L, 569561L, 542016L, 735788L, 1006111382L, 664444L,
+        952788L, 3157769351L, 2466262L, 142787302L, 79572018L, 794020L,
+        1006803512L, 549298332L, 698905582L, 869548L, 13142617L, 12000049L,
+        5420471L, 99127316L, 3106506L, 14539929L, 2271563L, 2598565352L,
+        677931742L, 662355L, 74494813L, 2958899471L, 3240483L, 3168937L,
+        75486189L, 61394924L, 959183L, 17135111L, 15627386L, 67466760L,
+        1079668L, 1903433L, 29794781L, 15645257L, 113420702L, 133577580L,
+        374283061L, 70079770L, 3055769L, 1448958662L, 1584416372L, 908742L,
+        1584589772L, 1787569267L, 630595112L, 546130L, 2305250L, 24967291L,
+        2514683L, 94676692L, 2200874917L, 76376889L, 88902737L, 7718640L,
+        100772638L, 13791930L, 3156968L, 428735732L, 856630L, 71323824L,
+        14405185L, 14189399L, 3884974L, 15478334L, 95873824L, 786717L,
+        10370275L, 2606173L, 1872880L, 131302482L, 703748L, 92788994L,
+        1053435L, 3558285081L, 3123329L, 577487252L, 7524269L, 13138698L,
+        908604612L, 16476740L, 2252935L, 2477001L, 974865722L, 13460739L,
+        1394046942L, 747399352L, 697623L, 2889773L
+    ),
+    deezerTitles = arrayOf<String?>(
+        "Wann wird's mal wieder richtig Sommer",
+        "You Can Call Me Al",
+        "Start Me Up",
+        "The Twist",
+        "Blurred Lines",
+        "Hangover",
+        "One More Time",
+        "China In Your Hand",
+        "The Best",
+        "The Hustle",
+        "Piece of My Heart",
+        "Hungry Eyes (From \"Dirty Dancing\" Soundtrack)",
+        "Karma Chameleon",
+        "99 Luftballons",
+        "Beinhart",
+        "In Da Club",
+        "Don't Go (2008 Remaster)",
+        "I Wanna Dance with Somebody (Who Loves Me)",
+        "7 Years",
+        "Sugar Baby",
+        "Lean On",
+        "Einmal um die Welt",
+        "Ich will keine Schokolade",
+        "80 Millionen",
+        "Friday I'm In Love",
+        "What Is Love",
+        "Auf uns",
+        "Don't Stop Believin'",
+        "Orinoco Flow",
+        "Über den Wolken",
+        "Rehab",
+        "Liebeskummer Lohnt Sich Nicht",
+        "You Make Me Feel (Mighty Real)",
+        "Sweet Home Alabama",
+        "He Ain't Heavy He's My Brother (2003 Remaster)",
+        "Eine neue Liebe ist wie ein neues Leben",
+        "Manic Monday",
+        "Paradise By the Dashboard Light",
+        "Never Ending Story",
+        "Don't Call Me Up",
+        "Under the Bridge",
+        "König von Deutschland",
+        "Upside Down",
+        "Don't Speak",
+        "(I Can't Get No) Satisfaction",
+        "Dilemma",
+        "Lola",
+        "Captain Jack (Short Mix)",
+        "True Colors",
+        "Hey Ya!",
+        "Guajira Guantanamera",
+        "La Cintura",
+        "Sick and Tired",
+        "If You Leave Me Now",
+        "Siebzehn Jahr, blondes Haar",
+        "Murder On The Dancefloor",
+        "Sing Hallelujah!",
+        "Set Fire to the Rain",
+        "Herz an Herz",
+        "Tage wie diese",
+        "Sweet Caroline",
+        "Do Wah Diddy Diddy (2007 Remaster)",
+        "Über sieben Brücken musst du gehen Live",
+        "Don't Leave Me This Way",
+        "Can't Hold Us (feat. Ray Dalton)",
+        "Do You Know? (The Ping Pong Song)",
+        "Warum?",
+        "Gimme Hope Jo'anna",
+        "Wind Of Change",
+        "Le Freak",
+        "Haus am See",
+        "Poker Face",
+        "It's a Heartache",
+        "Johnny B. Goode",
+        "White Wedding",
+        "La donna è mobile (Rigoletto)",
+        "Without You",
+        "Volare (Nel Blu di Pinto di Blu)",
+        "Ca Plane Pour Moi",
+        "Born To Be Alive",
+        "Whole lotta love",
+        "Ein Kompliment",
+        "In The Mood",
+        "Wahnsinn",
+        "Counting Stars",
+        "Dragostea din tei",
+        "Everybody Hurts",
+        "Just Give Me a Reason",
+        "Joyride",
+        "(We're Gonna) Rock Around The Clock",
+        "Bette Davis Eyes",
+        "Lambada",
+        "Ain't Nobody",
+        "Have You Ever Seen The Rain",
+        "(I've Had) The Time Of My Life (From \"Dirty Dancing\" Soundtrack)",
+        "Più bella cosa",
+        "No Son of Mine",
+        "Happy (From \"Despicable Me 2\")",
+        "Wonderwall",
+        "You Can't Hurry Love",
+        "Gold Digger",
+        "Ich will Spaß",
+        "Lady (Hear Me Tonight)",
+        "She Drives Me Crazy (Remastered)",
+        "Heimweh (Dort wo die Blumen blüh'n)",
+        "Moskau",
+        "Cotton Eye Joe",
+        "I Can Help",
+        "Dancing In the Dark",
+        "Day-O (The Banana Boat Song)",
+        "Ich will 'nen Cowboy als Mann",
+        "Break My Heart",
+        "Wrecking Ball",
+        "Jailhouse Rock",
+        "Adore You",
+        "Good Golly, Miss Molly (Remastered)",
+        "The Ketchup Song (Aserejé) (Spanish Version)",
+        "Relax, Take It Easy",
+        "I'm a Believer (2006 Remaster)",
+        "Schuld war nur der Bossa Nova",
+        "I Love It (feat. Charli XCX)",
+        "World, Hold On (Children Of The Sky) (Extended Club Mix)",
+        "Born To Be Wild",
+        "Valerie (feat. Amy Winehouse) (Version Revisited)",
+        "(What A) Wonderful World",
+        "Männer",
+        "You Get What You Give",
+        "Mama",
+        "My Heart Will Go On (Love Theme from \"Titanic\")",
+        "Dancing On The Ceiling",
+        "Give It Up",
+        "Feel",
+        "How You Remind Me",
+        "Got My Mind Set On You",
+        "Verdammt Ich lieb' dich",
+        "I Like To Move It (feat. The Mad Stuntman) (Erick \"More\" Album Mix)",
+        "Don't You Want Me",
+        "Drei Uhr Nachts",
+        "Westerland",
+        "Every Breath You Take",
+        "Bitter Sweet Symphony",
+        "Gettin' Jiggy Wit It",
+        "Barbie Girl",
+        "Pack Die Badehose Ein",
+        "Torn",
+        "The Wanderer",
+        "La Bamba",
+        "Toosie Slide",
+        "drivers license",
+        "Moves Like Jagger (Studio Recording From \"The Voice\" Performance)",
+        "Atemlos durch die Nacht",
+        "Stop",
+        "If You Had My Love",
+        "More Than a Feeling",
+        "Disco Inferno",
+        "Someone You Loved",
+        "MIEF! (Nimm mich jetzt, auch wenn ich stinke) Video Version",
+        "Sweet Child O' Mine",
+        "Your Song",
+        "Congratulations",
+        "You're So Vain",
+        "Easy",
+        "Forever Young",
+        "Maneater",
+        "Rock Me Amadeus",
+        "I Got You Babe",
+        "Junge",
+        "Everywhere",
+        "Zombie",
+        "Barbra Streisand",
+        "No One",
+        "I Knew You Were Waiting (For Me)",
+        "December, 1963 (Oh, What a Night)",
+        "4 Minutes (feat. Justin Timberlake and Timbaland)",
+        "Autobahn",
+        "She's A Lady",
+        "Señorita",
+        "Killing Me Softly With His Song",
+        "Oops!...I Did It Again",
+        "Nur noch kurz die Welt retten",
+        "Whatcha Say",
+        "Abenteuerland",
+        "Talk",
+        "Somebody That I Used To Know",
+        "Fast Car",
+        "The Living Years",
+        "Ab in den Süden (Neuaufnahme)",
+        "The Boy Is Mine",
+        "All I Have to Do Is Dream",
+        "Surfin' U.S.A.",
+        "Whole Again",
+        "Right Here Waiting",
+        "Geboren um zu leben",
+        "Die Nacht von Freitag auf Montag",
+        "Fallin'",
+        "Firework",
+        "Genie In a Bottle",
+        "Euphoria",
+        "Africa",
+        "At The Hop",
+        "Mr. Vain",
+        "Sweet Dreams (Are Made of This)",
+        "All About That Bass",
+        "Don't Dream It's Over",
+        "Purple Rain (2015 Paisley Park Remaster)",
+        "All of Me",
+        "Schöner fremder Mann",
+        "Love is All Around",
+        "Gangsta's Paradise",
+        "See You Later, Alligator",
+        "Jump Around",
+        "Nothing Compares 2 U",
+        "Engel",
+        "Because of You",
+        "Du trägst keine Liebe in dir",
+        "Part-Time Lover",
+        "Walk Of Life",
+        "All That She Wants",
+        "Alles nur geklaut",
+        "Waterloo",
+        "Heaven",
+        "Durch den Monsun (Radio Mix)",
+        "The Loco-Motion",
+        "Smells Like Teen Spirit",
+        "Fly Away",
+        "Smalltown Boy",
+        "Ring of Fire",
+        "These Boots Are Made for Walkin'",
+        "Price Tag",
+        "Itsy Bitsy Teenie Weenie Honolulu Strand Bikini",
+        "Informer",
+        "Das Beste",
+        "Celebration",
+        "Believe",
+        "Knock On Wood",
+        "Mercy",
+        "We Are Family",
+        "In the Summertime",
+        "Return of the Mack",
+        "Zuckerpuppe (Aus der Bauchtanz-Truppe)",
+        "Nah Neh Nah",
+        "Emanuela",
+        "Skandal im Sperrbezirk",
+        "It's My Life",
+        "Ganz Paris träumt von der Liebe",
+        "Crazy In Love (feat. JAY-Z)",
+        "Blinding Lights",
+        "Die Gitarre und das Meer",
+        "Save Tonight",
+        "Holding Back the Years (2008 Remaster)",
+        "Die Eine",
+        "1000 und 1 Nacht (Zoom!)",
+        "Die guten Zeiten",
+        "Circles",
+        "Marmor, Stein und Eisen bricht",
+        "Why"
+    ),
+    deezerArtists = arrayOf<String?>(
+        "Rudi Carrell",
+        "Paul Simon",
+        "The Rolling Stones",
+        "Chubby Checker",
+        "Robin Thicke",
+        "Taio Cruz",
+        "Daft Punk",
+        "T'pau",
+        "Tina Turner",
+        "Van McCoy",
+        "Erma Franklin",
+        "Eric Carmen",
+        "Culture Club",
+        "Nena",
+        "Torfrock",
+        "50 Cent",
+        "Yazoo",
+        "Whitney Houston",
+        "Lukas Graham",
+        "Peter Kraus",
+        "Major Lazer",
+        "CRO",
+        "Trude Herr",
+        "Max Giesinger",
+        "The Cure",
+        "Haddaway",
+        "Andreas Bourani",
+        "Journey",
+        "Enya",
+        "Reinhard Mey",
+        "Amy Winehouse",
+        "Siw Malmkvist",
+        "Sylvester",
+        "Lynyrd Skynyrd",
+        "The Hollies",
+        "Jürgen Marcus",
+        "The Bangles",
+        "Meat Loaf",
+        "Limahl",
+        "Mabel",
+        "Red Hot Chili Peppers",
+        "Rio Reiser",
+        "Diana Ross",
+        "No Doubt",
+        "The Rolling Stones",
+        "Nelly",
+        "The Kinks",
+        "Captain Jack",
+        "Cyndi Lauper",
+        "Outkast",
+        "Joseíto Fernández / La Calandria",
+        "Alvaro Soler",
+        "Anastacia",
+        "Chicago",
+        "Udo Jürgens",
+        "Sophie Ellis-Bextor",
+        "Dr. Alban",
+        "Adele",
+        "Blümchen",
+        "Die Toten Hosen",
+        "Neil Diamond",
+        "Manfred Mann",
+        "Karat",
+        "Thelma Houston",
+        "Macklemore",
+        "Enrique Iglesias",
+        "Tic Tac Toe",
+        "Eddy Grant",
+        "Scorpions",
+        "Chic",
+        "Peter Fox",
+        "Lady Gaga",
+        "Bonnie Tyler",
+        "Chuck Berry",
+        "Billy Idol",
+        "Enrico Caruso",
+        "Avicii",
+        "Gipsy Kings",
+        "Plastic Bertrand",
+        "Patrick Hernandez",
+        "Led Zeppelin",
+        "Sportfreunde Stiller",
+        "Glenn Miller",
+        "Wolfgang Petry",
+        "OneRepublic",
+        "O-Zone",
+        "R.E.M.",
+        "Jason Chen & Megan Nicole",
+        "Roxette",
+        "Bill Haley & His Comets",
+        "Kim Carnes",
+        "Kaoma",
+        "Rufus",
+        "Creedence Clearwater Revival",
+        "Bill Medley",
+        "Eros Ramazzotti",
+        "Genesis",
+        "Pharrell Williams",
+        "Oasis",
+        "The Supremes",
+        "Kanye West",
+        "Markus",
+        "Modjo",
+        "Fine Young Cannibals",
+        "Freddy Quinn",
+        "Dschinghis Khan",
+        "Rednex",
+        "Billy Swan",
+        "Bruce Springsteen",
+        "Harry Belafonte",
+        "Gitte Hænning",
+        "Dua Lipa",
+        "Miley Cyrus",
+        "Elvis Presley",
+        "Harry Styles",
+        "Little Richard",
+        "Las Ketchup",
+        "MIKA",
+        "The Monkees",
+        "Manuela",
+        "Icona Pop",
+        "Bob Sinclar",
+        "Steppenwolf",
+        "Mark Ronson",
+        "Sam Cooke",
+        "Herbert Grönemeyer",
+        "New Radicals",
+        "Heintje",
+        "Céline Dion",
+        "Lionel Richie",
+        "Kc & The Sunshine Band",
+        "Robbie Williams",
+        "Nickelback",
+        "George Harrison",
+        "Matthias Reim",
+        "Reel 2 Real",
+        "The Human League",
+        "Mark Forster",
+        "Die Ärzte",
+        "The Police",
+        "The Verve",
+        "Will Smith",
+        "Aqua",
+        "Cornelia Froboess",
+        "Natalie Imbruglia",
+        "Dion",
+        "Ritchie Valens",
+        "Drake",
+        "Olivia Rodrigo",
+        "Maroon 5",
+        "Helene Fischer",
+        "Spice Girls",
+        "Jennifer Lopez",
+        "Boston",
+        "The Trammps",
+        "Lewis Capaldi",
+        "Die Doofen",
+        "Guns N' Roses",
+        "Elton John",
+        "Cliff Richard",
+        "Carly Simon",
+        "Commodores",
+        "Alphaville",
+        "Daryl Hall & John Oates",
+        "Falco",
+        "Sonny & Cher",
+        "Die Ärzte",
+        "Fleetwood Mac",
+        "The Cranberries",
+        "Duck Sauce",
+        "Alicia Keys",
+        "George Michael",
+        "Frankie Valli & The Four Seasons",
+        "Madonna",
+        "Kraftwerk",
+        "Tom Jones",
+        "Shawn Mendes",
+        "Fugees",
+        "Britney Spears",
+        "Tim Bendzko",
+        "Jason Derulo",
+        "Pur",
+        "Coldplay",
+        "Gotye",
+        "Tracy Chapman",
+        "Mike + The Mechanics",
+        "Buddy Poke",
+        "Brandy",
+        "The Everly Brothers",
+        "The Beach Boys",
+        "Atomic Kitten",
+        "Richard Marx",
+        "Unheilig",
+        "SDP",
+        "Alicia Keys",
+        "Katy Perry",
+        "Christina Aguilera",
+        "Loreen",
+        "Toto",
+        "Danny & The Juniors",
+        "Culture Beat",
+        "Eurythmics",
+        "Meghan Trainor",
+        "Crowded House",
+        "Prince",
+        "John Legend",
+        "Connie Francis",
+        "Wet Wet Wet",
+        "Coolio",
+        "Bill Haley & His Comets",
+        "House of Pain",
+        "Sinéad O'Connor",
+        "Rammstein",
+        "Kelly Clarkson",
+        "Echt",
+        "Stevie Wonder",
+        "Dire Straits",
+        "Ace of Base",
+        "Die Prinzen",
+        "ABBA",
+        "Bryan Adams",
+        "Tokio Hotel",
+        "Little Eva",
+        "Nirvana",
+        "Lenny Kravitz",
+        "Bronski Beat",
+        "Johnny Cash",
+        "Nancy Sinatra",
+        "Jessie J",
+        "Caterina Valente",
+        "SNoW",
+        "Silbermond",
+        "Kool & The Gang",
+        "Cher",
+        "Amii Stewart",
+        "Duffy",
+        "Sister Sledge",
+        "Mungo Jerry",
+        "Mark Morrison",
+        "Bill Ramsey",
+        "Vaya Con Dios",
+        "Fettes Brot",
+        "Spider Murphy Gang",
+        "Bon Jovi",
+        "Caterina Valente",
+        "Beyoncé",
+        "The Weeknd",
+        "Freddy Quinn",
+        "Eagle-Eye Cherry",
+        "Simply Red",
+        "Die Firma",
+        "Klaus Lage",
+        "Wincent Weiss",
+        "Post Malone",
+        "Drafi Deutscher",
+        "Annie Lennox"
+    ),
+    deezerAlbums = arrayOf<String?>(
+        "Das Beste von Rudi Carrell",
+        "The Essential Paul Simon",
+        "Tattoo You (Super Deluxe)",
+        "Chubby Checker Classics",
+        "Blurred Lines",
+        "TY.O (International Version)",
+        "Discovery",
+        "Heart And Soul - The Very Best Of T'Pau",
+        "Tina!",
+        "The Hustle",
+        "Erma Franklin: Piece Of Her Heart - The Epic And Shout Years",
+        "Dirty Dancing (Original Motion Picture Soundtrack)",
+        "Spin Dazzle - The Best Of Boy George And Culture Club",
+        "99 Luftballons",
+        "Beinhart",
+        "Get Rich Or Die Tryin'",
+        "Essential: Eighties",
+        "Whitney",
+        "Lukas Graham (Blue Album)",
+        "Sugar Sugar Baby",
+        "Peace Is The Mission (Remixes)",
+        "Raop",
+        "Ich Will Keine Schokolade",
+        "80 Millionen",
+        "Wish",
+        "What Is Love",
+        "Auf uns",
+        "The Essential Journey",
+        "Paint the Sky with Stars",
+        "Die Grossen Erfolge",
+        "Back To Black",
+        "Liebeskummer lohnt sich nicht",
+        "The Original Hits",
+        "Second Helping (Expanded Edition)",
+        "The Long Road Home 1963-2003 - 40th Anniversary Collection",
+        "Das Beste mit Liebe",
+        "The Essential Bangles",
+        "Bat Out Of Hell",
+        "The Very Best Of Kajagoogoo",
+        "Ivy To Roses (Mixtape)",
+        "Greatest Hits",
+        "König von Deutschland - Das Beste von Rio Reiser",
+        "Diana",
+        "The Singles Collection",
+        "Live On The Ed Sullivan Show (Live)",
+        "Nellyville",
+        "Federal Capital Paranoia Blues",
+        "The Mission",
+        "True Colors: The Best Of Cyndi Lauper",
+        "Speakerboxxx/The Love Below",
+        "Great Cuban Songwriters",
+        "Mar De Colores (Versión Extendida)",
+        "Ultimate Collection",
+        "The Very Best of Chicago: Only the Beginning",
+        "Best Of",
+        "Read My Lips (Deluxe Version)",
+        "One Love",
+        "21",
+        "Für immer und ewig",
+        "Tage wie diese",
+        "50th Anniversary Collection",
+        "Down the Road Apiece - the Recordings 1963-1966",
+        "PETER MAFFAY UND...",
+        "The Best Of",
+        "The Heist",
+        "Greatest Hits",
+        "Klappe die 2te",
+        "The Dave Cash Collection: Gimmie Eddy",
+        "Crazy World",
+        "The Studio Album Collection 1977-1992",
+        "Stadtaffe",
+        "The Fame",
+        "It's a Heartache",
+        "Chuck Berry",
+        "Live in Europe '90 (Live)",
+        "La donna è mobile",
+        "AVĪCI (01)",
+        "The Essential Gipsy Kings",
+        "L'Essential",
+        "Wog Boy 2 Original Soundtrack",
+        "Ten songs for you",
+        "Die gute Seite (Die lange Seite)",
+        "The Essential Glenn Miller",
+        "40 Jahre - 40 Hits",
+        "Native",
+        "DiscO-Zone",
+        "Automatic For The People",
+        "Just Give Me a Reason (originally by P!nk feat. Nate Ruess)",
+        "Joyride 30th Anniversary Edition",
+        "Rock Around The Clock",
+        "Gypsy Honeymoon: The Best Of Kim Carnes",
+        "Movida Latina 3",
+        "Stompin' At The Savoy",
+        "Creedence Clearwater Revival - Best Of",
+        "Dirty Dancing (Original Motion Picture Soundtrack)",
+        "Eros - Best Of",
+        "Turn It on Again: The Hits",
+        "G I R L",
+        "(What's The Story) Morning Glory?",
+        "Supremes A Go Go",
+        "Late Registration",
+        "Stereo (2 Originale)",
+        "Modjo (Remastered)",
+        "The Raw & The Cooked (Remastered & Expanded)",
+        "Freddy, die Gitarre und das Meer",
+        "Moskau - Das Neue Best Of Album",
+        "Sex & Violins",
+        "The Best Of Billy Swan",
+        "Born In The U.S.A.",
+        "Day-O",
+        "Electrola… Das ist Musik! Gitte Hænning",
+        "Break My Heart",
+        "Bangerz (Deluxe Version)",
+        "The Essential Elvis Presley 3.0",
+        "Fine Line",
+        "100 Rock'n'Roll Hits (Remastered)",
+        "Aserejé (The Ketchup Song)",
+        "Life In Cartoon Motion (UK eDeluxe Album)",
+        "More of The Monkees (Deluxe Edition)",
+        "Jive Manuela",
+        "THIS IS... ICONA POP",
+        "World, Hold On (Children Of The Sky)- EP",
+        "Born To Be Wild (Best Of....)",
+        "Version",
+        "The Man Who Invented Soul",
+        "Was Muss Muss - Best Of",
+        "Maybe You've Been Brainwashed Too",
+        "Mama",
+        "My Love Essential Collection",
+        "Dancing On The Ceiling (Expanded Edition)",
+        "The Definitive 80's (eighties)",
+        "Escapology",
+        "The Best of Nickelback, Vol. 1",
+        "Cloud Nine",
+        "Ich find' Schlager toll",
+        "Move It!",
+        "Dare!",
+        "Drei Uhr Nachts",
+        "Das Ist Nicht Die Ganze Wahrheit...",
+        "The Very Best Of Sting And The Police",
+        "Bitter Sweet Symphony",
+        "Big Willie Style",
+        "Aquarium",
+        "Cornelia Froboess: 50's Gold",
+        "Left Of The Middle",
+        "The Best Of Dion & The Belmonts",
+        "Donna",
+        "Toosie Slide",
+        "SOUR",
+        "Hands All Over (Revised International Deluxe)",
+        "Atemlos durch die Nacht (The Radio Mixes)",
+        "Spiceworld",
+        "On The 6",
+        "Greatest Hits",
+        "Disco Inferno",
+        "Breach",
+        "Lieder, die die Welt nicht braucht",
+        "Appetite For Destruction (Super Deluxe Edition)",
+        "Elton John",
+        "40 Golden Greats",
+        "The Best of Carly Simon",
+        "Back To Front",
+        "Forever Young",
+        "The Essential Daryl Hall & John Oates",
+        "The Definitive 80's (eighties)",
+        "The Two Of Us",
+        "Jazz ist anders",
+        "Greatest Hits",
+        "Girls And Guitars",
+        "Quack",
+        "As I Am (Expanded Edition)",
+        "Aretha (Expanded Edition)",
+        "Jersey Boys: Music from the Motion Picture and Broadway Musical",
+        "Hard Candy (Deluxe Digital)",
+        "3-D Der Katalog (German Version)",
+        "The Best Of Tom Jones - 20th Century Masters: The Millennium Collection",
+        "Señorita",
+        "Greatest Hits",
+        "Oops!... I Did It Again",
+        "Nur noch kurz die Welt retten",
+        "Jason Derulo (International)",
+        "Hits Pur - 20 Jahre Eine Band (Fan Edition)",
+        "X&Y",
+        "Making Mirrors",
+        "Tracy Chapman",
+        "Out Of The Blue",
+        "Party Hits",
+        "Never Say Never",
+        "The Very Best of The Everly Brothers",
+        "Los Años 60",
+        "Feels So Good",
+        "Repeat Offender",
+        "Alles hat seine Zeit - Best Of Unheilig 1999 - 2014",
+        "Die bekannteste unbekannte Band der Welt",
+        "Songs In A Minor",
+        "Teenage Dream: The Complete Confection",
+        "Christina Aguilera (Expanded Edition)",
+        "Heal (2013 Edition)",
+        "Toto IV",
+        "At The Hop - Greatest Hits",
+        "Serenity",
+        "Greatest Hits",
+        "Title (Expanded Edition)",
+        "Crowded House",
+        "Purple Rain (Deluxe Expanded Edition)",
+        "Love In The Future (Expanded Edition)",
+        "Connie Francis Party Power",
+        "The Journey",
+        "Gangsta's Paradise",
+        "Rock N' Roll Legends",
+        "Hi-Five: House Of Pain",
+        "So Far: The Best of Sinéad O'Connor",
+        "Sehnsucht",
+        "Breakaway",
+        "Freischwimmer",
+        "In Square Circle",
+        "The Best Of Dire Straits & Mark Knopfler - Private Investigations",
+        "Happy Nation (U.S. Version) (Remastered)",
+        "Alles nur geklaut",
+        "Abba Gold Anniversary Edition",
+        "Reckless",
+        "Best Of (German Version)",
+        "Moochin' Abouts Stateside Hitlist 1962",
+        "Nevermind (Remastered)",
+        "5",
+        "The Very Best Of Jimmy Somerville, Bronski Beat & The Communards",
+        "The Essential Johnny Cash",
+        "Kid Stuff",
+        "Who You Are (Platinum Edition)",
+        "Itsy Bitsy Teenie Weenie Honolulu Strand Bikini",
+        "12 Inches Of Snow",
+        "Laut Gedacht (Re-Edition)",
+        "Celebrate!",
+        "Believe",
+        "Knock On Wood",
+        "Rockferry",
+        "Soul Weekender",
+        "In the Summertime",
+        "Return of the Mack",
+        "Pigalle, Pigalle",
+        "The Best Of Vaya Con Dios",
+        "Am Wasser gebaut (Trockendock Edition)",
+        "Greatest Hits",
+        "Bon Jovi Greatest Hits - The Ultimate Collection (Deluxe)",
+        "Bonjour Catherine",
+        "Dangerously In Love",
+        "After Hours",
+        "Freddy Quinn - Die grossen Hits",
+        "Desireless",
+        "Picture Book (Expanded Version)",
+        "Spiel des Lebens / Spiel des Todes (Deluxe Edition)",
+        "Ballermann Hits Silvester",
+        "Die guten Zeiten",
+        "Hollywood's Bleeding",
+        "Drafi!",
+        "The Annie Lennox Collection"
+    )
+)
@@ -0,0 +1,301 @@
+// Generated by scripts/generate_full_repository.py. Do not edit.
+package com.hitit.app.repository.cards
+
+internal object CardChunk001 : CardChunk(
+    ids = arrayOf(
+        "00257", "00258", "00259", "00260", "00261", "00262", "00263", "00264",
+        "00265", "00266", "00267", "00268", "00269", "00270", "00271", "00272",
+        "00273", "00274", "00275", "00276", "00277", "00278", "00279", "00280",
+        "00281", "00282", "00283", "00284", "00285", "00286", "00287", "00288",
+        "00289", "00290", "00291", "00292", "00293", "00294", "00295", "00296",
+        "00297", "00298", "00299", "00300", "00301", "00302", "00303", "00304",
+        "00305", "00306", "00307", "00308"
+    ),
+    titles = arrayOf(
+        "Cheap Thrills",
+        "Under Pressure",
+        "Numb/Encore",
+        "Good Vibrations",
+        "Ain't That A Shame",
+        "Das Boot",
+        "Praise You",
+        "Could I Have This Kiss Forever",
+        "Major Tom (völlig losgelöst)",
+        "Where Is The Love?",
+        "It Wasn't Me",
+        "Dance Monkey",
+        "It's In His Kiss (The Shoop Shoop Song)",
+        "I Got You (I Feel Good)",
+        "Lonely",
+        "Super Freak",
+        "Tränen lügen nicht",
+        "When A Man Loves A Woman",
+        "Blue Bayou",
+        "Jolene",
+        "Like A Prayer",
+        "That's Amore",
+        "Piano Man",
+        "Er hat ein knallrotes Gummiboot",
+        "Space Oddity",
+        "Anyone",
+        "Scars To Your Beautiful",
+        "Get Back",
+        "Waka Waka (This Time For Africa)",
+        "Let's Stick Together",
+        "Put Your Records On",
+        "Ice Ice Baby",
+        "When I Need You",
+        "Bad Guy",
+        "Feel It Still",
+        "Shallow",
+        "Vom selben Stern",
+        "Hey, Soul Sister",
+        "Can't Help Falling In Love",
+        "Call On Me",
+        "I Heard It Through The Grapevine",
+        "Ein Bett im Kornfeld",
+        "Dancing In The Moonlight",
+        "Escape (The Piña Colada Song)",
+        "Thunder",
+        "Oh, Pretty Woman",
+        "Lollipop",
+        "No Woman No Cry",
+        "Respect",
+        "You Can Get It If You Really Want",
+        "Wooly Bully",
+        "Fireflies"
+    ),
+    artists = arrayOf(
+        "Sia",
+        "Queen (feat. David Bowie)",
+        "Jay-Z & Linkin Park",
+        "The Beach Boys",
+        "Fats Domino",
+        "U96",
+        "Fatboy Slim",
+        "Enrique Iglesias & Whitney Houston",
+        "Peter Schilling",
+        "Black Eyed Peas",
+        "Shaggy",
+        "Tones And I",
+        "Betty Everett",
+        "James Brown & The Famous Flames",
+        "Akon",
+        "Rick James",
+        "Michael Holm",
+        "Percy Sledge",
+        "Linda Ronstadt",
+        "Dolly Parton",
+        "Mad'House",
+        "Dean Martin",
+        "Billy Joel",
+        "Wencke Myhre",
+        "David Bowie",
+        "Justin Bieber",
+        "Alessia Cara",
+        "The Beatles",
+        "Shakira",
+        "Bryan Ferry",
+        "Corinne Bailey Rae",
+        "Vanilla Ice",
+        "Leo Sayer",
+        "Billie Eilish",
+        "Portugal. The Man",
+        "Lady Gaga & Bradley Cooper",
+        "Ich + Ich",
+        "Train",
+        "Elvis Presley",
+        "Eric Prydz",
+        "Marvin Gaye",
+        "Jürgen Drews",
+        "Toploader",
+        "Rupert Holmes",
+        "Imagine Dragons",
+        "Roy Orbison",
+        "The Chordettes",
+        "Bob Marley & The Wailers",
+        "Aretha Franklin",
+        "Jimmy Cliff",
+        "Sam The Sham & The Pharaohs",
+        "Owl City"
+    ),
+    years = intArrayOf(
+        2015, 1981, 2004, 1966, 1955, 1992, 1999, 2000, 1982, 2003, 2000, 2019, 1964, 1965, 2005, 1981,
+        1974, 1966, 1977, 1973, 2002, 1953, 1973, 1970, 1969, 2021, 2016, 1969, 2010, 1976, 2006, 1990,
+        1977, 2019, 2017, 2018, 2007, 2009, 1961, 2004, 1968, 1976, 2000, 1979, 2017, 1964, 1958, 1974,
+        1967, 1970, 1965, 2009
+    ),
+    deezerIds = longArrayOf(
+        118195184L, 12274786L, 676954L, 14176175L, 3092104L, 94877938L,
+        131198242L, 765849122L, 1222024892L, 1697351967L, 2122532L, 739870792L,
+        78309531L, 820316542L, 78869181L, 543150512L, 16267932L, 4209649L,
+        3919443L, 114422238L, 4631883L, 920521062L, 14333215L, 7905433L,
+        107465566L, 1194148902L, 120739016L, 126848569L, 68473089L, 3135015L,
+        3119484L, 2397026L, 12179238L, 655095912L, 371593461L, 561856742L,
+        1278137272L, 563683852L, 551383L, 340051261L, 132196486L, 62238193L,
+        10434104L, 2801132L, 528330501L, 78033230L, 3991861L, 1583148L,
+        904732L, 1106498962L, 1844097487L, 4188437L
+    ),
+    deezerTitles = arrayOf<String?>(
+        "Cheap Thrills",
+        "Under Pressure (Remastered 2011)",
+        "Numb / Encore",
+        "Good Vibrations",
+        "Ain't That A Shame",
+        "Das Boot",
+        "Praise You",
+        "Could I Have This Kiss Forever",
+        "Major Tom (Völlig losgelöst) (Single Version)",
+        "Where Is The Love?",
+        "It Wasn't Me",
+        "Dance Monkey",
+        "It's in His Kiss (The Shoop Shoop Song)",
+        "I Feel That Old Feeling Coming On",
+        "Lonely",
+        "Super Freak",
+        "Tränen lügen nicht",
+        "When a Man Loves a Woman",
+        "Blue Bayou",
+        "Jolene",
+        "Like a Prayer",
+        "That's Amore",
+        "Piano Man",
+        "Er hat ein knallrotes Gummiboot",
+        "Space Oddity (2015 Remaster)",
+        "Anyone",
+        "Scars To Your Beautiful",
+        "Get Back",
+        "Waka Waka (This Time for Africa) (feat. Freshlyground)",
+        "Let's Stick Together",
+        "Put Your Records On",
+        "Ice Ice Baby",
+        "When I Need You",
+        "bad guy",
+        "Feel It Still",
+        "Shallow",
+        "Vom selben Stern (Radio Edit)",
+        "Hey, Soul Sister",
+        "Can't Help Falling In Love",
+        "Call on Me",
+        "I Heard It Through The Grapevine",
+        "Ein Bett im Kornfeld",
+        "Dancing in the Moonlight",
+        "Escape (The Pina Colada Song) (Single Version)",
+        "Thunder",
+        "Oh, Pretty Woman",
+        "Lollipop",
+        "No Woman No Cry",
+        "Respect",
+        "You Can Get It If You Really Want",
+        "Wooly Bully",
+        "Fireflies"
+    ),
+    deezerArtists = arrayOf<String?>(
+        "Sia",
+        "Queen",
+        "JAY Z",
+        "The Beach Boys",
+        "Fats Domino",
+        "U96",
+        "Fatboy Slim",
+        "Enrique Iglesias",
+        "Peter Schilling",
+        "Black Eyed Peas",
+        "Shaggy",
+        "Tones and I",
+        "Betty Everett",
+        "James Brown",
+        "Akon",
+        "Rick James",
+        "Michael Holm",
+        "Percy Sledge",
+        "Linda Ronstadt",
+        "Dolly Parton",
+        "Mad'House",
+        "Dean Martin",
+        "Billy Joel",
+        "Wencke Myhre",
+        "David Bowie",
+        "Justin Bieber",
+        "Alessia Cara",
+        "The Beatles",
+        "Shakira",
+        "Bryan Ferry",
+        "Corinne Bailey Rae",
+        "Vanilla Ice",
+        "Leo Sayer",
+        "Billie Eilish",
+        "Portugal. The Man",
+        "Lady Gaga",
+        "Ich + Ich",
+        "Train",
+        "Elvis Presley",
+        "Eric Prydz",
+        "Marvin Gaye",
+        "Jürgen Drews",
+        "Toploader",
+        "Rupert Holmes",
+        "Imagine Dragons",
+        "Roy Orbison",
+        "The Chordettes",
+        "Bob Marley & The Wailers",
+        "Aretha Franklin",
+        "Jimmy Cliff",
+        "Sam the Sham & The Pharaohs",
+        "Owl City"
+    ),
+    deezerAlbums = arrayOf<String?>(
+        "This Is Acting",
+        "Hot Space (Deluxe Edition 2011 Remaster)",
+        "Collision Course",
+        "The Smile Sessions",
+        "Essential",
+        "Das Boot",
+        "You've Come a Long Way Baby",
+        "Greatest Hits",
+        "Major Tom (Völlig losgelöst) (All Versions)",
+        "Elephunk",
+        "The Boombastic Collection - Best Of Shaggy (International Version)",
+        "The Kids Are Coming",
+        "Chicago Hit Factory - The Vee-Jay Story 1953-1966",
+        "You Got the Power",
+        "Trouble",
+        "Street Songs (Expanded Edition)",
+        "Seine grossen Erfolge",
+        "When a Man Loves a Woman / Love Me Like You Mean It",
+        "Simple Dreams",
+        "Jolene",
+        "Absolutely Mad",
+        "The Legendary Crooners - Dean Martin",
+        "Piano Man (Legacy Edition)",
+        "Glanzlichter",
+        "David Bowie (aka Space Oddity) (2015 Remaster)",
+        "Anyone",
+        "Know-It-All (Deluxe)",
+        "Love",
+        "Party Hits: Summer Edition",
+        "Let's Stick Together",
+        "Corinne Bailey Rae",
+        "Vanilla Ice Is Back! - Hip Hop Classics",
+        "The Show Must Go On: The Very Best Of Leo Sayer",
+        "WHEN WE ALL FALL ASLEEP, WHERE DO WE GO?",
+        "Woodstock",
+        "A Star Is Born Soundtrack",
+        "Vom selben Stern (Exklusive Version)",
+        "Save Me, San Francisco (Golden Gate Edition)",
+        "Elvis At The Movies",
+        "Call On Me (Remixes)",
+        "Bridget Jones’s Baby (Original Motion Picture Soundtrack)",
+        "Musik Box - Teil 1",
+        "Dancing In The Moonlight: The Best Of Toploader",
+        "Escape...The Best Of",
+        "Evolve",
+        "Oh, Pretty Woman",
+        "Mister  Sand Man",
+        "Natty Dread",
+        "I Never Loved a Man the Way I Love You",
+        "The Harder They Come (Original Motion Picture Soundtrack)",
+        "The MGM Singles",
+        "Ocean Eyes"
+    )
+)
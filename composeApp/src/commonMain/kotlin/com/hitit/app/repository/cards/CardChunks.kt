@@ -0,0 +1,82 @@
+// Generated by scripts/generate_full_repository.py. Do not edit.
+package com.hitit.app.repository.cards
+
+import com.hitit.app.model.HitsterCard
+
+/**
+ * Index over 308 generated cards in chunks of up to 256.
+ * A chunk's arrays are built the first time one of its cards is looked up.
+ */
+internal object CardChunks {
+    const val CARD_COUNT = 308
+
+    // First id of every chunk, in compareIds() order
+    private val firstIds: Array<String> = arrayOf(
+        "00001", "00257"
+    )
+
+    fun find(hitsterId: String): HitsterCard? {
+        // Last chunk starting at or before the id
+        var low = 0
+        var high = firstIds.size - 1
+        var found = -1
+        while (low <= high) {
+            val middle = (low + high) ushr 1
+            if (compareIds(firstIds[middle], hitsterId) <= 0) {
+                found = middle
+                low = middle + 1
+            } else {
+                high = middle - 1
+            }
+        }
+        return if (found < 0) null else chunk(found).find(hitsterId)
+    }
+
+    private fun chunk(index: Int): CardChunk = when (index) {
+        0 -> CardChunk000
+        1 -> CardChunk001
+        else -> throw IndexOutOfBoundsException("No card chunk $index")
+    }
+}
+
+/** Numeric order for zero-padded ids: shorter ids first, then lexicographic. */
+internal fun compareIds(a: String, b: String): Int =
+    if (a.length != b.length) a.length - b.length else a.compareTo(b)
+
+/** Cards of one chunk as parallel arrays sorted by id. */
+internal abstract class CardChunk(
+    private val ids: Array<String>,
+    private val titles: Array<String>,
+    private val artists: Array<String>,
+    private val years: IntArray,
+    private val deezerIds: LongArray,
+    private val deezerTitles: Array<String?>,
+    private val deezerArtists: Array<String?>,
+    private val deezerAlbums: Array<String?>
+) {
+    fun find(hitsterId: String): HitsterCard? {
+        var low = 0
+        var high = ids.size - 1
+        while (low <= high) {
+            val middle = (low + high) ushr 1
+            val order = compareIds(ids[middle], hitsterId)
+            when {
+                order < 0 -> low = middle + 1
+                order > 0 -> high = middle - 1
+                else -> return card(middle)
+            }
+        }
+        return null
+    }
+
+    private fun card(index: Int) = HitsterCard(
+        hitsterId = ids[index],
+        title = titles[index],
+        artist = artists[index],
+        year = years[index],
+        deezerId = deezerIds[index].takeIf { it != 0L },
+        deezerTitle = deezerTitles[index],
+        deezerArtist = deezerArtists[index],
+        deezerAlbum = deezerAlbums[index]
+    )
+}
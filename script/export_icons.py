@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Export every app icon variant at every iOS and Android size.
+
+Variants:
+    ios        the squircle design from generate_ios_icon.py
+    neon       the neon speaker design from iosApp/script/create_icon.py
+    android    the adaptive launcher icon (the mipmap-anydpi-v26 layers)
+    v1 .. v40  the adaptive icon with ic_launcher_foreground_vN in front
+
+Each variant gets an AppIcon.appiconset with every iPhone, iPad and App
+Store size plus its Contents.json, and legacy mipmap-<density> launcher
+PNGs (square and round) for devices below API 26. Each variant is rendered
+once per shape at its largest size and scaled down, in a process pool.
+An output is skipped when the hash of its parameters, its source files
+and RENDERER_VERSION matches the last export, and files are only rewritten
+when their bytes change.
+
+    python script/export_icons.py                        # every variant into tmp/icons/
+    python script/export_icons.py --variant android --variant v12
+    python script/export_icons.py --install              # the app's own icons in place
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "iosApp" / "script"))
+
+import vector_drawable  # noqa: E402
+
+
+# Bump when a change here alters the rendered pixels
+RENDERER_VERSION = 1
+
+RES = REPO / "composeApp" / "src" / "androidMain" / "res"
+APP_ICON_SET = REPO / "iosApp" / "iosApp" / "Assets.xcassets" / "AppIcon.appiconset"
+DEFAULT_OUT = REPO / "tmp" / "icons"
+DEFAULT_CACHE = REPO / "tmp" / "icon-cache.json"
+
+# (idiom, size in points, scale) for a full AppIcon.appiconset
+IOS_ICONS = [
+    ("iphone", 20, 2), ("iphone", 20, 3),
+    ("iphone", 29, 2), ("iphone", 29, 3),
+    ("iphone", 40, 2), ("iphone", 40, 3),
+    ("iphone", 60, 2), ("iphone", 60, 3),
+    ("ipad", 20, 1), ("ipad", 20, 2),
+    ("ipad", 29, 1), ("ipad", 29, 2),
+    ("ipad", 40, 1), ("ipad", 40, 2),
+    ("ipad", 76, 1), ("ipad", 76, 2),
+    ("ipad", 83.5, 2),
+    ("ios-marketing", 1024, 1),
+]
+
+# Legacy launcher icons are 48dp
+LAUNCHER_DP = 48
+ANDROID_DENSITIES = {"mdpi": 1, "hdpi": 1.5, "xhdpi": 2, "xxhdpi": 3, "xxxhdpi": 4}
+LAUNCHER_FILES = {"square": "ic_launcher.png", "round": "ic_launcher_round.png"}
+# Adaptive icon layers are 108dp, of which the middle 72dp is visible
+ADAPTIVE_VISIBLE = 72 / 108
+
+_FOREGROUND_VARIANT = re.compile(r"ic_launcher_foreground_(v\d+)\.xml$")
+
+
+def ios_pixels(points: float, scale: int) -> int:
+    return round(points * scale)
+
+
+def ios_contents() -> dict:
+    """Contents.json for an app icon set of IOS_ICONS, one file per pixel size."""
+    images = [{
+        "filename": f"icon_{ios_pixels(points, scale)}.png",
+        "idiom": idiom,
+        "scale": f"{scale}x",
+        "size": f"{points:g}x{points:g}",
+    } for idiom, points, scale in IOS_ICONS]
+    return {"images": images, "info": {"author": "xcode", "version": 1}}
+
+
+def adaptive_layers(name: str) -> tuple[Path, Path]:
+    """(background, foreground) drawables of a mipmap-anydpi-v26 adaptive icon."""
+    root = ET.parse(RES / "mipmap-anydpi-v26" / f"{name}.xml").getroot()
+    layers = []
+    for tag in ("background", "foreground"):
+        reference = root.find(tag).get(vector_drawable.ANDROID + "drawable")
+        layers.append(RES / "drawable" / (reference.split("/", 1)[1] + ".xml"))
+    return layers[0], layers[1]
+
+
+def variant_sources() -> dict[str, list[Path]]:
+    """Every variant and the files its pixels depend on."""
+
+    script = REPO / "script"
+    variants = {
+        "ios": [script / "generate_ios_icon.py", script / "icon_render.py"],
+        "neon": [REPO / "iosApp" / "script" / "create_icon.py", script / "icon_render.py"],
+    }
+
+    launchers = [RES / "mipmap-anydpi-v26" / "ic_launcher.xml", RES / "mipmap-anydpi-v26" / "ic_launcher_round.xml"]
+    backgrounds = sorted({adaptive_layers(name)[0] for name in ("ic_launcher", "ic_launcher_round")})
+    renderer = script / "vector_drawable.py"
+    variants["android"] = launchers + backgrounds + [adaptive_layers("ic_launcher")[1], renderer]
+
+    foregrounds = []
+    for path in (RES / "drawable").glob("ic_launcher_foreground_v*.xml"):
+        match = _FOREGROUND_VARIANT.search(path.name)
+        if match:
+            foregrounds.append((int(match.group(1)[1:]), match.group(1), path))
+    for _, name, path in sorted(foregrounds):
+        variants[name] = launchers + backgrounds + [path, renderer]
+    return variants
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def job_key(job: dict, digests: dict[Path, str], sources: list[Path]) -> str:
+    """Hash of everything an output depends on."""
+    payload = {
+        "renderer": RENDERER_VERSION,
+        "job": {k: v for k, v in job.items() if k != "output"},
+        "sources": [digests[path] for path in sources],
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Write `data` unless the file already holds exactly that. Returns whether it was written."""
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+# --- Rendering (runs in the worker processes) ---
+
+@lru_cache(maxsize=None)
+def _drawable(path: str):
+    return vector_drawable.load(path)
+
+
+@lru_cache(maxsize=8)
+def _layer(path: str, size: int) -> Image.Image:
+    # Fewer samples for big renders, where the edges are a smaller share of the pixels
+    supersample = 2 if size >= 1024 else vector_drawable.DEFAULT_SUPERSAMPLE
+    return vector_drawable.render(_drawable(path), size, supersample=supersample)
+
+
+def _round_mask(image: Image.Image) -> Image.Image:
+    """Cut the image to an anti-aliased circle."""
+    ss = 4
+    mask = Image.new("L", (image.width * ss, image.height * ss), 0)
+    ImageDraw.Draw(mask).ellipse((0, 0, mask.width - 1, mask.height - 1), fill=255)
+    mask = mask.reduce(ss)
+    alpha = Image.new("L", image.size, 0)
+    alpha.paste(image.getchannel("A"), mask=mask)
+    image.putalpha(alpha)
+    return image
+
+
+def _render_adaptive(variant: str, size: int, shape: str) -> Image.Image:
+    background, foreground = adaptive_layers("ic_launcher_round" if shape == "round" else "ic_launcher")
+    if variant != "android":
+        foreground = RES / "drawable" / f"ic_launcher_foreground_{variant}.xml"
+
+    full = round(size / ADAPTIVE_VISIBLE)
+    # Every variant shares the background, so it is rendered once per worker and size
+    image = _layer(str(background), full).copy()
+    image.alpha_composite(_layer(str(foreground), full))
+    offset = (full - size) // 2
+    return image.crop((offset, offset, offset + size, offset + size))
+
+
+def render_master(variant: str, size: int, shape: str) -> Image.Image:
+    """One variant as a size x size RGBA image; `shape` picks the adaptive layers, not the mask."""
+
+    if variant == "ios":
+        import generate_ios_icon
+        return generate_ios_icon.create_icon(size).convert("RGBA")
+    if variant == "neon":
+        import create_icon
+        return create_icon.create_dukestar_icon(size).convert("RGBA")
+    return _render_adaptive(variant, size, shape)
+
+
+def run_task(task: dict) -> list[tuple[str, bool]]:
+    """Render one master image and write every output scaled from it.
+
+    Returns (path, whether the file changed) per output.
+    """
+    master = render_master(task["variant"], task["master"], task["shape"])
+
+    results = []
+    for job in task["jobs"]:
+        size = job["size"]
+        image = master if size == master.width else master.resize((size, size), Image.LANCZOS, reducing_gap=3.0)
+        if job["shape"] == "round":
+            image = _round_mask(image.copy())
+        if job["platform"] == "ios":
+            # The App Store rejects icons with an alpha channel
+            image = image.convert("RGB")
+        buffer = io.BytesIO()
+        image.save(buffer, "PNG", optimize=True)
+        results.append((job["output"], write_if_changed(Path(job["output"]), buffer.getvalue())))
+    return results
+
+
+# --- Planning ---
+
+def plan_jobs(variant: str, ios_dir: Path | None, res_dir: Path | None) -> list[dict]:
+    """Every output of one variant. Outputs of the same shape share a master at their largest size."""
+
+    jobs = []
+    if ios_dir is not None:
+        for pixels in sorted({ios_pixels(points, scale) for _, points, scale in IOS_ICONS}):
+            jobs.append({"variant": variant, "platform": "ios", "size": pixels, "shape": "square",
+                         "output": str(ios_dir / f"icon_{pixels}.png")})
+    if res_dir is not None:
+        for density, factor in ANDROID_DENSITIES.items():
+            for shape, filename in LAUNCHER_FILES.items():
+                jobs.append({"variant": variant, "platform": "android", "size": round(LAUNCHER_DP * factor),
+                             "shape": shape, "output": str(res_dir / f"mipmap-{density}" / filename)})
+
+    masters = {}
+    for job in jobs:
+        masters[job["shape"]] = max(masters.get(job["shape"], 0), job["size"])
+    for job in jobs:
+        job["master"] = masters[job["shape"]]
+    return jobs
+
+
+def group_tasks(jobs: list[dict]) -> list[dict]:
+    """Pending outputs grouped by the master they are scaled from, largest master first."""
+    tasks: dict[tuple, dict] = {}
+    for job in jobs:
+        key = (job["variant"], job["shape"], job["master"])
+        task = tasks.setdefault(key, {"variant": job["variant"], "shape": job["shape"],
+                                      "master": job["master"], "jobs": []})
+        task["jobs"].append(job)
+    return sorted(tasks.values(), key=lambda task: task["master"], reverse=True)
+
+
+def load_cache(path: Path) -> dict[str, str]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render every icon variant at every iOS and Android size.")
+    parser.add_argument("--variant", action="append", metavar="NAME",
+                        help="Variant to export, repeatable: ios, neon, android, v1..v40 (default: all)")
+    parser.add_argument("-o", "--out", type=Path, default=DEFAULT_OUT,
+                        help=f"Directory for the per-variant icon sets (default: {DEFAULT_OUT.relative_to(REPO)})")
+    parser.add_argument("--install", action="store_true",
+                        help="Write the app's own icons instead: the iOS asset catalog and the Android mipmaps")
+    parser.add_argument("--ios-variant", default="ios", help="Variant installed for iOS (default: ios)")
+    parser.add_argument("--android-variant", default="android", help="Variant installed for Android (default: android)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(),
+                        help="Worker processes (default: one per core)")
+    parser.add_argument("--cache", type=Path, default=DEFAULT_CACHE,
+                        help=f"Hashes of the last export (default: {DEFAULT_CACHE.relative_to(REPO)})")
+    parser.add_argument("--force", action="store_true", help="Render everything, ignoring the cache")
+    args = parser.parse_args()
+
+    sources = variant_sources()
+    if args.install:
+        targets = [(args.ios_variant, APP_ICON_SET, None), (args.android_variant, None, RES)]
+    else:
+        names = args.variant or list(sources)
+        targets = [(name, args.out / name / "AppIcon.appiconset", args.out / name / "res") for name in names]
+
+    unknown = sorted({name for name, _, _ in targets} - sources.keys())
+    if unknown:
+        raise SystemExit(f"Unknown variant(s): {', '.join(unknown)} (available: {', '.join(sources)})")
+
+    start = time.perf_counter()
+    digests = {path: file_digest(path) for paths in sources.values() for path in paths}
+    cache = {} if args.force else load_cache(args.cache)
+    new_cache = dict(cache)
+
+    pending = []
+    planned = 0
+    contents = json.dumps(ios_contents(), indent=2, separators=(",", " : ")) + "\n"
+    contents_written = 0
+    for name, ios_dir, res_dir in targets:
+        if ios_dir is not None:
+            contents_written += write_if_changed(ios_dir / "Contents.json", contents.encode())
+        for job in plan_jobs(name, ios_dir, res_dir):
+            planned += 1
+            key = job_key(job, digests, sources[name])
+            new_cache[job["output"]] = key
+            if cache.get(job["output"]) != key or not Path(job["output"]).exists():
+                pending.append(job)
+
+    tasks = group_tasks(pending)
+    print(f"{len(pending)} icons to render from {len(tasks)} masters, {planned - len(pending)} unchanged")
+
+    changed = 0
+    if tasks:
+        # Largest masters are submitted first, so the pool is not left waiting on one big render
+        with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(tasks)))) as executor:
+            for results in executor.map(run_task, tasks):
+                changed += sum(written for _, written in results)
+
+    args.cache.parent.mkdir(parents=True, exist_ok=True)
+    args.cache.write_text(json.dumps(new_cache, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    print(f"Rendered {len(pending)} icons ({changed} files changed, {contents_written} Contents.json written)"
+          f" in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
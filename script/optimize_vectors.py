@@ -0,0 +1,675 @@
+#!/usr/bin/env python3
+"""
+Shrink the app's VectorDrawables without changing how they look.
+
+For each drawable:
+  - path data is rewritten with coordinates rounded to --precision decimals,
+    every command in the shorter of its absolute and relative form, the
+    H, V, S and T shorthands, implicit command repeats and no separators
+    that a sign already provides; repeated moves, zero-length lines and,
+    on unstroked paths, lines back to the start right before a close are
+    dropped
+  - invisible paint is dropped: transparent or zero-alpha fills and
+    strokes, stroke attributes without a stroke, and paths that are left
+    with no paint or lie outside the viewport
+  - groups without a transform are unwrapped, empty groups dropped and
+    adjacent groups with the same transform merged
+  - a fill followed by a stroke of the same outline becomes one path, and
+    adjacent paths with the same paint are merged unless they come close
+    enough for their overlap to change the fill or the blending
+  - comments and attributes set to their default value are dropped
+
+Every result is rendered next to the original with vector_drawable.py and
+only written when no channel of any pixel differs by more than
+--tolerance. Files that are not <vector> drawables, like the SVG wordmark
+in composeResources, are reported and left alone. The files are processed
+in a process pool.
+
+    python script/optimize_vectors.py                       # report only
+    python script/optimize_vectors.py --write               # rewrite the drawables in place
+    python script/optimize_vectors.py ic_logo.xml -o tmp/vectors --precision 1
+"""
+
+import argparse
+import io
+import math
+import os
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+import vector_drawable
+from vector_drawable import AAPT, ANDROID, IDENTITY, flatten_path, group_matrix, multiply, parse_color, path_commands
+
+REPO = Path(__file__).resolve().parents[1]
+DEFAULT_DIRS = [
+    REPO / "composeApp" / "src" / "androidMain" / "res" / "drawable",
+    REPO / "composeApp" / "src" / "commonMain" / "composeResources" / "drawable",
+]
+
+DEFAULT_PRECISION = 2
+# The pixel check renders at the adaptive icon's xxhdpi size
+DEFAULT_CHECK_SIZE = 324
+DEFAULT_TOLERANCE = 2
+
+# Viewport units kept between paths that are merged, so not even their anti-aliased edges meet
+MERGE_MARGIN = 0.5
+
+# Values Android uses for a missing attribute
+PATH_DEFAULTS = {
+    "fillAlpha": 1.0, "strokeAlpha": 1.0, "strokeMiterLimit": 4.0,
+    "trimPathStart": 0.0, "trimPathEnd": 1.0, "trimPathOffset": 0.0,
+    "fillType": "nonZero", "strokeLineCap": "butt", "strokeLineJoin": "miter",
+}
+GROUP_DEFAULTS = {"rotation": 0.0, "scaleX": 1.0, "scaleY": 1.0, "translateX": 0.0, "translateY": 0.0,
+                  "pivotX": 0.0, "pivotY": 0.0}
+FILL_ATTRIBUTES = ("fillColor", "fillAlpha", "fillType")
+STROKE_ATTRIBUTES = ("strokeColor", "strokeWidth", "strokeAlpha", "strokeLineCap", "strokeLineJoin",
+                     "strokeMiterLimit")
+TRIM_ATTRIBUTES = ("trimPathStart", "trimPathEnd", "trimPathOffset")
+
+PREFIXES = (("android", ANDROID), ("aapt", AAPT))
+
+
+def _number(value: str | None) -> float | None:
+    """A literal number, or None for a missing value or a resource reference."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# --- Path data ---
+
+def format_number(value: float, precision: int) -> str:
+    """The shortest spelling of `value` rounded to `precision` decimals: 0.50 -> .5, -0 -> 0."""
+    text = f"{value:.{precision}f}"
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    if text == "-0":
+        return "0"
+    if text.startswith("0."):
+        return text[1:]
+    if text.startswith("-0."):
+        return "-" + text[2:]
+    return text
+
+
+def parse_segments(data: str, precision: int) -> list[tuple[str, list[float]]]:
+    """Path data as absolute M, L, C, Q, A and Z segments, rounded to `precision` decimals.
+
+    H and V become L, S and T become C and Q with their control point
+    spelled out. Coordinates are rounded after making them absolute, so
+    rounding errors do not add up along relative commands.
+    """
+
+    segments = []
+    x = y = start_x = start_y = 0.0
+    control = None  # (segment kind, point) of the last curve, for S and T
+
+    def reflect(kind):
+        if control and control[0] == kind:
+            return 2 * x - control[1][0], 2 * y - control[1][1]
+        return x, y
+
+    for command, args in path_commands(data):
+        upper = command.upper()
+        ox, oy = (x, y) if command.islower() else (0.0, 0.0)
+
+        if upper == "M":
+            x, y = args[0] + ox, args[1] + oy
+            start_x, start_y = x, y
+            segments.append(("M", [x, y]))
+        elif upper == "Z":
+            x, y = start_x, start_y
+            segments.append(("Z", []))
+        elif upper in "LHV":
+            if upper == "L":
+                x, y = args[0] + ox, args[1] + oy
+            elif upper == "H":
+                x = args[0] + ox
+            else:
+                y = args[0] + oy
+            segments.append(("L", [x, y]))
+        elif upper in "CS":
+            c1 = (args[0] + ox, args[1] + oy) if upper == "C" else reflect("C")
+            rest = args[2:] if upper == "C" else args
+            c2, end = (rest[0] + ox, rest[1] + oy), (rest[2] + ox, rest[3] + oy)
+            segments.append(("C", [*c1, *c2, *end]))
+            control = ("C", c2)
+            x, y = end
+            continue
+        elif upper in "QT":
+            c = (args[0] + ox, args[1] + oy) if upper == "Q" else reflect("Q")
+            end = (args[2] + ox, args[3] + oy) if upper == "Q" else (args[0] + ox, args[1] + oy)
+            segments.append(("Q", [*c, *end]))
+            control = ("Q", c)
+            x, y = end
+            continue
+        elif upper == "A":
+            x, y = args[5] + ox, args[6] + oy
+            segments.append(("A", [*args[:5], x, y]))
+        control = None
+
+    return [(command, [round(v, precision) for v in values]) for command, values in segments]
+
+
+def _end(segment, start):
+    command, values = segment
+    return start if command == "Z" else tuple(values[-2:])
+
+
+def simplify(segments: list[tuple[str, list[float]]], stroked: bool = False) -> list[tuple[str, list[float]]]:
+    """Drop segments that draw nothing.
+
+    A line back to the start right before a close is kept on `stroked`
+    paths, where leaving it to the close can change how the corner at the
+    start is joined.
+    """
+
+    result = []
+    start = current = (0.0, 0.0)
+    for segment in segments:
+        command, values = segment
+        previous = result[-1][0] if result else None
+        if command == "M":
+            # Only the last of several moves in a row starts anything
+            if previous == "M":
+                result.pop()
+            start = current = tuple(values)
+        elif command == "L" and tuple(values) == current and previous not in (None, "M", "Z"):
+            # A lone zero-length line still draws a dot with round caps, one between other segments does not
+            continue
+        elif command == "Z":
+            if previous == "Z":
+                continue
+            # The close draws the same line back to the start
+            if not stroked and previous == "L" and tuple(result[-1][1]) == start and result[-2][0] != "M":
+                result.pop()
+            current = start
+        else:
+            current = _end(segment, start)
+        result.append(segment)
+
+    while result and result[-1][0] == "M":
+        result.pop()
+    return result
+
+
+def serialize(segments: list[tuple[str, list[float]]], precision: int) -> str:
+    """Path data for absolute segments, each command in its shortest form."""
+
+    pieces = []
+    letter = None  # the last command letter written out
+    start = current = (0.0, 0.0)
+    control = None
+
+    def spell(command: str, numbers: list[float]) -> str:
+        texts = [format_number(v, precision) for v in numbers]
+        body = texts[0] if texts else ""
+        for text in texts[1:]:
+            body += text if text.startswith("-") else " " + text
+        # Numbers after a move are lines; otherwise a command repeats itself
+        repeated = {"M": "L", "m": "l"}.get(letter, letter)
+        if texts and command == repeated:
+            return body if body.startswith("-") else " " + body
+        return command + body
+
+    def relative(values):
+        return [round(v - current[i % 2], precision) for i, v in enumerate(values)]
+
+    def reflects(kind, point):
+        expected = current
+        if control and control[0] == kind:
+            expected = (round(2 * current[0] - control[1][0], precision),
+                        round(2 * current[1] - control[1][1], precision))
+        return tuple(point) == expected
+
+    for command, values in segments:
+        if command == "M":
+            candidates = [("M", values)] if not pieces else [("M", values), ("m", relative(values))]
+        elif command == "Z":
+            candidates = [("Z", [])]
+        elif command == "L":
+            if values[1] == current[1]:
+                candidates = [("H", values[:1]), ("h", relative(values)[:1])]
+            elif values[0] == current[0]:
+                candidates = [("V", values[1:]), ("v", relative(values)[1:])]
+            else:
+                candidates = [("L", values), ("l", relative(values))]
+        elif command == "C":
+            if reflects("C", values[:2]):
+                candidates = [("S", values[2:]), ("s", relative(values[2:]))]
+            else:
+                candidates = [("C", values), ("c", relative(values))]
+        elif command == "Q":
+            if reflects("Q", values[:2]):
+                candidates = [("T", values[2:]), ("t", relative(values[2:]))]
+            else:
+                candidates = [("Q", values), ("q", relative(values))]
+        else:
+            candidates = [("A", values), ("a", values[:5] + relative(values[5:]))]
+
+        spelled = [(spell(c, numbers), c) for c, numbers in candidates]
+        piece, chosen = min(spelled, key=lambda item: len(item[0]))
+        if piece[:1].isalpha():
+            letter = chosen
+        pieces.append(piece)
+
+        if command == "M":
+            start = current = tuple(values)
+        elif command == "Z":
+            current = start
+        else:
+            current = tuple(values[-2:])
+        control = (command, tuple(values[-4:-2])) if command in "CQ" else None
+
+    return "".join(pieces)
+
+
+def rewrite_path(data: str, precision: int, stroked: bool = False) -> str:
+    return serialize(simplify(parse_segments(data, precision), stroked), precision)
+
+
+def count_commands(data: str) -> int:
+    """Path commands in `data`, counting implicit repeats."""
+    return sum(1 for _ in path_commands(data))
+
+
+# --- Elements ---
+
+def short_color(value: str) -> str:
+    """#AARRGGBB without an opaque alpha, and #RGB where the digits allow."""
+    if not value.startswith("#"):
+        return value
+    try:
+        r, g, b, a = parse_color(value)
+    except ValueError:
+        return value
+    channels = (r, g, b) if a == 255 else (a, r, g, b)
+    digits = "".join(f"{c:02X}" for c in channels)
+    if all(c % 17 == 0 for c in channels):
+        digits = digits[::2]
+    return "#" + digits
+
+
+def _paint_attr(path: ET.Element, kind: str) -> ET.Element | None:
+    """The <aapt:attr> holding a gradient for the path's fill or stroke color."""
+    for child in path:
+        if child.tag == AAPT + "attr" and child.get("name") == f"android:{kind}Color":
+            return child
+    return None
+
+
+def _has_paint(path: ET.Element, kind: str) -> bool:
+    """Whether the path's "fill" or "stroke" can put anything on screen."""
+    if _paint_attr(path, kind) is None:
+        color = path.get(ANDROID + kind + "Color")
+        if color is None:
+            return False
+        if color.startswith("#") and parse_color(color)[3] == 0:
+            return False
+    alpha = _number(path.get(ANDROID + kind + "Alpha"))
+    return alpha is None or alpha > 0
+
+
+def _stroked(path: ET.Element) -> bool:
+    return ANDROID + "strokeColor" in path.attrib or _paint_attr(path, "stroke") is not None
+
+
+def _drop_defaults(element: ET.Element, defaults: dict):
+    for name, default in defaults.items():
+        value = element.get(ANDROID + name)
+        if value is None:
+            continue
+        if value == default or (not isinstance(default, str) and _number(value) == default):
+            del element.attrib[ANDROID + name]
+
+
+def clean_path(path: ET.Element, precision: int) -> bool:
+    """Drop the path's invisible paint and rewrite its data. False if nothing is left to draw."""
+
+    data = path.get(ANDROID + "pathData")
+    if not data or not data.strip():
+        return False
+
+    painted = False
+    for kind, attributes in (("fill", FILL_ATTRIBUTES), ("stroke", STROKE_ATTRIBUTES)):
+        if _has_paint(path, kind):
+            painted = True
+            continue
+        for name in attributes:
+            path.attrib.pop(ANDROID + name, None)
+        gradient = _paint_attr(path, kind)
+        if gradient is not None:
+            path.remove(gradient)
+    if not painted:
+        return False
+
+    _drop_defaults(path, PATH_DEFAULTS)
+    for name in ("fillColor", "strokeColor"):
+        if ANDROID + name in path.attrib:
+            path.set(ANDROID + name, short_color(path.get(ANDROID + name)))
+    for stop in path.iter("item"):
+        if ANDROID + "color" in stop.attrib:
+            stop.set(ANDROID + "color", short_color(stop.get(ANDROID + "color")))
+    # A string resource is left alone
+    if not data.startswith("@"):
+        path.set(ANDROID + "pathData", rewrite_path(data, precision, _stroked(path)))
+    return True
+
+
+def clean_group(group: ET.Element):
+    _drop_defaults(group, GROUP_DEFAULTS)
+    # The pivot only matters for rotating and scaling
+    if not any(ANDROID + name in group.attrib for name in ("rotation", "scaleX", "scaleY")):
+        group.attrib.pop(ANDROID + "pivotX", None)
+        group.attrib.pop(ANDROID + "pivotY", None)
+
+
+def _pinned(element: ET.Element) -> bool:
+    """Named elements can be animated, and trimmed paths depend on their length."""
+    return ANDROID + "name" in element.attrib or any(ANDROID + name in element.attrib for name in TRIM_ATTRIBUTES)
+
+
+def _has_clip(group: ET.Element) -> bool:
+    return any(child.tag == "clip-path" for child in group)
+
+
+def path_bounds(path: ET.Element, matrix=IDENTITY) -> tuple[float, float, float, float] | None:
+    """Bounding box of everything the path draws, or None if it cannot be told."""
+
+    data = path.get(ANDROID + "pathData")
+    if data.startswith("@"):
+        return None
+    points = [point for subpath, _ in flatten_path(data, matrix) for point in subpath]
+    if not points:
+        return None
+
+    pad = 0.0
+    if _stroked(path):
+        width = _number(path.get(ANDROID + "strokeWidth", "0"))
+        if width is None:
+            return None
+        # Miter joins reach out up to the miter limit, square caps to the corner of their square
+        reach = 1.0
+        if path.get(ANDROID + "strokeLineJoin", "miter") == "miter":
+            reach = _number(path.get(ANDROID + "strokeMiterLimit", "4")) or 4.0
+        if path.get(ANDROID + "strokeLineCap") == "square":
+            reach = max(reach, math.sqrt(2))
+        scale = math.sqrt(abs(matrix[0] * matrix[3] - matrix[1] * matrix[2]))
+        pad = width * scale / 2 * reach
+
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    return min(xs) - pad, min(ys) - pad, max(xs) + pad, max(ys) + pad
+
+
+def _overlap(a, b, margin: float = 0.0) -> bool:
+    return a[0] - margin < b[2] and b[0] - margin < a[2] and a[1] - margin < b[3] and b[1] - margin < a[3]
+
+
+def _merge_fill_and_stroke(fill: ET.Element, stroke: ET.Element) -> bool:
+    """Fold a stroke-only path into the fill-only path before it if they share the outline.
+
+    Android draws a path's fill before its stroke, the same order as two paths.
+    """
+    if _pinned(fill) or _pinned(stroke) or fill.get(ANDROID + "pathData") != stroke.get(ANDROID + "pathData"):
+        return False
+    if any(ANDROID + name in fill.attrib for name in STROKE_ATTRIBUTES) or _paint_attr(fill, "stroke") is not None:
+        return False
+    if any(ANDROID + name in stroke.attrib for name in FILL_ATTRIBUTES) or _paint_attr(stroke, "fill") is not None:
+        return False
+    fill.attrib.update(stroke.attrib)
+    fill.extend(list(stroke))
+    return True
+
+
+def merge_paths(children: list[ET.Element], precision: int) -> list[ET.Element]:
+    """Merge adjacent paths that draw the same as one path."""
+
+    merged = []
+    runs: dict[int, list] = {}  # bounds of the paths merged into each kept path, by id()
+    for child in children:
+        previous = merged[-1] if merged else None
+        if child.tag != "path" or previous is None or previous.tag != "path":
+            merged.append(child)
+            continue
+        if _merge_fill_and_stroke(previous, child):
+            runs.pop(id(previous), None)
+            continue
+
+        # Same paint: the outlines must keep clear of each other, or the
+        # overlap would be filled by winding or blended once instead of twice
+        paint = {key: value for key, value in previous.attrib.items() if key != ANDROID + "pathData"}
+        same = paint == {key: value for key, value in child.attrib.items() if key != ANDROID + "pathData"}
+        if same and not (_pinned(previous) or len(previous) or len(child)):
+            run = runs.get(id(previous)) or [path_bounds(previous)]
+            bounds = path_bounds(child)
+            if bounds is not None and None not in run and not any(_overlap(bounds, b, MERGE_MARGIN) for b in run):
+                data = previous.get(ANDROID + "pathData") + child.get(ANDROID + "pathData")
+                previous.set(ANDROID + "pathData", rewrite_path(data, precision, _stroked(previous)))
+                runs[id(previous)] = run + [bounds]
+                continue
+        merged.append(child)
+    return merged
+
+
+def merge_groups(children: list[ET.Element], precision: int) -> list[ET.Element]:
+    """Merge adjacent groups with the same transform."""
+
+    merged = []
+    for child in children:
+        previous = merged[-1] if merged else None
+        if (child.tag == "group" and previous is not None and previous.tag == "group"
+                and child.attrib == previous.attrib and not _pinned(child)
+                and not _has_clip(child) and not _has_clip(previous)):
+            previous[:] = merge_paths(list(previous) + list(child), precision)
+            continue
+        merged.append(child)
+    return merged
+
+
+def optimize_children(parent: ET.Element, matrix, viewport, precision: int):
+    """Clean, drop, unwrap and merge the elements under `parent`, depth first."""
+
+    children = []
+    for child in parent:
+        if child.tag == "group":
+            clean_group(child)
+            optimize_children(child, multiply(matrix, group_matrix(child)), viewport, precision)
+            if not len(child) and not _pinned(child):
+                continue
+            if not child.attrib and not _has_clip(child):
+                children.extend(child)
+                continue
+        elif child.tag == "path":
+            if not clean_path(child, precision):
+                continue
+            bounds = path_bounds(child, matrix)
+            if bounds is not None and not _overlap(bounds, viewport):
+                continue
+        # Clip paths and anything unknown stay as they are
+        children.append(child)
+
+    parent[:] = merge_paths(merge_groups(children, precision), precision)
+
+
+def optimize(root: ET.Element, precision: int):
+    """Optimize a parsed <vector> in place."""
+    viewport = (0.0, 0.0, float(root.get(ANDROID + "viewportWidth")), float(root.get(ANDROID + "viewportHeight")))
+    optimize_children(root, IDENTITY, viewport, precision)
+
+
+# --- XML output ---
+
+def _qualified(name: str) -> str:
+    for prefix, uri in PREFIXES:
+        if name.startswith(uri):
+            return f"{prefix}:{name[len(uri):]}"
+    return name
+
+
+def _write_element(element: ET.Element, depth: int, lines: list[str], namespaces: list[tuple[str, str]]):
+    indent = "    " * depth
+    attributes = [f'xmlns:{prefix}="{uri.strip("{}")}"' for prefix, uri in namespaces]
+    attributes += [f'{_qualified(name)}="{escape(value, {chr(34): "&quot;"})}"'
+                   for name, value in element.attrib.items()]
+    tag = _qualified(element.tag)
+
+    # Like Android Studio: one attribute per line unless there are only a couple
+    if len(attributes) > 2:
+        first = f" {attributes.pop(0)}" if namespaces else ""
+        head = f"{indent}<{tag}{first}\n" + "\n".join(f"{indent}    {a}" for a in attributes)
+    else:
+        head = f"{indent}<{tag}" + "".join(f" {a}" for a in attributes)
+
+    if not len(element):
+        lines.append(head + "/>")
+        return
+    lines.append(head + ">")
+    for child in element:
+        _write_element(child, depth + 1, lines, [])
+    lines.append(f"{indent}</{tag}>")
+
+
+def to_xml(root: ET.Element) -> str:
+    uses_aapt = any(e.tag.startswith(AAPT) or any(k.startswith(AAPT) for k in e.attrib) for e in root.iter())
+    namespaces = [PREFIXES[0]] + ([PREFIXES[1]] if uses_aapt else [])
+    lines = ['<?xml version="1.0" encoding="utf-8"?>']
+    _write_element(root, 0, lines, namespaces)
+    return "\n".join(lines) + "\n"
+
+
+# --- Processing (runs in the worker processes) ---
+
+def _stats(root: ET.Element) -> dict:
+    paths = list(root.iter("path"))
+    return {
+        "paths": len(paths),
+        "groups": sum(1 for _ in root.iter("group")),
+        "commands": sum(count_commands(p.get(ANDROID + "pathData", "")) for p in paths
+                        if not p.get(ANDROID + "pathData", "").startswith("@")),
+    }
+
+
+def _render(source: bytes, size: int) -> np.ndarray:
+    drawable = vector_drawable.load(io.BytesIO(source))
+    height = round(size * drawable.viewport_height / drawable.viewport_width)
+    return np.asarray(vector_drawable.render(drawable, size, height), dtype=np.int16)
+
+
+def process_file(job: dict) -> dict:
+    """Optimize one file and compare the renders. Returns the report, with the new text."""
+
+    path = Path(job["path"])
+    source = path.read_bytes()
+    result = {"path": str(path), "bytes_before": len(source)}
+    try:
+        root = ET.fromstring(source)
+    except ET.ParseError as e:
+        return {**result, "skipped": f"invalid XML ({e})"}
+    if root.tag != "vector":
+        return {**result, "skipped": f"not a <vector> drawable (<{root.tag.rpartition('}')[2]}>)"}
+
+    before = _stats(root)
+    try:
+        optimize(root, job["precision"])
+        text = to_xml(root)
+        after = _stats(root)
+        diff = np.abs(_render(source, job["check_size"]) - _render(text.encode(), job["check_size"]))
+    except ValueError as e:
+        return {**result, "skipped": str(e)}
+
+    return {
+        **result,
+        "bytes_after": len(text.encode()),
+        **{f"{key}_before": value for key, value in before.items()},
+        **{f"{key}_after": value for key, value in after.items()},
+        "max_diff": int(diff.max()),
+        "changed_pixels": int(np.count_nonzero(diff.max(axis=-1))),
+        "text": text,
+    }
+
+
+def find_drawables(paths: list[Path]) -> list[Path]:
+    files = []
+    for path in paths:
+        files.extend(sorted(path.glob("*.xml")) if path.is_dir() else [path])
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shrink VectorDrawables without changing how they render.")
+    parser.add_argument("paths", nargs="*", type=Path,
+                        help="Drawables or directories of them (default: the app's drawable directories)")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--write", action="store_true", help="Rewrite the drawables in place")
+    output.add_argument("-o", "--out", type=Path, help="Write the optimized drawables to this directory")
+    parser.add_argument("--precision", type=int, default=DEFAULT_PRECISION,
+                        help=f"Decimals kept in path data (default: {DEFAULT_PRECISION})")
+    parser.add_argument("--check-size", type=int, default=DEFAULT_CHECK_SIZE,
+                        help=f"Width in pixels of the renders compared (default: {DEFAULT_CHECK_SIZE})")
+    parser.add_argument("--tolerance", type=int, default=DEFAULT_TOLERANCE,
+                        help=f"Largest channel difference accepted, 0-255 (default: {DEFAULT_TOLERANCE})")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(),
+                        help="Worker processes (default: one per core)")
+    args = parser.parse_args()
+
+    files = find_drawables(args.paths or [d for d in DEFAULT_DIRS if d.is_dir()])
+    if not files:
+        raise SystemExit("No drawables found")
+
+    start = time.perf_counter()
+    jobs = [{"path": str(f), "precision": args.precision, "check_size": args.check_size} for f in files]
+    with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(jobs)))) as executor:
+        results = list(executor.map(process_file, jobs))
+
+    width = max(len(Path(r["path"]).name) for r in results)
+    totals = dict.fromkeys(("bytes_before", "bytes_after", "paths_before", "paths_after",
+                            "commands_before", "commands_after"), 0)
+    failed = written = 0
+    for result in results:
+        name = Path(result["path"]).name
+        if "skipped" in result:
+            print(f"{name:<{width}}  skipped: {result['skipped']}")
+            continue
+
+        ok = result["max_diff"] <= args.tolerance
+        saved = result["bytes_before"] - result["bytes_after"]
+        print(f"{name:<{width}}  {result['bytes_before']:>6} -> {result['bytes_after']:>6} bytes "
+              f"({saved / result['bytes_before']:>4.0%} smaller)  "
+              f"paths {result['paths_before']:>3} -> {result['paths_after']:<3}  "
+              f"commands {result['commands_before']:>4} -> {result['commands_after']:<4}  "
+              f"max diff {result['max_diff']}" + ("" if ok else f"  FAILED ({result['changed_pixels']} pixels)"))
+        for key in totals:
+            totals[key] += result[key]
+        if not ok:
+            failed += 1
+            continue
+
+        target = Path(result["path"]) if args.write else args.out / name if args.out else None
+        data = result["text"].encode()
+        if target is not None and (not target.exists() or target.read_bytes() != data):
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(data)
+            written += 1
+
+    optimized = len(results) - sum("skipped" in r for r in results)
+    print(f"{optimized} drawables: {totals['bytes_before']} -> {totals['bytes_after']} bytes "
+          f"({totals['bytes_before'] - totals['bytes_after']} saved), "
+          f"paths {totals['paths_before']} -> {totals['paths_after']}, "
+          f"commands {totals['commands_before']} -> {totals['commands_after']} "
+          f"in {time.perf_counter() - start:.1f}s")
+    if args.write or args.out:
+        print(f"{written} files written")
+    if failed:
+        raise SystemExit(f"{failed} drawables differ by more than {args.tolerance} and were left alone")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Parse and rasterize Android VectorDrawable XML.
+
+Covers what the app's drawables use: nested <group> transforms, path data
+(M L H V C S Q T A Z, absolute and relative), solid and linear gradient
+fills, and strokes with butt or round caps. Curves are flattened to
+polylines, drawn with PIL at a higher resolution and downsampled.
+
+    python vector_drawable.py ic_launcher_foreground.xml -o fg.png --size 432
+"""
+
+import argparse
+import math
+import re
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageChops, ImageDraw
+
+
+ANDROID = "{http://schemas.android.com/apk/res/android}"
+AAPT = "{http://schemas.android.com/aapt}"
+
+DEFAULT_SUPERSAMPLE = 4
+# Line segments per flattened curve, and per full turn of an arc
+CURVE_SEGMENTS = 16
+ARC_SEGMENTS = 96
+# Colors precomputed along a gradient
+GRADIENT_STEPS = 1024
+
+_TOKEN = re.compile(r"[MmLlHhVvCcSsQqTtAaZz]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_ARGUMENTS = {"M": 2, "L": 2, "H": 1, "V": 1, "C": 6, "S": 4, "Q": 4, "T": 2, "A": 7, "Z": 0}
+
+IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+
+def parse_color(value: str) -> tuple[int, int, int, int]:
+    """#RGB, #ARGB, #RRGGBB or #AARRGGBB as (r, g, b, a)."""
+    digits = value.strip().lstrip("#")
+    if len(digits) in (3, 4):
+        digits = "".join(c * 2 for c in digits)
+    if len(digits) == 6:
+        digits = "FF" + digits
+    if len(digits) != 8:
+        raise ValueError(f"unsupported color {value!r}")
+    a, r, g, b = (int(digits[i:i + 2], 16) for i in range(0, 8, 2))
+    return r, g, b, a
+
+
+def multiply(m, n):
+    """The affine matrix applying n first, then m. Matrices are (a, b, c, d, e, f)."""
+    a, b, c, d, e, f = m
+    a2, b2, c2, d2, e2, f2 = n
+    return (a * a2 + c * b2, b * a2 + d * b2,
+            a * c2 + c * d2, b * c2 + d * d2,
+            a * e2 + c * f2 + e, b * e2 + d * f2 + f)
+
+
+def apply(m, x, y):
+    a, b, c, d, e, f = m
+    return a * x + c * y + e, b * x + d * y + f
+
+
+def group_matrix(element: ET.Element):
+    """A <group>'s local transform, composed the way Android's VGroup does."""
+
+    def number(name, default=0.0):
+        return float(element.get(ANDROID + name, default))
+
+    px, py = number("pivotX"), number("pivotY")
+    sx, sy = number("scaleX", 1), number("scaleY", 1)
+    angle = math.radians(number("rotation"))
+    cos, sin = math.cos(angle), math.sin(angle)
+
+    m = (1.0, 0.0, 0.0, 1.0, -px, -py)
+    m = multiply((sx, 0.0, 0.0, sy, 0.0, 0.0), m)
+    m = multiply((cos, sin, -sin, cos, 0.0, 0.0), m)
+    return multiply((1.0, 0.0, 0.0, 1.0, number("translateX") + px, number("translateY") + py), m)
+
+
+def path_commands(data: str):
+    """Path data as (command, [numbers]) pairs, splitting implicit repeats."""
+
+    tokens = _TOKEN.findall(data)
+    i = 0
+    command = None
+    while i < len(tokens):
+        if tokens[i].isalpha():
+            command = tokens[i]
+            i += 1
+        elif command is None:
+            raise ValueError("path data must start with a command")
+        count = _ARGUMENTS[command.upper()]
+        args = [float(t) for t in tokens[i:i + count]]
+        if len(args) < count or any(t.isalpha() for t in tokens[i:i + count]):
+            raise ValueError(f"truncated {command} command in path data")
+        i += count
+        yield command, args
+        if command in "Zz":
+            command = None
+        elif command in "Mm":
+            # Coordinates after a move are implicit line-tos
+            command = "L" if command == "M" else "l"
+
+
+def _arc(x0, y0, rx, ry, rotation, large, sweep, x, y):
+    """Points along an SVG elliptical arc, excluding the start (endpoint to center form)."""
+
+    if rx == 0 or ry == 0 or (x0, y0) == (x, y):
+        return [(x, y)]
+    rx, ry = abs(rx), abs(ry)
+    phi = math.radians(rotation)
+    cos, sin = math.cos(phi), math.sin(phi)
+
+    dx, dy = (x0 - x) / 2, (y0 - y) / 2
+    x1 = cos * dx + sin * dy
+    y1 = -sin * dx + cos * dy
+
+    # Scale up radii too small to reach the end point
+    scale = (x1 * x1) / (rx * rx) + (y1 * y1) / (ry * ry)
+    if scale > 1:
+        rx, ry = rx * math.sqrt(scale), ry * math.sqrt(scale)
+
+    numerator = rx * rx * ry * ry - rx * rx * y1 * y1 - ry * ry * x1 * x1
+    denominator = rx * rx * y1 * y1 + ry * ry * x1 * x1
+    factor = math.sqrt(max(0.0, numerator / denominator))
+    if large == sweep:
+        factor = -factor
+    cx1, cy1 = factor * rx * y1 / ry, -factor * ry * x1 / rx
+    cx = cos * cx1 - sin * cy1 + (x0 + x) / 2
+    cy = sin * cx1 + cos * cy1 + (y0 + y) / 2
+
+    start = math.atan2((y1 - cy1) / ry, (x1 - cx1) / rx)
+    delta = math.atan2((-y1 - cy1) / ry, (-x1 - cx1) / rx) - start
+    if sweep and delta < 0:
+        delta += 2 * math.pi
+    elif not sweep and delta > 0:
+        delta -= 2 * math.pi
+
+    steps = max(2, math.ceil(abs(delta) / (2 * math.pi) * ARC_SEGMENTS))
+    points = []
+    for i in range(1, steps + 1):
+        t = start + delta * i / steps
+        ex, ey = rx * math.cos(t), ry * math.sin(t)
+        points.append((cos * ex - sin * ey + cx, sin * ex + cos * ey + cy))
+    return points
+
+
+def flatten_path(data: str, matrix=IDENTITY) -> list[tuple[list[tuple[float, float]], bool]]:
+    """Path data as polylines in transformed coordinates: [(points, closed)]."""
+
+    subpaths = []
+    points: list[tuple[float, float]] = []
+    x = y = start_x = start_y = 0.0
+    last_control = None  # (command letter, control point) for S and T
+
+    def finish(closed):
+        nonlocal points
+        if len(points) > 1:
+            subpaths.append(([apply(matrix, px, py) for px, py in points], closed))
+        points = []
+
+    for command, args in path_commands(data):
+        upper = command.upper()
+        relative = command.islower()
+        ox, oy = (x, y) if relative else (0.0, 0.0)
+
+        if upper == "M":
+            finish(False)
+            x, y = args[0] + ox, args[1] + oy
+            start_x, start_y = x, y
+            points = [(x, y)]
+        elif upper == "Z":
+            finish(True)
+            x, y = start_x, start_y
+            points = [(x, y)]
+        elif upper in "LHV":
+            if upper == "L":
+                x, y = args[0] + ox, args[1] + oy
+            elif upper == "H":
+                x = args[0] + ox
+            else:
+                y = args[0] + oy
+            points.append((x, y))
+        elif upper in "CS":
+            if upper == "C":
+                c1 = (args[0] + ox, args[1] + oy)
+                c2, end = (args[2] + ox, args[3] + oy), (args[4] + ox, args[5] + oy)
+            else:
+                c1 = _reflect(last_control, "CS", x, y)
+                c2, end = (args[0] + ox, args[1] + oy), (args[2] + ox, args[3] + oy)
+            for i in range(1, CURVE_SEGMENTS + 1):
+                t = i / CURVE_SEGMENTS
+                u = 1 - t
+                points.append((u ** 3 * x + 3 * u * u * t * c1[0] + 3 * u * t * t * c2[0] + t ** 3 * end[0],
+                               u ** 3 * y + 3 * u * u * t * c1[1] + 3 * u * t * t * c2[1] + t ** 3 * end[1]))
+            last_control = (upper, c2)
+            x, y = end
+            continue
+        elif upper in "QT":
+            if upper == "Q":
+                c, end = (args[0] + ox, args[1] + oy), (args[2] + ox, args[3] + oy)
+            else:
+                c, end = _reflect(last_control, "QT", x, y), (args[0] + ox, args[1] + oy)
+            for i in range(1, CURVE_SEGMENTS + 1):
+                t = i / CURVE_SEGMENTS
+                u = 1 - t
+                points.append((u * u * x + 2 * u * t * c[0] + t * t * end[0],
+                               u * u * y + 2 * u * t * c[1] + t * t * end[1]))
+            last_control = (upper, c)
+            x, y = end
+            continue
+        elif upper == "A":
+            end_x, end_y = args[5] + ox, args[6] + oy
+            points.extend(_arc(x, y, args[0], args[1], args[2], bool(args[3]), bool(args[4]), end_x, end_y))
+            x, y = end_x, end_y
+        last_control = None
+
+    finish(False)
+    return subpaths
+
+
+def _reflect(last_control, kinds, x, y):
+    """Reflection of the previous control point, or the current point if there is none."""
+    if last_control and last_control[0] in kinds:
+        cx, cy = last_control[1]
+        return 2 * x - cx, 2 * y - cy
+    return x, y
+
+
+class LinearGradient:
+    def __init__(self, start, end, stops: list[tuple[float, tuple[int, int, int, int]]]):
+        self.start, self.end = start, end
+        self.stops = sorted(stops)
+
+    def colors(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """RGBA (uint8) at each point, looked up from a table of GRADIENT_STEPS colors."""
+        (x1, y1), (x2, y2) = self.start, self.end
+        dx, dy = x2 - x1, y2 - y1
+        length2 = dx * dx + dy * dy or 1.0
+        # The projection separates into a row and a column term
+        t = (xs - x1) * (dx / length2) + (ys - y1) * (dy / length2)
+        index = (np.clip(t, 0, 1) * (GRADIENT_STEPS - 1) + 0.5).astype(np.intp)
+        return self._table()[index]
+
+    def _table(self) -> np.ndarray:
+        offsets = [offset for offset, _ in self.stops]
+        steps = np.linspace(0, 1, GRADIENT_STEPS)
+        table = np.stack([np.interp(steps, offsets, [color[i] for _, color in self.stops]) for i in range(4)], axis=-1)
+        return (table + 0.5).astype(np.uint8)
+
+
+class VectorPath:
+    def __init__(self, subpaths, fill=None, stroke=None, stroke_width=0.0, line_cap="butt",
+                 line_join="miter", fill_alpha=1.0, stroke_alpha=1.0):
+        self.subpaths = subpaths
+        self.fill = fill
+        self.stroke = stroke
+        self.stroke_width = stroke_width
+        self.line_cap = line_cap
+        self.line_join = line_join
+        self.fill_alpha = fill_alpha
+        self.stroke_alpha = stroke_alpha
+
+
+class VectorDrawable:
+    def __init__(self, viewport_width: float, viewport_height: float, paths: list[VectorPath]):
+        self.viewport_width = viewport_width
+        self.viewport_height = viewport_height
+        self.paths = paths
+
+
+def _gradient(element: ET.Element, matrix) -> LinearGradient | None:
+    gradient = element.find(f"{AAPT}attr/gradient")
+    if gradient is None or gradient.get(ANDROID + "type", "linear") != "linear":
+        return None
+
+    def number(name):
+        return float(gradient.get(ANDROID + name, 0))
+
+    stops = [(float(item.get(ANDROID + "offset", 0)), parse_color(item.get(ANDROID + "color")))
+             for item in gradient.findall("item")]
+    if not stops:
+        stops = [(0.0, parse_color(gradient.get(ANDROID + "startColor"))),
+                 (1.0, parse_color(gradient.get(ANDROID + "endColor")))]
+    return LinearGradient(apply(matrix, number("startX"), number("startY")),
+                          apply(matrix, number("endX"), number("endY")), stops)
+
+
+def _walk(element: ET.Element, matrix, paths: list[VectorPath]):
+    for child in element:
+        if child.tag == "group":
+            _walk(child, multiply(matrix, group_matrix(child)), paths)
+        elif child.tag == "path":
+            data = child.get(ANDROID + "pathData")
+            if not data:
+                continue
+            fill = child.get(ANDROID + "fillColor")
+            stroke = child.get(ANDROID + "strokeColor")
+            # Stroke widths scale with the group's transform
+            scale = math.sqrt(abs(matrix[0] * matrix[3] - matrix[1] * matrix[2]))
+            paths.append(VectorPath(
+                flatten_path(data, matrix),
+                fill=parse_color(fill) if fill else _gradient(child, matrix),
+                stroke=parse_color(stroke) if stroke else None,
+                stroke_width=float(child.get(ANDROID + "strokeWidth", 0)) * scale,
+                line_cap=child.get(ANDROID + "strokeLineCap", "butt"),
+                line_join=child.get(ANDROID + "strokeLineJoin", "miter"),
+                fill_alpha=float(child.get(ANDROID + "fillAlpha", 1)),
+                stroke_alpha=float(child.get(ANDROID + "strokeAlpha", 1)),
+            ))
+
+
+def load(path: str | Path) -> VectorDrawable:
+    root = ET.parse(path).getroot()
+    if root.tag != "vector":
+        raise ValueError(f"{path}: not a <vector> drawable")
+    paths: list[VectorPath] = []
+    _walk(root, IDENTITY, paths)
+    return VectorDrawable(float(root.get(ANDROID + "viewportWidth")),
+                          float(root.get(ANDROID + "viewportHeight")), paths)
+
+
+def render(drawable: VectorDrawable, width: int, height: int | None = None,
+           supersample: int = DEFAULT_SUPERSAMPLE) -> Image.Image:
+    """Rasterize to a transparent RGBA image of width x height pixels."""
+
+    height = height or width
+    ss = max(1, int(supersample))
+    image = Image.new("RGBA", (width * ss, height * ss), (0, 0, 0, 0))
+    sx = width * ss / drawable.viewport_width
+    sy = height * ss / drawable.viewport_height
+
+    for path in drawable.paths:
+        subpaths = [([(x * sx, y * sy) for x, y in points], closed) for points, closed in path.subpaths]
+        if path.fill is not None:
+            _composite(image, path.fill, path.fill_alpha, subpaths, 0, None, (sx, sy))
+        if path.stroke is not None and path.stroke_width > 0:
+            _composite(image, path.stroke, path.stroke_alpha, subpaths,
+                       path.stroke_width * math.sqrt(sx * sy), path.line_cap, (sx, sy))
+
+    return image.reduce(ss) if ss > 1 else image
+
+
+def _composite(image: Image.Image, paint, alpha: float, subpaths, stroke_width: float, line_cap, scale):
+    """Draw one fill (stroke_width 0) or stroke into a mask over its bounding box and blend it in."""
+
+    xs = [x for points, _ in subpaths for x, _ in points]
+    ys = [y for points, _ in subpaths for _, y in points]
+    if not xs:
+        return
+    pad = stroke_width / 2 + 2
+    x0 = max(0, math.floor(min(xs) - pad))
+    y0 = max(0, math.floor(min(ys) - pad))
+    x1 = min(image.width, math.ceil(max(xs) + pad))
+    y1 = min(image.height, math.ceil(max(ys) + pad))
+    if x0 >= x1 or y0 >= y1:
+        return
+
+    mask = Image.new("L", (x1 - x0, y1 - y0), 0)
+    draw = ImageDraw.Draw(mask)
+    for points, closed in subpaths:
+        local = [(x - x0, y - y0) for x, y in points]
+        if not stroke_width:
+            # Each contour is filled on its own, which matches nonZero for the non-overlapping contours used here
+            if len(local) > 2:
+                draw.polygon(local, fill=255)
+            continue
+        if closed:
+            local.append(local[0])
+        draw.line(local, fill=255, width=max(1, round(stroke_width)), joint="curve")
+        if line_cap == "round" and not closed:
+            r = stroke_width / 2
+            for cx, cy in (local[0], local[-1]):
+                draw.ellipse((cx - r, cy - r, cx + r, cy + r), fill=255)
+
+    if isinstance(paint, LinearGradient):
+        gx = (np.arange(x0, x1, dtype=np.float32) + 0.5) / scale[0]
+        gy = (np.arange(y0, y1, dtype=np.float32) + 0.5) / scale[1]
+        colors = paint.colors(gx[None, :], gy[:, None])
+        layer = Image.fromarray(np.ascontiguousarray(np.broadcast_to(colors, (y1 - y0, x1 - x0, 4))), "RGBA")
+        opacity = 1.0
+    else:
+        layer = Image.new("RGBA", mask.size, tuple(paint))
+        opacity = paint[3] / 255
+
+    # Coverage times the paint's own alpha times the path's alpha
+    opacity *= alpha
+    if opacity < 1:
+        mask = mask.point(lambda v: round(v * opacity))
+    if isinstance(paint, LinearGradient):
+        mask = ImageChops.multiply(mask, layer.getchannel("A"))
+    layer.putalpha(mask)
+    image.alpha_composite(layer, (x0, y0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rasterize an Android vector drawable to PNG.")
+    parser.add_argument("drawable", help="VectorDrawable XML file")
+    parser.add_argument("-o", "--output", required=True, help="PNG file to write")
+    parser.add_argument("--size", type=int, default=432, help="Width in pixels (default: 432)")
+    parser.add_argument("--supersample", type=int, default=DEFAULT_SUPERSAMPLE,
+                        help=f"Samples per pixel along each axis (default: {DEFAULT_SUPERSAMPLE})")
+    args = parser.parse_args()
+
+    drawable = load(args.drawable)
+    height = round(args.size * drawable.viewport_height / drawable.viewport_width)
+    render(drawable, args.size, height, args.supersample).save(args.output)
+    print(f"Rendered {args.drawable} to {args.output} ({args.size}x{height})")
+
+
+if __name__ == "__main__":
+    main()
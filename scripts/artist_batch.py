@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Artist-centric batch matching.
+
+Packs often hold several songs by the same artist. Instead of searching for
+each of them, the cards are grouped by normalized artist, the artist is
+resolved once, and its top tracks and album tracklists are pulled page by
+page. search_deezer then scores a card against its artist's tracks locally
+and only searches for the cards that found no confident match there.
+
+Fetching for an artist stops as soon as each of its cards has a confident
+candidate, and never takes more requests than the artist has cards, so a
+group costs at most what searching card by card would have.
+"""
+
+import threading
+from collections import Counter
+
+from match_scoring import ACCEPT_CONFIDENCE, best_candidate, normalize, release_year, similarity
+
+
+# Artists with fewer undecided cards are left to the per-card search
+DEFAULT_MIN_CARDS = 3
+# Page size of artist, top track, album and tracklist requests
+PAGE_SIZE = 100
+# An artist search result must be this similar to the cards' artist
+ARTIST_MIN_SIMILARITY = 0.9
+
+
+def group_by_artist(cards, min_cards: int = DEFAULT_MIN_CARDS) -> dict[str, list]:
+    """Cards by normalized artist, keeping only artists with at least `min_cards` cards."""
+    groups = {}
+    for card in cards:
+        key = normalize(card.artist or "")
+        if key:
+            groups.setdefault(key, []).append(card)
+    return {key: group for key, group in groups.items() if len(group) >= min_cards}
+
+
+def pick_artist(results: list, name: str) -> dict | None:
+    """The first artist search result whose name matches `name`."""
+    wanted = normalize(name)
+    for artist in results:
+        if similarity(wanted, normalize(artist.get("name") or "")) >= ARTIST_MIN_SIMILARITY:
+            return artist
+    return None
+
+
+def _confident(tracks: list, card) -> bool:
+    best = best_candidate(tracks, card.title, card.artist, card.year)
+    return best is not None and best[0] >= ACCEPT_CONFIDENCE
+
+
+def _closest_first(albums: list, cards) -> list:
+    """Albums released closest to one of the cards' years first; undated ones last."""
+    years = [card.year for card in cards if card.year]
+
+    def distance(album):
+        year = release_year(album)
+        if year is None or not years:
+            return float("inf")
+        return min(abs(year - card_year) for card_year in years)
+
+    return sorted(albums, key=distance)
+
+
+class ArtistTracks:
+    """Tracks fetched per normalized artist name, filled from several threads."""
+
+    def __init__(self):
+        self._tracks: dict[str, list] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    def get(self, artist: str) -> list | None:
+        """The fetched tracks of `artist`, or None if it was not fetched."""
+        return self._tracks.get(normalize(artist or ""))
+
+    def fetch(self, get, cards: list) -> int:
+        """Fetch the tracks of the artist shared by `cards` through `get(path, params)`.
+
+        Returns the number of cards that have a confident candidate among the
+        fetched tracks. Tracks gathered before a failing request are kept.
+        """
+
+        name = Counter(card.artist for card in cards).most_common(1)[0][0]
+        pending = list(cards)
+        tracks = []
+        requests = 0
+
+        def request(path: str, index: int = 0, **params) -> dict:
+            nonlocal requests
+            requests += 1
+            return get(path, {**params, "index": index, "limit": PAGE_SIZE})
+
+        def add(new: list) -> bool:
+            """Keep `new` tracks; True once nothing is left to fetch for."""
+            tracks.extend(new)
+            pending[:] = [card for card in pending if not _confident(new, card)]
+            return not pending or requests >= len(cards)
+
+        try:
+            artist = pick_artist(request("/search/artist", q=name).get("data", []), name)
+            done = artist is None or requests >= len(cards)
+
+            index = 0
+            while not done:
+                page = request(f"/artist/{artist['id']}/top", index)
+                done = add(page.get("data", []))
+                if "next" not in page:
+                    break
+                index += PAGE_SIZE
+
+            index = 0
+            while not done:
+                page = request(f"/artist/{artist['id']}/albums", index)
+                for album in _closest_first(page.get("data", []), pending):
+                    done = requests >= len(cards)
+                    if done:
+                        break
+                    # Tracklist entries carry no album; longer albums than a page are rare
+                    listing = request(f"/album/{album['id']}/tracks")
+                    done = add([dict(track, album=album) for track in listing.get("data", [])])
+                    if done:
+                        break
+                if "next" not in page:
+                    break
+                index += PAGE_SIZE
+        finally:
+            with self._lock:
+                if tracks:
+                    self._tracks[normalize(name)] = tracks
+                self.requests += requests
+
+        return len(cards) - len(pending)
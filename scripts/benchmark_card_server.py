@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Load test for card_server.py.
+
+Opens a number of keep-alive connections and sends card lookups as fast as
+the server answers them for a fixed time: single lookups over the server's
+id range, a share of deck-sized batch requests, a share of revalidations
+with a known ETag and a share of unknown ids. Reports requests per second,
+latency percentiles and status counts.
+
+    python benchmark_card_server.py --url http://127.0.0.1:8780 --duration 10
+    python benchmark_card_server.py --spawn --shards 'tmp/*/hitster-cards_deezer.json' --reload-every 2
+
+With --spawn the server runs as a child process on the same box, and
+--reload-every sends it SIGHUP while the test runs; every request must
+still succeed. Client and server then share the CPUs, so the numbers are a
+lower bound of what the server alone can do.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from urllib.parse import urlsplit
+
+
+DEFAULT_URL = "http://127.0.0.1:8780"
+DEFAULT_CONNECTIONS = 32
+DEFAULT_DURATION = 10.0
+DEFAULT_BATCH_SIZE = 40
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class Workload:
+    """Draws the next request; remembers ETags so later requests can revalidate."""
+
+    def __init__(self, first: int, last: int, args: argparse.Namespace, seed: int):
+        self.first = first
+        self.last = last
+        self.args = args
+        self.rng = random.Random(seed)
+        self.etags: dict[str, str] = {}
+
+    def card_id(self) -> str:
+        if self.rng.random() < self.args.miss_share:
+            return str(self.last + self.rng.randint(1, 1000))
+        return str(self.rng.randint(self.first, self.last))
+
+    def next_request(self) -> tuple[str, bytes]:
+        """(kind, raw request) for the next lookup."""
+        draw = self.rng.random()
+        if draw < self.args.batch_share:
+            ids = [self.card_id() for _ in range(self.args.batch_size)]
+            body = json.dumps({"ids": ids}).encode()
+            return "batch", (b"POST /cards/batch HTTP/1.1\r\nHost: cards\r\n"
+                             b"Content-Type: application/json\r\nContent-Length: %d\r\n\r\n" % len(body)) + body
+
+        card_id = self.card_id()
+        headers = b""
+        kind = "card"
+        if draw < self.args.batch_share + self.args.revalidate_share and card_id in self.etags:
+            headers = b"If-None-Match: " + self.etags[card_id].encode() + b"\r\n"
+            kind = "revalidate"
+        return kind, b"GET /cards/%s HTTP/1.1\r\nHost: cards\r\n%s\r\n" % (card_id.encode(), headers)
+
+
+async def read_response(reader: asyncio.StreamReader) -> tuple[int, dict, bytes]:
+    head = await reader.readuntil(b"\r\n\r\n")
+    status_line, *lines = head[:-4].decode("latin-1").split("\r\n")
+    headers = {}
+    for line in lines:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length") or 0)
+    body = await reader.readexactly(length) if length else b""
+    return int(status_line.split(" ", 2)[1]), headers, body
+
+
+async def connection(host: str, port: int, workload: Workload, deadline: float, results: dict):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            kind, request = workload.next_request()
+            start = time.perf_counter()
+            try:
+                writer.write(request)
+                status, headers, body = await read_response(reader)
+            except (asyncio.IncompleteReadError, ConnectionError) as e:
+                results["errors"][type(e).__name__] += 1
+                writer.close()
+                reader, writer = await asyncio.open_connection(host, port)
+                continue
+            results["latencies"].append(time.perf_counter() - start)
+            results["statuses"][status] += 1
+            results["kinds"][kind] += 1
+            if status == 200 and kind == "card" and "etag" in headers:
+                workload.etags[request.split(b" ", 2)[1].rsplit(b"/", 1)[1].decode()] = headers["etag"]
+            # 404 is the expected answer for unknown ids
+            if status not in (200, 304, 404):
+                results["errors"][f"HTTP {status}"] += 1
+    finally:
+        writer.close()
+
+
+async def fetch_health(host: str, port: int) -> dict:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(b"GET /health HTTP/1.1\r\nHost: cards\r\nConnection: close\r\n\r\n")
+        status, _, body = await read_response(reader)
+        if status != 200:
+            raise SystemExit(f"/health answered {status}")
+        return json.loads(body)
+    finally:
+        writer.close()
+
+
+async def reloader(process: subprocess.Popen, interval: float, deadline: float, results: dict):
+    while time.perf_counter() + interval < deadline:
+        await asyncio.sleep(interval)
+        process.send_signal(signal.SIGHUP)
+        results["reloads"] += 1
+
+
+async def run(host: str, port: int, args: argparse.Namespace, process: subprocess.Popen | None) -> dict:
+    health = await fetch_health(host, port)
+    if not health.get("cards"):
+        raise SystemExit("The server has no cards")
+    first, last = int(health["first"]), int(health["last"])
+
+    results = {"latencies": [], "statuses": Counter(), "kinds": Counter(), "errors": Counter(), "reloads": 0}
+    start = time.perf_counter()
+    deadline = start + args.duration
+    tasks = [connection(host, port, Workload(first, last, args, seed=args.seed + i), deadline, results)
+             for i in range(args.connections)]
+    if process is not None and args.reload_every:
+        tasks.append(reloader(process, args.reload_every, deadline, results))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(results["latencies"])
+    return {
+        "cards": health["cards"],
+        "connections": args.connections,
+        "seconds": round(elapsed, 3),
+        "requests": len(latencies),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "latency_p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "latency_p90_ms": round(percentile(latencies, 0.90) * 1000, 3),
+        "latency_p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "latency_p999_ms": round(percentile(latencies, 0.999) * 1000, 3),
+        "latency_max_ms": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+        "statuses": {str(status): n for status, n in sorted(results["statuses"].items())},
+        "kinds": dict(results["kinds"]),
+        "errors": dict(results["errors"]),
+        "reloads": results["reloads"],
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def spawn_server(args: argparse.Namespace) -> tuple[subprocess.Popen, int]:
+    """Start card_server.py as a child process and wait until it listens."""
+    port = free_port()
+    command = [sys.executable, str(Path(__file__).with_name("card_server.py")), "--port", str(port)]
+    for pattern in args.shards or []:
+        command += ["--shards", pattern]
+    for manifest in args.manifest:
+        command += ["--manifest", manifest]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+
+    line = process.stdout.readline()
+    if not line.startswith("Serving"):
+        process.kill()
+        raise SystemExit(f"card_server.py did not start: {line.strip()}")
+    print(line.strip())
+    # Keep draining its reload messages so the pipe never fills up
+    threading.Thread(target=process.stdout.read, daemon=True).start()
+    return process, port
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test card_server.py.")
+    parser.add_argument("--url", default=DEFAULT_URL, help=f"Server to test (default: {DEFAULT_URL})")
+    parser.add_argument("--spawn", action="store_true", help="Start card_server.py for the test")
+    parser.add_argument("--shards", action="append", metavar="GLOB", help="Shards for the spawned server")
+    parser.add_argument("--manifest", action="append", default=[], metavar="PATH",
+                        help="Manifest for the spawned server")
+    parser.add_argument("--connections", type=int, default=DEFAULT_CONNECTIONS,
+                        help=f"Concurrent keep-alive connections (default: {DEFAULT_CONNECTIONS})")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION,
+                        help=f"Seconds to run (default: {DEFAULT_DURATION})")
+    parser.add_argument("--batch-share", type=float, default=0.02, help="Share of batch requests")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"Ids per batch request (default: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--revalidate-share", type=float, default=0.2,
+                        help="Share of lookups sent with a known ETag")
+    parser.add_argument("--miss-share", type=float, default=0.05, help="Share of unknown ids")
+    parser.add_argument("--reload-every", type=float, metavar="SECONDS",
+                        help="Send the spawned server SIGHUP this often")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = parser.parse_args()
+
+    process = None
+    if args.spawn:
+        process, port = spawn_server(args)
+        host = "127.0.0.1"
+    else:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+
+    try:
+        result = asyncio.run(run(host, port, args, process))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"{result['requests']} requests over {result['connections']} connections "
+              f"in {result['seconds']} s ({result['cards']} cards)")
+        print(f"  throughput   {result['requests_per_second']:>10} req/s")
+        for name in ("p50", "p90", "p99", "p999", "max"):
+            print(f"  latency {name:<5}{result[f'latency_{name}_ms']:>10} ms")
+        print(f"  statuses     {result['statuses']}")
+        print(f"  requests     {result['kinds']}")
+        if result["reloads"]:
+            print(f"  reloads      {result['reloads']}")
+        print(f"  errors       {result['errors'] or 'none'}")
+
+    if result["errors"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark of the Deezer matching pipeline against a local fake server.
+
+Starts fake_deezer_server in-process, drives match_cards_with_deezer (or the
+async matcher) over a synthetic or given card pack and reports cards per
+second, API calls per card, per-card latency percentiles and match rate.
+
+    python benchmark_matcher.py --cards 300 --latency lognormal:0.08,0.5 --async
+    python benchmark_matcher.py --save-baseline bench.json
+    python benchmark_matcher.py --baseline bench.json --tolerance 0.1
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import statistics
+import threading
+import time
+
+import deezer_matcher
+from card_model import Card
+from deezer_cache import QueryMemo
+from fake_deezer_server import add_server_arguments, server_from_args, synthetic_cards, synthetic_tracks
+from rate_limiter import TokenBucket
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+@contextlib.contextmanager
+def timed_match_card(latencies: list[float]):
+    """Record the duration of every match_card call made by the matcher."""
+    original = deezer_matcher.match_card
+    lock = threading.Lock()
+
+    def timed(card, journal=None):
+        start = time.perf_counter()
+        try:
+            return original(card, journal)
+        finally:
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    deezer_matcher.match_card = timed
+    try:
+        yield
+    finally:
+        deezer_matcher.match_card = original
+
+
+def run_benchmark(cards: list[dict], args: argparse.Namespace) -> dict:
+    server = server_from_args(args).start()
+    deezer_matcher.DEEZER_API_BASE = server.base_url
+    deezer_matcher.REQUEST_TIMEOUT = args.client_timeout
+    deezer_matcher.QUOTA_BACKOFF = args.quota_backoff
+    deezer_matcher.set_response_cache(None)
+    deezer_matcher.set_catalog_index(None)
+    deezer_matcher.set_query_memo(None if args.no_memo else QueryMemo())
+    deezer_matcher.set_speculative(args.speculative, workers=args.concurrency * 3)
+
+    if args.no_rate_limit:
+        deezer_matcher.set_rate_limiter(TokenBucket(rate=1e9, capacity=1e9))
+    else:
+        deezer_matcher.set_rate_limiter(TokenBucket.for_quota(
+            deezer_matcher.DEEZER_QUOTA_REQUESTS, deezer_matcher.DEEZER_QUOTA_PERIOD))
+
+    expected = {card["id"]: card.pop("expected_id", None) for card in cards}
+    cards = [Card.from_dict(card) for card in cards]
+    latencies = []
+
+    start = time.perf_counter()
+    try:
+        with timed_match_card(latencies), contextlib.redirect_stdout(io.StringIO()):
+            if args.by_artist:
+                deezer_matcher.set_artist_tracks(deezer_matcher.prefetch_artists(
+                    cards, workers=args.concurrency, min_cards=args.artist_min_cards))
+            if args.use_async:
+                matched = asyncio.run(deezer_matcher.match_cards_with_deezer_async(cards, args.concurrency))
+            else:
+                matched = deezer_matcher.match_cards_with_deezer(cards)
+    finally:
+        elapsed = time.perf_counter() - start
+        stats = dict(server.stats)
+        server.stop()
+        deezer_matcher.set_artist_tracks(None)
+
+    found = sum(1 for card in matched if card.get("deezer_id"))
+    labelled = [card for card in matched if expected.get(card["id"])]
+    correct = sum(1 for card in labelled if card.get("deezer_id") == expected[card["id"]])
+
+    return {
+        "cards": len(matched),
+        "seconds": round(elapsed, 3),
+        "cards_per_second": round(len(matched) / elapsed, 3) if elapsed else 0.0,
+        "api_calls_per_card": round(stats.get("requests", 0) / len(matched), 3) if matched else 0.0,
+        "latency_p50": round(percentile(latencies, 0.50), 4),
+        "latency_p95": round(percentile(latencies, 0.95), 4),
+        "latency_p99": round(percentile(latencies, 0.99), 4),
+        "latency_mean": round(statistics.fmean(latencies), 4) if latencies else 0.0,
+        "match_rate": round(found / len(matched), 4) if matched else 0.0,
+        "accuracy": round(correct / len(labelled), 4) if labelled else None,
+        "server": stats,
+    }
+
+
+def check_regression(result: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Metrics that got worse than the baseline by more than `tolerance`."""
+    failures = []
+    higher_is_better = ("cards_per_second", "match_rate", "accuracy")
+    lower_is_better = ("api_calls_per_card", "latency_p50", "latency_p95", "latency_p99")
+
+    for key in higher_is_better:
+        if baseline.get(key) and result.get(key) is not None and result[key] < baseline[key] * (1 - tolerance):
+            failures.append(f"{key}: {result[key]} < {baseline[key]}")
+    for key in lower_is_better:
+        if baseline.get(key) and result[key] > baseline[key] * (1 + tolerance):
+            failures.append(f"{key}: {result[key]} > {baseline[key]}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the matching pipeline against a fake Deezer server.")
+    parser.add_argument("--cards", type=int, default=300, help="Synthetic card pack size (default: 300)")
+    parser.add_argument("--card-file", help="Use this card pack instead of a synthetic one")
+    parser.add_argument("--async", dest="use_async", action="store_true")
+    parser.add_argument("--concurrency", type=int, default=deezer_matcher.DEFAULT_CONCURRENCY)
+    parser.add_argument("--speculative", action="store_true")
+    parser.add_argument("--by-artist", action="store_true",
+                        help="Prefetch the tracks of artists with several cards (batch mode)")
+    parser.add_argument("--artist-min-cards", type=int, default=deezer_matcher.DEFAULT_MIN_CARDS)
+    parser.add_argument("--no-memo", action="store_true", help="Disable in-run query memoization")
+    parser.add_argument("--no-rate-limit", action="store_true",
+                        help="Measure pipeline overhead without the 50/5 s quota")
+    parser.add_argument("--client-timeout", type=float, default=1.0,
+                        help="Request timeout used by the matcher (default: 1.0)")
+    parser.add_argument("--quota-backoff", type=float, default=deezer_matcher.QUOTA_BACKOFF)
+    parser.add_argument("--save-baseline", metavar="PATH", help="Write the result as a baseline")
+    parser.add_argument("--baseline", metavar="PATH", help="Fail if the result regresses against this baseline")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="Allowed relative regression against the baseline (default: 0.1)")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    if args.card_file:
+        with open(args.card_file, "r", encoding="utf-8") as f:
+            cards = json.load(f)
+    else:
+        if args.catalog:
+            raise SystemExit("--catalog needs --card-file")
+        cards = synthetic_cards(synthetic_tracks(args.synthetic, seed=args.seed + 1), args.cards, seed=args.seed + 2)
+
+    result = run_benchmark(cards, args)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        mode = f"async x{args.concurrency}" if args.use_async else "serial"
+        if args.speculative:
+            mode += ", speculative"
+        print(f"{result['cards']} cards, {mode}, {result['seconds']} s")
+        print(f"  throughput      {result['cards_per_second']:8.2f} cards/s")
+        print(f"  API calls       {result['api_calls_per_card']:8.2f} per card")
+        print(f"  latency p50     {result['latency_p50'] * 1000:8.1f} ms")
+        print(f"  latency p95     {result['latency_p95'] * 1000:8.1f} ms")
+        print(f"  latency p99     {result['latency_p99'] * 1000:8.1f} ms")
+        print(f"  match rate      {result['match_rate'] * 100:8.1f} %")
+        if result["accuracy"] is not None:
+            print(f"  accuracy        {result['accuracy'] * 100:8.1f} %")
+        print(f"  server          {result['server']}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            failures = check_regression(result, json.load(f), args.tolerance)
+        if failures:
+            print("Regression against baseline:")
+            for failure in failures:
+                print(f"  {failure}")
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the match scoring engine over recorded Deezer result sets.
+
+Record result sets from a matched card file and the search cache:
+    python benchmark_scoring.py record hitster-cards_deezer.json result_sets.ndjson
+
+Benchmark the scoring engine against the previous substring scorer:
+    python benchmark_scoring.py run result_sets.ndjson
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from deezer_cache import DEFAULT_CACHE_PATH, ResponseCache
+from match_scoring import fold, normalize, score_candidates, similarity, version_markers
+
+
+def legacy_pick_best_match(results: list, title: str, artist: str) -> dict | None:
+    """The substring scorer that pick_best_match used before the scoring engine."""
+
+    title_lower = title.lower()
+    artist_lower = artist.lower()
+    scored_results = []
+
+    for track in results:
+        score = 0
+        track_title = track.get("title", "").lower()
+        track_artist = track.get("artist", {}).get("name", "").lower()
+
+        if title_lower == track_title:
+            score += 100
+        elif title_lower in track_title or track_title in title_lower:
+            score += 50
+
+        if artist_lower == track_artist:
+            score += 100
+        elif artist_lower in track_artist or track_artist in artist_lower:
+            score += 50
+
+        if "live" not in track_title and "remix" not in track_title:
+            score += 10
+
+        scored_results.append((score, track))
+
+    scored_results.sort(key=lambda x: x[0], reverse=True)
+    return scored_results[0][1] if scored_results else None
+
+
+def record(cards_path: str, output_path: str, cache_path: str):
+    """Write one result set per cached strategy query of every matched card."""
+
+    from deezer_matcher import search_queries
+
+    with open(cards_path, "r", encoding="utf-8") as f:
+        cards = json.load(f)
+
+    cache = ResponseCache(cache_path)
+    written = 0
+
+    with open(output_path, "w", encoding="utf-8") as out:
+        for card in cards:
+            if not card.get("title") or not card.get("artist"):
+                continue
+            for strategy, query in enumerate(search_queries(card["title"], card["artist"]), 1):
+                results = cache.get(query, 10, allow_stale=True)
+                if not results:
+                    continue
+                out.write(json.dumps({
+                    "title": card["title"],
+                    "artist": card["artist"],
+                    "year": card.get("year"),
+                    "strategy": strategy,
+                    "expected_id": card.get("deezer_id"),
+                    "results": results,
+                }, ensure_ascii=False) + "\n")
+                written += 1
+
+    cache.close()
+    print(f"{written} result sets written to {output_path}")
+
+
+def clear_caches():
+    for cached in (fold, normalize, similarity, version_markers):
+        cached.cache_clear()
+
+
+def run(sets_path: str, repeat: int):
+    """Time both scorers and report agreement and confidence calibration."""
+
+    with open(sets_path, "r", encoding="utf-8") as f:
+        result_sets = [json.loads(line) for line in f if line.strip()]
+
+    if not result_sets:
+        print("No result sets")
+        return
+
+    candidates = sum(len(s["results"]) for s in result_sets)
+    print(f"{len(result_sets)} result sets, {candidates} candidates, {repeat} rounds\n")
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for s in result_sets:
+            legacy_pick_best_match(s["results"], s["title"], s["artist"])
+    legacy_time = (time.perf_counter() - start) / repeat
+
+    clear_caches()
+    start = time.perf_counter()
+    score_candidates(result_sets[0]["results"], result_sets[0]["title"], result_sets[0]["artist"])
+    for s in result_sets:
+        score_candidates(s["results"], s["title"], s["artist"], s.get("year"))
+    cold_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for s in result_sets:
+            score_candidates(s["results"], s["title"], s["artist"], s.get("year"))
+    warm_time = (time.perf_counter() - start) / repeat
+
+    per_set = 1e6 / len(result_sets)
+    print(f"legacy scorer:         {legacy_time * per_set:8.1f} µs/set")
+    print(f"scoring engine (cold): {cold_time * per_set:8.1f} µs/set")
+    print(f"scoring engine (warm): {warm_time * per_set:8.1f} µs/set")
+
+    # Agreement with the recorded match and calibration per confidence bucket
+    buckets = {}
+    legacy_hits = engine_hits = labelled = 0
+
+    for s in result_sets:
+        expected = s.get("expected_id")
+        if not expected:
+            continue
+        labelled += 1
+
+        legacy = legacy_pick_best_match(s["results"], s["title"], s["artist"])
+        legacy_hits += legacy is not None and legacy.get("id") == expected
+
+        confidence, track = score_candidates(s["results"], s["title"], s["artist"], s.get("year"))[0]
+        correct = track.get("id") == expected
+        engine_hits += correct
+
+        bucket = min(int(confidence * 10), 9)
+        total, hits = buckets.get(bucket, (0, 0))
+        buckets[bucket] = (total + 1, hits + correct)
+
+    if not labelled:
+        return
+
+    print(f"\nAgreement with recorded match ({labelled} labelled sets):")
+    print(f"  legacy scorer:  {legacy_hits / labelled * 100:5.1f}%")
+    print(f"  scoring engine: {engine_hits / labelled * 100:5.1f}%")
+    print("\nConfidence   sets   correct")
+    for bucket in sorted(buckets):
+        total, hits = buckets[bucket]
+        print(f"  {bucket / 10:.1f}-{(bucket + 1) / 10:.1f}  {total:6d}   {hits / total * 100:5.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Deezer match scoring engine.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser("record", help="Record result sets from the search cache")
+    record_parser.add_argument("cards", help="Matched card JSON (*_deezer.json)")
+    record_parser.add_argument("output", help="Result set NDJSON to write")
+    record_parser.add_argument("--cache", default=str(DEFAULT_CACHE_PATH))
+
+    run_parser = commands.add_parser("run", help="Benchmark over recorded result sets")
+    run_parser.add_argument("result_sets", help="Result set NDJSON")
+    run_parser.add_argument("--repeat", type=int, default=20)
+
+    args = parser.parse_args()
+
+    if args.command == "record":
+        if not Path(args.cards).exists():
+            raise SystemExit(f"File not found: {args.cards}")
+        record(args.cards, args.output, args.cache)
+    else:
+        run(args.result_sets, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
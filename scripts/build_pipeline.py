@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Incremental build of the card data and the app icons.
+
+The pipeline is a graph of stages, each running one of the existing
+scripts:
+
+    match:<pack>     deezer_matcher.py on tmp/<pack>/hitster-cards.json
+    repository       generate_full_repository.py: MockHitsterCardRepository.kt and its chunks
+    bundle           the binary card bundle, tmp/cards.bin
+    kotlin-entries   generate_kotlin_cards.py, tmp/kotlin_card_entries.kt
+    icons            export_icons.py --install: the iOS and Android launcher icons
+
+A stage is keyed by the content of its input files, its command and the
+scripts it runs (including the local modules they import), and only runs
+when that key differs from its last successful run or one of its outputs
+went missing or was edited. The card generators read the matched shards,
+so they rerun exactly when a match produced different bytes, not merely
+when it ran. Stages whose inputs are ready run in parallel.
+
+Outputs are written into a staging directory and only moved into place
+when their bytes changed, so an unchanged MockHitsterCardRepository.kt
+keeps its timestamp and Gradle skips the Kotlin compile. The repository
+and icon stages run in place, as both tools already skip unchanged files.
+File digests are cached by size and mtime, so a build with nothing to do
+only stats files.
+
+    python scripts/build_pipeline.py                     # build everything that is stale
+    python scripts/build_pipeline.py repository icons    # these stages and what they need
+    python scripts/build_pipeline.py --dry-run
+    python scripts/build_pipeline.py --matcher-arg=--async --matcher-arg=--by-artist
+
+Shards without an OCR file next to them (tmp/<pack>/hitster-cards_deezer.json
+only) are used by the generators as plain inputs.
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from card_merge import DEFAULT_SHARD_PATTERN
+from catalog_index import DEFAULT_INDEX_PATH
+
+
+REPO = Path(__file__).resolve().parents[1]
+
+DEFAULT_PACK_PATTERN = "tmp/*/hitster-cards.json"
+DEFAULT_STATE = "tmp/build-state.json"
+BUILD_DIR = "tmp/.build"
+
+# Bump when a change here should rebuild everything
+STATE_VERSION = 1
+
+# Files changed this recently are hashed again next time, as a write within
+# the same mtime tick would not show in their stat
+RACY_SECONDS = 2
+
+REPOSITORY_DIR = "composeApp/src/commonMain/kotlin/com/hitit/app/repository"
+RES_DIR = "composeApp/src/androidMain/res"
+APP_ICON_SET = "iosApp/iosApp/Assets.xcassets/AppIcon.appiconset"
+
+_IMPORT = re.compile(r"^\s*(?:from\s+(\w+)|import\s+(\w+))", re.MULTILINE)
+
+
+class Stage:
+    """One step of the build: a command that turns input files into output files.
+
+    `outputs` maps each file the stage owns to its name in the staging
+    directory, which the command gets as {stage}. `writes` lists globs of
+    files the command writes in place itself.
+    """
+
+    def __init__(self, name: str, command: list[str], inputs: list[str], outputs: dict[str, str] | None = None,
+                 writes: list[str] = (), deps: list[str] = (), code: list[str] = ()):
+        self.name = name
+        self.command = command
+        self.inputs = inputs
+        self.outputs = outputs or {}
+        self.writes = list(writes)
+        self.deps = list(deps)
+        self.code = list(code)
+
+    @property
+    def stage_dir(self) -> str:
+        return f"{BUILD_DIR}/{self.name.replace(':', '-')}"
+
+    def argv(self) -> list[str]:
+        return [part.replace("{stage}", self.stage_dir) for part in self.command]
+
+
+class FileDigests:
+    """Content digests of files, cached by (size, mtime) across builds."""
+
+    def __init__(self, known: dict[str, list]):
+        self.known = known
+
+    def digest(self, path: str) -> str | None:
+        """The file's digest, or None if it does not exist."""
+        try:
+            stat = os.stat(REPO / path)
+        except FileNotFoundError:
+            self.known.pop(path, None)
+            return None
+
+        entry = self.known.get(path)
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2]
+        with open(REPO / path, "rb") as f:
+            digest = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+        if time.time_ns() - stat.st_mtime_ns > RACY_SECONDS * 1_000_000_000:
+            self.known[path] = [stat.st_size, stat.st_mtime_ns, digest]
+        else:
+            self.known.pop(path, None)
+        return digest
+
+
+def expand(patterns: list[str]) -> list[str]:
+    """Files matching the globs, relative to the repository, sorted."""
+    paths = set()
+    for pattern in patterns:
+        paths.update(Path(p).relative_to(REPO).as_posix() for p in glob.glob(str(REPO / pattern)))
+    return sorted(paths)
+
+
+def module_closure(script: str, search: list[str]) -> list[str]:
+    """`script` and every module in the `search` directories it imports, directly or not."""
+
+    seen = set()
+    todo = [script]
+    while todo:
+        path = todo.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        for match in _IMPORT.finditer((REPO / path).read_text(encoding="utf-8")):
+            name = match.group(1) or match.group(2)
+            for directory in search:
+                candidate = f"{directory}/{name}.py"
+                if (REPO / candidate).exists():
+                    todo.append(candidate)
+                    break
+    return sorted(seen)
+
+
+def define_stages(args: argparse.Namespace) -> dict[str, Stage]:
+    """The stages for the packs and shards on disk, in dependency order."""
+
+    python = sys.executable
+    stages = {}
+
+    def card_code(script: str) -> list[str]:
+        return module_closure(f"scripts/{script}", ["scripts"])
+
+    matched = []
+    for ocr in expand(args.packs):
+        pack = Path(ocr).parent
+        output = (pack / "hitster-cards_deezer.json").as_posix()
+        stages[f"match:{pack.name}"] = Stage(
+            f"match:{pack.name}",
+            [python, "scripts/deezer_matcher.py", ocr, "-o", "{stage}/hitster-cards", "--formats", "json",
+             # The journal stays with the pack, so a rerun only matches the cards that changed
+             "--journal", (pack / "hitster-cards_deezer.journal.ndjson").as_posix(), *args.matcher_arg],
+            inputs=[ocr, str(DEFAULT_INDEX_PATH)],
+            outputs={output: "hitster-cards_deezer.json"},
+            code=card_code("deezer_matcher.py"),
+        )
+        matched.append(output)
+
+    shards = sorted(set(matched) | set(expand([DEFAULT_SHARD_PATTERN])))
+    if shards:
+        deps = [name for name in stages if name.startswith("match:")]
+        shard_args = [arg for shard in shards for arg in ("--shards", shard)]
+        stages["repository"] = Stage(
+            "repository",
+            [python, "scripts/generate_full_repository.py", *shard_args],
+            inputs=shards,
+            writes=[f"{REPOSITORY_DIR}/MockHitsterCardRepository.kt", f"{REPOSITORY_DIR}/cards/*.kt"],
+            deps=deps, code=card_code("generate_full_repository.py"),
+        )
+        stages["bundle"] = Stage(
+            "bundle",
+            [python, "scripts/generate_full_repository.py", *shard_args, "--mode", "bundle",
+             "--bundle", "{stage}/cards.bin"],
+            inputs=shards, outputs={"tmp/cards.bin": "cards.bin"},
+            deps=deps, code=card_code("generate_full_repository.py"),
+        )
+        stages["kotlin-entries"] = Stage(
+            "kotlin-entries",
+            [python, "scripts/generate_kotlin_cards.py", *shard_args, "-o", "{stage}/kotlin_card_entries.kt"],
+            inputs=shards, outputs={"tmp/kotlin_card_entries.kt": "kotlin_card_entries.kt"},
+            deps=deps, code=card_code("generate_kotlin_cards.py"),
+        )
+
+    stages["icons"] = Stage(
+        "icons",
+        [python, "script/export_icons.py", "--install"],
+        inputs=[f"{RES_DIR}/drawable/*.xml", f"{RES_DIR}/mipmap-anydpi-v26/*.xml"],
+        writes=[f"{APP_ICON_SET}/*", f"{RES_DIR}/mipmap-*dpi/ic_launcher*.png"],
+        code=module_closure("script/export_icons.py", ["script", "iosApp/script"]),
+    )
+    return stages
+
+
+def select(stages: dict[str, Stage], targets: list[str]) -> list[str]:
+    """The named stages (a name or a prefix like "match") and everything they depend on."""
+
+    if not targets:
+        return list(stages)
+    wanted = []
+    for target in targets:
+        names = [name for name in stages if name == target or name.startswith(target + ":")]
+        if not names:
+            raise SystemExit(f"Unknown stage: {target} (available: {', '.join(stages)})")
+        wanted.extend(names)
+
+    selected = set()
+    while wanted:
+        name = wanted.pop()
+        if name not in selected:
+            selected.add(name)
+            wanted.extend(stages[name].deps)
+    return [name for name in stages if name in selected]
+
+
+def stage_key(stage: Stage, digests: FileDigests) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(json.dumps([STATE_VERSION, stage.name, stage.command, stage.outputs, stage.writes]).encode())
+    for path in expand(stage.inputs) + stage.code:
+        h.update(f"{path}\0{digests.digest(path)}\n".encode())
+    return h.hexdigest()
+
+
+def output_digests(stage: Stage, digests: FileDigests) -> dict[str, str | None]:
+    paths = list(stage.outputs) + expand(stage.writes)
+    return {path: digests.digest(path) for path in paths}
+
+
+def is_fresh(stage: Stage, key: str, record: dict | None, digests: FileDigests) -> bool:
+    """Whether the last run had this key and left outputs nobody has touched since."""
+    if record is None or record["key"] != key:
+        return False
+    return output_digests(stage, digests) == record["outputs"]
+
+
+def run_command(stage: Stage, log_path: Path) -> tuple[int, float]:
+    """Run the stage's command (in a worker thread). Returns (exit code, seconds)."""
+    stage_dir = REPO / stage.stage_dir
+    shutil.rmtree(stage_dir, ignore_errors=True)
+    stage_dir.mkdir(parents=True)
+    start = time.perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log:
+        process = subprocess.run(stage.argv(), cwd=REPO, stdout=log, stderr=subprocess.STDOUT,
+                                 env={**os.environ, "PYTHONUNBUFFERED": "1"})
+    return process.returncode, time.perf_counter() - start
+
+
+def install_outputs(stage: Stage, digests: FileDigests) -> list[str]:
+    """Move the staged outputs into place where their bytes differ. Returns the files changed."""
+
+    changed = []
+    for target, name in stage.outputs.items():
+        staged = REPO / stage.stage_dir / name
+        if not staged.exists():
+            raise RuntimeError(f"{stage.name} did not write {name}")
+        if digests.digest(f"{stage.stage_dir}/{name}") != digests.digest(target):
+            (REPO / target).parent.mkdir(parents=True, exist_ok=True)
+            os.replace(staged, REPO / target)
+            changed.append(target)
+    shutil.rmtree(REPO / stage.stage_dir, ignore_errors=True)
+    return changed
+
+
+def tail(path: Path, lines: int = 20) -> str:
+    text = path.read_text(encoding="utf-8", errors="replace").rstrip("\n").split("\n")
+    return "\n".join("    " + line for line in text[-lines:])
+
+
+def build(stages: dict[str, Stage], names: list[str], state: dict, args: argparse.Namespace) -> dict:
+    """Run the stale stages among `names` in dependency order. Returns counts per outcome."""
+
+    digests = FileDigests(state["files"])
+    records = state["stages"]
+    logs = REPO / BUILD_DIR / "logs"
+    logs.mkdir(parents=True, exist_ok=True)
+
+    pending = {name: {dep for dep in stages[name].deps if dep in names} for name in names}
+    done, failed = set(), set()
+    outcomes = {"ran": 0, "fresh": 0, "failed": 0, "skipped": 0}
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        while pending or running:
+            for name in [name for name, deps in pending.items() if deps & failed]:
+                del pending[name]
+                failed.add(name)
+                outcomes["skipped"] += 1
+                print(f"  skipped  {name} (a stage it needs failed)")
+
+            ready = [name for name, deps in pending.items() if deps <= done]
+            for name in ready:
+                del pending[name]
+                stage = stages[name]
+                key = stage_key(stage, digests)
+                if not args.force and is_fresh(stage, key, records.get(name), digests):
+                    done.add(name)
+                    outcomes["fresh"] += 1
+                    if args.verbose:
+                        print(f"  fresh    {name}")
+                    continue
+                if args.dry_run:
+                    # Stages after it are judged by today's inputs, which it may change
+                    done.add(name)
+                    outcomes["ran"] += 1
+                    print(f"  stale    {name}")
+                    continue
+                print(f"  run      {name}")
+                log_path = logs / f"{name.replace(':', '-')}.log"
+                # What the command writes in place is compared with how it was before
+                before = {path: digests.digest(path) for path in expand(stage.writes)}
+                running[executor.submit(run_command, stage, log_path)] = (stage, key, log_path, before)
+            if ready:
+                continue
+            if not running:
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage, key, log_path, before = running.pop(future)
+                code, seconds = future.result()
+                try:
+                    if code:
+                        raise RuntimeError(f"exit code {code}")
+                    changed = install_outputs(stage, digests)
+                except RuntimeError as e:
+                    records.pop(stage.name, None)
+                    failed.add(stage.name)
+                    outcomes["failed"] += 1
+                    print(f"  FAILED   {stage.name} after {seconds:.1f}s: {e}, log {log_path.relative_to(REPO)}")
+                    print(tail(log_path))
+                    continue
+
+                outputs = output_digests(stage, digests)
+                written = {path: digest for path, digest in outputs.items() if path not in stage.outputs}
+                changed += sorted(path for path, digest in written.items() if before.get(path) != digest)
+                removed = sorted(path for path in before if path not in written)
+                records[stage.name] = {"key": key, "outputs": outputs}
+                done.add(stage.name)
+                outcomes["ran"] += 1
+                summary = f"{len(changed)} of {len(outputs)} outputs changed"
+                if removed:
+                    summary += f", {len(removed)} removed"
+                print(f"  done     {stage.name} in {seconds:.1f}s, {summary}")
+                for path in changed if args.verbose else []:
+                    print(f"             {path}")
+                for path in removed if args.verbose else []:
+                    print(f"             {path} (removed)")
+
+    return outcomes
+
+
+def load_state(path: Path) -> dict:
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        state = {}
+    if state.get("version") != STATE_VERSION:
+        state = {"version": STATE_VERSION, "stages": {}, "files": {}}
+    return state
+
+
+def save_state(path: Path, state: dict):
+    text = json.dumps(state, indent=1, sort_keys=True) + "\n"
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(text, encoding="utf-8")
+    os.replace(temporary, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the stale card and icon outputs.")
+    parser.add_argument("targets", nargs="*", metavar="STAGE",
+                        help="Stages to bring up to date with what they need, e.g. repository or match (default: all)")
+    parser.add_argument("--packs", action="append", metavar="GLOB",
+                        help=f"OCR card files to match, repeatable (default: {DEFAULT_PACK_PATTERN})")
+    parser.add_argument("--matcher-arg", action="append", default=[], metavar="ARG",
+                        help="Extra argument for deezer_matcher.py, repeatable (--matcher-arg=--async)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(),
+                        help="Stages run at the same time (default: one per core)")
+    parser.add_argument("--state", type=Path, default=Path(DEFAULT_STATE),
+                        help=f"Keys and digests of the last build (default: {DEFAULT_STATE})")
+    parser.add_argument("-n", "--dry-run", action="store_true", help="Only list the stale stages")
+    parser.add_argument("--force", action="store_true", help="Run the selected stages even if they are fresh")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Also list fresh stages and changed files")
+    args = parser.parse_args()
+    args.packs = args.packs or [DEFAULT_PACK_PATTERN]
+
+    start = time.perf_counter()
+    stages = define_stages(args)
+    names = select(stages, args.targets)
+    if not args.targets and "repository" not in stages:
+        print(f"No card shards ({', '.join(args.packs)}, {DEFAULT_SHARD_PATTERN}), only building the icons")
+
+    state_path = REPO / args.state
+    state = load_state(state_path)
+    outcomes = build(stages, names, state, args)
+    if not args.dry_run:
+        save_state(state_path, state)
+
+    verb = "stale" if args.dry_run else "ran"
+    print(f"{len(names)} stages: {outcomes['ran']} {verb}, {outcomes['fresh']} fresh"
+          + (f", {outcomes['failed']} failed, {outcomes['skipped']} skipped" if outcomes["failed"] else "")
+          + f" in {time.perf_counter() - start:.2f}s")
+    if outcomes["failed"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Compact binary bundle of merged Hitster cards.
+
+An alternative to compiling card data into Kotlin: a versioned file with a
+fixed-width record per card, sorted by hitsterId for binary search, and a
+deduplicated string table. A lookup reads one record and the strings it
+points to, straight from a memory map.
+
+Build, query and verify a bundle:
+    python card_bundle.py build --shards hitster-cards_deezer.json -o cards.bin
+    python card_bundle.py get cards.bin 00042
+    python card_bundle.py verify cards.bin --shards hitster-cards_deezer.json
+
+Records are keyed by a numeric hitsterId, so cards with other ids (which
+the card schema allows) cannot be bundled.
+
+File layout (little-endian):
+    header   magic "HCRD", version u16, flags u16, card count u32,
+             record size u32, strings offset u32, strings size u32,
+             CRC-32 of everything after the header u32, reserved u32
+    records  card count x (hitsterId u32, year u16, reserved u16,
+             deezerId u64 (0 = none), then u32 string offsets of title,
+             artist, deezerTitle, deezerArtist and deezerAlbum
+             (0xFFFFFFFF = null)), sorted by hitsterId
+    strings  u16 byte length + UTF-8 bytes per distinct string
+"""
+
+import argparse
+import json
+import mmap
+import struct
+import zlib
+from pathlib import Path
+
+from card_merge import add_input_arguments, load_merged_cards
+from card_model import CardError
+
+
+MAGIC = b"HCRD"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIIIII")
+RECORD = struct.Struct("<IHHQIIIII")
+STRING_LENGTH = struct.Struct("<H")
+
+NULL_STRING = 0xFFFFFFFF
+MAX_STRING_BYTES = 0xFFFF
+
+# Card fields in record order, as written by the matcher
+STRING_FIELDS = ("title", "artist", "deezer_title", "deezer_artist", "deezer_album")
+
+
+def hitster_id(value) -> int:
+    """Numeric card id from 42, "42" or "00042"; CardError for anything else."""
+    try:
+        number = int(str(value).strip())
+    except ValueError:
+        raise CardError(f"card id is not a number: {value!r}") from None
+    if not 0 <= number <= 0xFFFFFFFF:
+        raise CardError(f"card id out of range: {value!r}")
+    return number
+
+
+def bundle_fields(card: dict) -> dict:
+    """The card as stored in (and read back from) a bundle."""
+    fields = {
+        "id": hitster_id(card["id"]),
+        "year": int(card.get("year") or 0),
+        "deezer_id": int(card.get("deezer_id") or 0) or None,
+    }
+    for name in STRING_FIELDS:
+        fields[name] = card.get(name)
+    return fields
+
+
+def write_bundle(cards, path: str | Path) -> int:
+    """Write `cards` (unique ids) to a bundle at `path`. Returns the card count."""
+
+    cards = sorted((bundle_fields(card) for card in cards), key=lambda card: card["id"])
+    for previous, card in zip(cards, cards[1:]):
+        if previous["id"] == card["id"]:
+            raise ValueError(f"duplicate card id {card['id']}")
+
+    strings = bytearray()
+    offsets: dict[str, int] = {}
+
+    def string_offset(value: str | None) -> int:
+        if value is None:
+            return NULL_STRING
+        offset = offsets.get(value)
+        if offset is None:
+            data = value.encode("utf-8")
+            if len(data) > MAX_STRING_BYTES:
+                raise ValueError(f"string longer than {MAX_STRING_BYTES} bytes: {value[:40]}...")
+            offset = offsets[value] = len(strings)
+            strings.extend(STRING_LENGTH.pack(len(data)))
+            strings.extend(data)
+        return offset
+
+    records = bytearray()
+    for card in cards:
+        if not 0 <= card["year"] <= 0xFFFF:
+            raise ValueError(f"card {card['id']}: year out of range: {card['year']}")
+        records.extend(RECORD.pack(card["id"], card["year"], 0, card["deezer_id"] or 0,
+                                   *(string_offset(card[name]) for name in STRING_FIELDS)))
+
+    strings_offset = HEADER.size + len(records)
+    body = bytes(records) + bytes(strings)
+    header = HEADER.pack(MAGIC, VERSION, 0, len(cards), RECORD.size,
+                         strings_offset, len(strings), zlib.crc32(body), 0)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(header + body)
+    tmp_path.replace(path)
+    return len(cards)
+
+
+class CardBundle:
+    """Read-only, memory-mapped view of a card bundle."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, _, self.card_count, record_size, self._strings,
+         self._strings_size, self.checksum, _) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path}: not a card bundle (version {VERSION})")
+        if record_size != RECORD.size:
+            raise ValueError(f"{self.path}: unexpected record size {record_size}")
+
+    def __len__(self) -> int:
+        return self.card_count
+
+    def __iter__(self):
+        for index in range(self.card_count):
+            yield self.card(index)
+
+    def _string(self, offset: int) -> str | None:
+        if offset == NULL_STRING:
+            return None
+        start = self._strings + offset
+        (length,) = STRING_LENGTH.unpack_from(self._map, start)
+        start += STRING_LENGTH.size
+        return self._map[start:start + length].decode("utf-8")
+
+    def _id_at(self, index: int) -> int:
+        return struct.unpack_from("<I", self._map, HEADER.size + index * RECORD.size)[0]
+
+    def card(self, index: int) -> dict:
+        card_id, year, _, deezer_id, *strings = RECORD.unpack_from(self._map, HEADER.size + index * RECORD.size)
+        card = {"id": card_id, "year": year, "deezer_id": deezer_id or None}
+        for name, offset in zip(STRING_FIELDS, strings):
+            card[name] = self._string(offset)
+        return card
+
+    def get(self, card_id) -> dict | None:
+        """The card with this id (42, "42" or "00042"), or None."""
+        try:
+            wanted = hitster_id(card_id)
+        except ValueError:
+            return None
+
+        low, high = 0, self.card_count
+        while low < high:
+            middle = (low + high) // 2
+            found = self._id_at(middle)
+            if found < wanted:
+                low = middle + 1
+            elif found > wanted:
+                high = middle
+            else:
+                return self.card(middle)
+        return None
+
+    def check_integrity(self) -> bool:
+        """Whether the stored CRC-32 matches the records and strings."""
+        end = self._strings + self._strings_size
+        return zlib.crc32(self._map[HEADER.size:end]) == self.checksum
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def verify_bundle(path: str | Path, cards) -> list[str]:
+    """Compare a bundle with the cards it was built from. Returns the problems found."""
+
+    expected = {card["id"]: card for card in map(bundle_fields, cards)}
+    problems = []
+
+    with CardBundle(path) as bundle:
+        if not bundle.check_integrity():
+            problems.append("checksum mismatch")
+        if len(bundle) != len(expected):
+            problems.append(f"{len(bundle)} cards in the bundle, {len(expected)} expected")
+
+        previous = None
+        for card in bundle:
+            if previous is not None and card["id"] <= previous:
+                problems.append(f"card {card['id']}: records not sorted by id")
+            previous = card["id"]
+
+            if expected.get(card["id"]) != card:
+                problems.append(f"card {card['id']}: {card} != {expected.get(card['id'])}")
+
+        for card_id, card in expected.items():
+            if bundle.get(card_id) != card:
+                problems.append(f"card {card_id}: lookup failed")
+
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact binary bundle of Hitster cards.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser("build", help="Pack merged card shards into a bundle")
+    add_input_arguments(build_parser)
+    build_parser.add_argument("-o", "--output", required=True)
+
+    get_parser = commands.add_parser("get", help="Look up one card")
+    get_parser.add_argument("bundle")
+    get_parser.add_argument("card_id")
+
+    verify_parser = commands.add_parser("verify", help="Round-trip check against the source cards")
+    verify_parser.add_argument("bundle")
+    add_input_arguments(verify_parser)
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        try:
+            count = write_bundle(load_merged_cards(args), args.output)
+        except CardError as e:
+            raise SystemExit(f"Invalid card: {e}")
+        print(f"Packed {count} cards into {args.output} ({Path(args.output).stat().st_size} bytes)")
+    elif args.command == "get":
+        with CardBundle(args.bundle) as bundle:
+            card = bundle.get(args.card_id)
+        if card is None:
+            print(f"No card {args.card_id}")
+            raise SystemExit(1)
+        print(json.dumps(card, ensure_ascii=False, indent=2))
+    else:
+        try:
+            problems = verify_bundle(args.bundle, load_merged_cards(args))
+        except CardError as e:
+            raise SystemExit(f"Invalid card: {e}")
+        for problem in problems:
+            print(problem)
+        if problems:
+            raise SystemExit(1)
+        print(f"{args.bundle}: OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Streaming input and output for card files.
+Cards are read one at a time from JSON arrays or NDJSON and written to JSON,
+NDJSON and CSV as they are produced, optionally gzip-compressed.
+"""
+
+import csv
+import gzip
+import io
+import json
+from pathlib import Path
+
+from card_model import CSV_FIELDS, FIELDS, Card, CardError
+
+
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+READ_CHUNK = 64 * 1024
+
+
+def open_text(path: str | Path, mode: str = "r"):
+    """Open a text file, transparently (de)compressing `.gz` paths."""
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8", newline="")
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def is_ndjson(path: str | Path) -> bool:
+    name = str(path)
+    if name.endswith(".gz"):
+        name = name[:-3]
+    return name.endswith(NDJSON_SUFFIXES)
+
+
+def iter_json_array(f: io.TextIOBase):
+    """Yield the items of a top-level JSON array without loading it whole."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    eof = False
+    started = False
+
+    while True:
+        buffer = buffer.lstrip()
+        if not started and buffer:
+            if buffer[0] != "[":
+                raise ValueError("Expected a JSON array")
+            buffer = buffer[1:].lstrip()
+            started = True
+        if started and buffer.startswith(","):
+            buffer = buffer[1:].lstrip()
+        if started and buffer.startswith("]"):
+            return
+
+        if buffer:
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                yield item
+                buffer = buffer[end:]
+                continue
+        elif eof:
+            raise ValueError("Unexpected end of JSON array")
+
+        chunk = f.read(READ_CHUNK)
+        if not chunk:
+            eof = True
+        buffer += chunk
+
+
+def card_sort_key(card: Card | dict):
+    """Numeric ids sort numerically, anything else after them as text."""
+    card_id = card.get("id")
+    try:
+        return 0, int(card_id), ""
+    except (TypeError, ValueError):
+        return 1, 0, str(card_id)
+
+
+def read_cards(path: str | Path):
+    """Yield cards from a JSON array or NDJSON file (optionally `.gz`)."""
+    with open_text(path) as f:
+        if is_ndjson(path):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from iter_json_array(f)
+
+
+def load_cards(path: str | Path):
+    """Yield validated Card records from a card file; errors name the card's position."""
+    for number, data in enumerate(read_cards(path), 1):
+        try:
+            yield Card.from_dict(data)
+        except CardError as e:
+            raise CardError(f"{path}: card {number}: {e}") from None
+
+
+class CardWriter:
+    """Write cards incrementally to JSON, NDJSON and/or CSV.
+
+    Every card is flushed as soon as it is written, so the NDJSON and CSV
+    files can be read while a run is still going. The CSV columns default to
+    the input and Deezer fields, followed by the first card's keys outside the
+    card schema (such as expected_id) unless `extra_columns` is off; other
+    keys only appear in the JSON outputs.
+    """
+
+    def __init__(self, output_base: str, formats=("json", "ndjson", "csv"),
+                 fieldnames: list[str] | None = None, compress: bool = False,
+                 extra_columns: bool = True):
+        suffix = ".gz" if compress else ""
+        self.paths = {fmt: f"{output_base}_deezer.{fmt}{suffix}" for fmt in formats}
+        self.count = 0
+        self.matched = 0
+
+        self._fieldnames = list(fieldnames) if fieldnames else list(CSV_FIELDS)
+        self._extra_columns = extra_columns
+        self._files = {fmt: open_text(path, "w") for fmt, path in self.paths.items()}
+        self._csv_writer = None
+
+        if "json" in self._files:
+            self._files["json"].write("[")
+
+    def write(self, card: Card | dict):
+        record = card.to_dict() if isinstance(card, Card) else card
+
+        if "json" in self._files:
+            f = self._files["json"]
+            item = json.dumps(record, ensure_ascii=False, indent=2)
+            f.write(("," if self.count else "") + "\n  " + item.replace("\n", "\n  "))
+
+        if "ndjson" in self._files:
+            f = self._files["ndjson"]
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+
+        if "csv" in self._files:
+            if self._csv_writer is None:
+                if self._extra_columns:
+                    self._fieldnames += [key for key in record
+                                         if key not in FIELDS and key not in self._fieldnames]
+                self._csv_writer = csv.DictWriter(self._files["csv"], fieldnames=self._fieldnames,
+                                                  extrasaction="ignore")
+                self._csv_writer.writeheader()
+            self._csv_writer.writerow(record)
+            self._files["csv"].flush()
+
+        self.count += 1
+        if record.get("deezer_id") or record.get("match_provider"):
+            self.matched += 1
+
+    def close(self):
+        if "json" in self._files:
+            self._files["json"].write("\n]" if self.count else "]")
+        for f in self._files.values():
+            f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Merge stage for matched card shards.
+
+Discovers any number of shard files by glob or manifest, loads them in
+parallel, and k-way merges them by id. Identical duplicates are dropped;
+duplicates that disagree are reported and the first shard (in discovery
+order) wins. Both Kotlin generators and the bundle builder read their cards
+through here.
+
+    python card_merge.py --shards 'tmp/*/hitster-cards_deezer.json' -o merged.json
+    python card_merge.py --manifest packs.txt --strict
+"""
+
+import argparse
+import glob
+import heapq
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from card_io import card_sort_key, is_ndjson, load_cards, open_text
+from card_model import Card, CardError
+
+
+DEFAULT_SHARD_PATTERN = "tmp/*/hitster-cards_deezer.json"
+LOAD_WORKERS = 8
+
+
+class Conflict:
+    """Cards sharing an id whose contents differ."""
+
+    def __init__(self, card_id, kept: tuple[str, Card]):
+        self.card_id = card_id
+        self.kept = kept
+        self.dropped: list[tuple[str, Card]] = []
+
+    def fields(self) -> list[str]:
+        """Names of the fields that differ from the kept card."""
+        kept = self.kept[1]
+        return sorted({key for _, card in self.dropped
+                       for key in kept.keys() | card.keys() if kept.get(key) != card.get(key)})
+
+    def describe(self) -> str:
+        sources = ", ".join(path for path, _ in self.dropped)
+        return f"id {self.card_id}: {self.kept[0]} kept over {sources} (differs in {', '.join(self.fields())})"
+
+
+class MergeResult:
+    def __init__(self):
+        self.cards: list[Card] = []
+        self.loaded: dict[str, int] = {}
+        self.duplicates = 0
+        self.conflicts: list[Conflict] = []
+
+
+def read_manifest(path: str | Path) -> list[str]:
+    """Shard paths from a manifest, relative to the manifest's directory.
+
+    The manifest is a JSON array of paths (or an object with a "shards"
+    array), or plain text with one path or glob per line and # comments.
+    """
+    path = Path(path)
+    text = path.read_text(encoding="utf-8")
+
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        entries = [line.split("#", 1)[0].strip() for line in text.splitlines()]
+    else:
+        entries = data["shards"] if isinstance(data, dict) else data
+
+    return [str(path.parent / entry) for entry in entries if entry]
+
+
+def discover_shards(patterns=(), manifests=()) -> list[str]:
+    """Expand globs and manifest entries into existing shard paths, in order, without repeats."""
+    candidates = list(patterns)
+    for manifest in manifests:
+        candidates.extend(read_manifest(manifest))
+
+    paths = []
+    for candidate in candidates:
+        if glob.has_magic(candidate):
+            matches = sorted(glob.glob(candidate))
+        elif Path(candidate).exists():
+            matches = [candidate]
+        else:
+            print(f"Warning: {candidate} not found")
+            continue
+        for match in matches:
+            if match not in paths:
+                paths.append(match)
+    return paths
+
+
+def load_shard(path: str) -> list[Card]:
+    """All cards of one shard, sorted by id for the merge."""
+    return sorted(load_cards(path), key=card_sort_key)
+
+
+def merge_shards(paths: list[str], workers: int = LOAD_WORKERS) -> MergeResult:
+    """Load `paths` in parallel and merge them into one list sorted by id."""
+
+    result = MergeResult()
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(paths)))) as executor:
+        shards = list(executor.map(load_shard, paths))
+
+    for path, cards in zip(paths, shards):
+        result.loaded[path] = len(cards)
+
+    # Ties on the id keep discovery order, so the first shard's card comes first
+    tagged = ([(card_sort_key(card), rank, path, card) for card in cards]
+              for rank, (path, cards) in enumerate(zip(paths, shards)))
+    last_key = kept = conflict = None
+
+    for key, _, path, card in heapq.merge(*tagged, key=lambda item: (item[0], item[1])):
+        if key != last_key:
+            result.cards.append(card)
+            last_key, kept, conflict = key, (path, card), None
+            continue
+
+        result.duplicates += 1
+        if card == kept[1]:
+            continue
+
+        if conflict is None:
+            conflict = Conflict(card.id, kept)
+            result.conflicts.append(conflict)
+        conflict.dropped.append((path, card))
+
+    return result
+
+
+def add_input_arguments(parser: argparse.ArgumentParser):
+    """Shard selection options shared by the card generators."""
+    parser.add_argument("--shards", action="append", metavar="GLOB",
+                        help=f"Matched card files, repeatable (default: {DEFAULT_SHARD_PATTERN})")
+    parser.add_argument("--manifest", action="append", default=[], metavar="PATH",
+                        help="File listing shard paths or globs (JSON array or one per line)")
+    parser.add_argument("--strict", action="store_true",
+                        help="Fail if shards disagree on a card")
+
+
+def load_merged_cards(args: argparse.Namespace) -> list[Card]:
+    """Discover, load and merge the shards selected on the command line, printing a report."""
+
+    patterns = args.shards or ([] if args.manifest else [DEFAULT_SHARD_PATTERN])
+    paths = discover_shards(patterns, args.manifest)
+    if not paths:
+        raise SystemExit(f"No card shards found ({', '.join(patterns + args.manifest)})")
+
+    try:
+        result = merge_shards(paths)
+    except CardError as e:
+        raise SystemExit(f"Invalid card: {e}")
+
+    for path, count in result.loaded.items():
+        print(f"Loaded {count} cards from {path}")
+    print(f"\nTotal cards: {len(result.cards)}"
+          f" ({result.duplicates} duplicates, {len(result.conflicts)} conflicting)")
+    for conflict in result.conflicts:
+        print(f"  Conflict: {conflict.describe()}")
+
+    if result.conflicts and args.strict:
+        raise SystemExit(f"{len(result.conflicts)} conflicting cards")
+    return result.cards
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge matched card shards by id.")
+    add_input_arguments(parser)
+    parser.add_argument("-o", "--output", help="Write the merged cards here (.json or .ndjson)")
+    args = parser.parse_args()
+
+    cards = load_merged_cards(args)
+
+    if args.output:
+        with open_text(args.output, "w") as f:
+            if is_ndjson(args.output):
+                for card in cards:
+                    f.write(card.to_json() + "\n")
+            else:
+                json.dump([card.to_dict() for card in cards], f, ensure_ascii=False, indent=2)
+        print(f"\nMerged cards written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Typed card record shared by the matcher and the card generators.
+
+A Card keeps the known fields in __slots__ instead of a per-card dict, and
+validates them when they are set, so the scripts can use plain attribute
+access (card.title, card.deezer_id). A field that is not set reads as None
+but is left out of the serialised card, so a card written back out has
+exactly the keys it was read with (plus the ones the matcher added), in
+schema order. Unknown keys are kept in `extra`.
+
+Cards also answer the read-only dict methods (get, [], in, keys, items),
+so code written against plain card dicts keeps working.
+"""
+
+import json
+
+
+# Written by hitster_ocr.py
+INPUT_FIELDS = ("id", "title", "artist", "year")
+
+# Written by the matcher, per catalog it searches (see match_providers.py)
+PROVIDER_FIELDS = {
+    "deezer": ("deezer_match", "deezer_id", "deezer_title", "deezer_artist", "deezer_album",
+               "deezer_link", "deezer_preview", "duration_sec"),
+    "spotify": ("spotify_id", "spotify_title", "spotify_artist", "spotify_album",
+                "spotify_link", "spotify_preview"),
+    "youtube": ("youtube_id", "youtube_title", "youtube_artist", "youtube_channel", "youtube_link"),
+}
+
+# Written by the matcher; everything else on a card is input. match_provider
+# names the catalog whose match was accepted when several were searched.
+RESULT_FIELDS = (*PROVIDER_FIELDS["deezer"], *PROVIDER_FIELDS["spotify"],
+                 *PROVIDER_FIELDS["youtube"], "match_provider")
+
+# Card schema in output order
+FIELDS = INPUT_FIELDS + RESULT_FIELDS
+
+# Default CSV columns; the matcher adds the other catalogs' fields when it searches them
+CSV_FIELDS = INPUT_FIELDS + PROVIDER_FIELDS["deezer"]
+
+
+class CardError(ValueError):
+    """A card that does not fit the schema."""
+
+
+def _card_id(value):
+    if isinstance(value, bool) or not isinstance(value, (int, str)) or value == "":
+        raise CardError(f"expected a number or a non-empty string, not {value!r}")
+    return value
+
+
+def _optional_text(value):
+    if value is not None and not isinstance(value, str):
+        raise CardError(f"expected a string or null, not {value!r}")
+    return value
+
+
+def _ocr_text(value):
+    # OCR output sometimes misses a title or artist, or reads one as a number;
+    # the matcher skips cards without them
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return _optional_text(value)
+
+
+def _optional_int(value):
+    if value is None or (isinstance(value, int) and not isinstance(value, bool)):
+        return value
+    raise CardError(f"expected an integer or null, not {value!r}")
+
+
+def _year(value):
+    # OCR output sometimes has the year as text
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    return _optional_int(value)
+
+
+_VALIDATORS = {
+    "id": _card_id,
+    "title": _ocr_text,
+    "artist": _ocr_text,
+    "year": _year,
+    "deezer_match": _optional_text,
+    "deezer_id": _optional_int,
+    "deezer_title": _optional_text,
+    "deezer_artist": _optional_text,
+    "deezer_album": _optional_text,
+    "deezer_link": _optional_text,
+    "deezer_preview": _optional_text,
+    "duration_sec": _optional_int,
+    **{name: _optional_text for name in (*PROVIDER_FIELDS["spotify"], *PROVIDER_FIELDS["youtube"])},
+    "match_provider": _optional_text,
+}
+
+_REQUIRED = ("id", "title", "artist")
+
+# Types that pass their field's validator unchanged, checked inline when reading
+_NONE = type(None)
+_PLAIN_TYPES = {
+    "title": (str, _NONE),
+    "artist": (str, _NONE),
+    "year": (int, _NONE),
+    "deezer_match": (str, _NONE),
+    "deezer_id": (int, _NONE),
+    "duration_sec": (int, _NONE),
+    **{name: (str, _NONE) for name in ("deezer_title", "deezer_artist", "deezer_album",
+                                       "deezer_link", "deezer_preview")},
+    **{name: (str, _NONE) for name in (*PROVIDER_FIELDS["spotify"], *PROVIDER_FIELDS["youtube"],
+                                       "match_provider")},
+}
+
+# Presence bit of every field, see Card._present
+_BITS = {name: 1 << i for i, name in enumerate(FIELDS)}
+_INPUT_MASK = sum(_BITS[name] for name in INPUT_FIELDS)
+
+
+class Card:
+    """One Hitster card with its optional catalog matches.
+
+    Unset fields hold None; `_present` has a bit per field that was set,
+    which is what `in`, keys() and the serialised form go by.
+    """
+
+    __slots__ = FIELDS + ("extra", "_present")
+
+    def __init__(self, **fields):
+        _clear(self)
+        self.update(fields)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Card":
+        """Validate a decoded JSON object and build a card from it."""
+        if not isinstance(data, dict):
+            raise CardError(f"expected a JSON object, not {type(data).__name__}")
+
+        card = cls.__new__(cls)
+        _clear(card)
+        present = 0
+        for key, value in data.items():
+            bit = _BITS.get(key)
+            if bit is None:
+                if card.extra is None:
+                    _SETTERS["extra"](card, {})
+                card.extra[key] = value
+                continue
+            if type(value) not in _PLAIN_TYPES.get(key, ()):
+                try:
+                    value = _VALIDATORS[key](value)
+                except CardError as e:
+                    raise CardError(f"{key}: {e}") from None
+            _SETTERS[key](card, value)
+            present |= bit
+        _SETTERS["_present"](card, present)
+
+        for name in _REQUIRED:
+            if not card._present & _BITS[name]:
+                raise CardError(f"missing {name!r}")
+        return card
+
+    def __setattr__(self, name, value):
+        validate = _VALIDATORS.get(name)
+        if validate is None:
+            raise AttributeError(f"Card has no field {name!r}")
+        try:
+            _SETTERS[name](self, validate(value))
+        except CardError as e:
+            raise CardError(f"{name}: {e}") from None
+        _SETTERS["_present"](self, self._present | _BITS[name])
+
+    def update(self, fields: dict):
+        """Set fields from a mapping, validating the known ones."""
+        present = self._present
+        for key, value in fields.items():
+            validate = _VALIDATORS.get(key)
+            if validate is None:
+                if self.extra is None:
+                    _SETTERS["extra"](self, {})
+                self.extra[key] = value
+                continue
+            try:
+                _SETTERS[key](self, validate(value))
+            except CardError as e:
+                raise CardError(f"{key}: {e}") from None
+            present |= _BITS[key]
+        _SETTERS["_present"](self, present)
+
+    def __contains__(self, key) -> bool:
+        bit = _BITS.get(key)
+        if bit is not None:
+            return bool(self._present & bit)
+        return self.extra is not None and key in self.extra
+
+    def __getitem__(self, key):
+        bit = _BITS.get(key)
+        if bit is not None:
+            if self._present & bit:
+                return _GETTERS[key](self)
+        elif self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def keys(self):
+        return self.to_dict().keys()
+
+    def __iter__(self):
+        return iter(self.to_dict())
+
+    def items(self):
+        return self.to_dict().items()
+
+    def to_dict(self) -> dict:
+        """The card as a JSON object: input fields, extra keys, then results."""
+        present = self._present
+        data = {name: get(self) for name, bit, get in _INPUT_ACCESS if present & bit}
+        if self.extra:
+            data.update(self.extra)
+        if present & ~_INPUT_MASK:
+            data.update({name: get(self) for name, bit, get in _RESULT_ACCESS if present & bit})
+        return data
+
+    def inputs(self) -> dict:
+        """Everything except the matcher's results."""
+        present = self._present
+        data = {name: get(self) for name, bit, get in _INPUT_ACCESS if present & bit}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def results(self) -> dict:
+        """The matcher's results that are set on this card."""
+        present = self._present
+        return {name: get(self) for name, bit, get in _RESULT_ACCESS if present & bit}
+
+    def __eq__(self, other):
+        if isinstance(other, (Card, dict)):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Card({', '.join(f'{key}={value!r}' for key, value in self.items())})"
+
+    def to_json(self, indent: int | None = None) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
+
+    @classmethod
+    def from_json(cls, text: str) -> "Card":
+        return cls.from_dict(json.loads(text))
+
+
+# Slot access that bypasses the validating __setattr__
+_SETTERS = {name: getattr(Card, name).__set__ for name in Card.__slots__}
+_GETTERS = {name: getattr(Card, name).__get__ for name in FIELDS}
+_INPUT_ACCESS = [(name, _BITS[name], _GETTERS[name]) for name in INPUT_FIELDS]
+_RESULT_ACCESS = [(name, _BITS[name], _GETTERS[name]) for name in RESULT_FIELDS]
+
+
+def _clear(card: Card):
+    for name in FIELDS:
+        _SETTERS[name](card, None)
+    _SETTERS["extra"](card, None)
+    _SETTERS["_present"](card, 0)
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Card lookup service backing HitsterCardRepository.
+
+Loads the merged matcher output (the same shards the Kotlin generators
+read) into an in-memory index and serves it over HTTP/1.1 with keep-alive:
+
+    GET  /cards/{id}          one card as HitsterCard JSON
+    GET  /cards?ids=1,2,3     several cards at once, e.g. to prefetch a deck
+    POST /cards/batch         the same with {"ids": [...]} as body
+    GET  /health              card count and version of the loaded set
+    GET  /metrics             request counters in Prometheus text format
+
+Ids are normalized like getCardById() does (padStart(5, '0')). Every
+response carries an ETag; a request whose If-None-Match still matches gets
+304 Not Modified. Bodies and ETags are encoded once at load time.
+
+New or changed shards are picked up on SIGHUP or, with --watch, by polling
+the shard files. A reload builds a complete new index next to the old one
+and swaps it in, so requests in flight never see a half-loaded set and
+nothing is dropped; a reload that fails keeps the old set.
+
+    python card_server.py --shards 'tmp/*/hitster-cards_deezer.json' --watch 5
+    curl -i localhost:8780/cards/42
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+from email.utils import formatdate
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from card_merge import DEFAULT_SHARD_PATTERN, add_input_arguments, discover_shards, merge_shards
+from card_model import Card, CardError
+from kotlin_codegen import card_id
+from matcher_metrics import Metrics
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8780
+
+# Same padding as MockHitsterCardRepository.getCardById()
+ID_LENGTH = 5
+MAX_BATCH = 1000
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 256 * 1024
+# Idle keep-alive connections are closed after this many seconds
+IDLE_TIMEOUT = 30.0
+
+REASONS = {
+    200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 413: "Payload Too Large", 431: "Request Header Fields Too Large",
+}
+
+
+def normalize_id(value: str) -> str:
+    """Kotlin's cardId.padStart(5, '0'): pad short ids, leave longer ones alone."""
+    return value.strip().rjust(ID_LENGTH, "0")
+
+
+def card_payload(card: Card) -> dict:
+    """The card as the app's HitsterCard, in its JSON field names."""
+    return {
+        "hitsterId": card_id(card),
+        "title": card.title,
+        "artist": card.artist,
+        "year": card.year or 0,
+        "deezerId": card.deezer_id or None,
+        "deezerTitle": card.deezer_title,
+        "deezerArtist": card.deezer_artist,
+        "deezerAlbum": card.deezer_album,
+    }
+
+
+def make_etag(*parts: bytes) -> bytes:
+    digest = hashlib.blake2b(digest_size=10)
+    for part in parts:
+        digest.update(part)
+    return b'"' + digest.hexdigest().encode() + b'"'
+
+
+def etag_matches(header: str | None, etag: bytes) -> bool:
+    """Weak comparison of an If-None-Match header against `etag`."""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    wanted = etag.decode()
+    return any(tag.strip().removeprefix("W/") == wanted for tag in header.split(","))
+
+
+class CardIndex:
+    """Immutable snapshot of the card set with pre-encoded bodies and ETags."""
+
+    def __init__(self, cards: list[Card], sources: list[str]):
+        self.entries: dict[str, tuple[bytes, bytes]] = {}
+        for card in cards:
+            body = json.dumps(card_payload(card), ensure_ascii=False, separators=(",", ":")).encode()
+            self.entries[card_id(card)] = (body, make_etag(body))
+
+        ids = sorted(self.entries, key=lambda hitster_id: (len(hitster_id), hitster_id))
+        self.sources = sources
+        self.version = make_etag(*(self.entries[i][1] for i in ids)).decode().strip('"')
+        self.loaded_at = time.time()
+        self.health = json.dumps({
+            "cards": len(ids), "version": self.version, "sources": len(sources),
+            "first": ids[0] if ids else None, "last": ids[-1] if ids else None,
+            "loaded_at": formatdate(self.loaded_at, usegmt=True),
+        }).encode()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def batch(self, ids: list[str]) -> tuple[bytes, bytes]:
+        """Body and ETag for the cards with `ids`.
+
+        The body is {"cards": {id: card}, "etags": {id: etag}, "missing": [...]},
+        so a client can revalidate each prefetched card on its own later.
+        """
+        found = []
+        missing = []
+        for hitster_id in dict.fromkeys(map(normalize_id, ids)):
+            entry = self.entries.get(hitster_id)
+            if entry is None:
+                missing.append(hitster_id)
+            else:
+                found.append((hitster_id, entry))
+
+        cards = b",".join(b'"%s":%s' % (hitster_id.encode(), body) for hitster_id, (body, _) in found)
+        etags = b",".join(b'"%s":%s' % (hitster_id.encode(), json.dumps(etag.decode()).encode())
+                          for hitster_id, (_, etag) in found)
+        body = b'{"cards":{%s},"etags":{%s},"missing":%s}' % (cards, etags, json.dumps(missing).encode())
+        etag = make_etag(*(etag for _, (_, etag) in found), json.dumps(missing).encode())
+        return body, etag
+
+
+def load_index(patterns: list[str], manifests: list[str], strict: bool = False) -> CardIndex:
+    """Discover, merge and index the shards; the first shard wins on conflicts unless `strict`."""
+    paths = discover_shards(patterns, manifests)
+    if not paths:
+        raise FileNotFoundError(f"No card shards found ({', '.join(patterns + manifests)})")
+    result = merge_shards(paths)
+    if result.conflicts and strict:
+        raise ValueError(f"{len(result.conflicts)} conflicting cards, e.g. {result.conflicts[0].describe()}")
+    return CardIndex(result.cards, paths)
+
+
+def shard_signature(patterns: list[str], manifests: list[str]) -> tuple:
+    """Paths, sizes and modification times of the shards; changes when a pack does."""
+    signature = []
+    for path in discover_shards(patterns, manifests):
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            continue
+        signature.append((path, stat.st_size, stat.st_mtime_ns))
+    return tuple(signature)
+
+
+class Response:
+    __slots__ = ("status", "body", "etag", "headers")
+
+    def __init__(self, status: int, body: bytes = b"", etag: bytes | None = None, headers: tuple = ()):
+        self.status = status
+        self.body = body
+        self.etag = etag
+        self.headers = headers
+
+
+def error(status: int, message: str, headers: tuple = ()) -> Response:
+    return Response(status, json.dumps({"error": message}).encode(), headers=headers)
+
+
+class CardServer:
+    """Asyncio HTTP/1.1 server over the current CardIndex."""
+
+    def __init__(self, index: CardIndex, patterns: list[str], manifests: list[str], strict: bool = False):
+        self.index = index
+        self.patterns = patterns
+        self.manifests = manifests
+        self.strict = strict
+        self.metrics = Metrics()
+        self._reload_lock = asyncio.Lock()
+        self._signature = shard_signature(patterns, manifests)
+        self._date = (0, b"")
+
+    async def reload(self, reason: str) -> bool:
+        """Build a new index in a worker process and swap it in. Returns whether it changed."""
+        async with self._reload_lock:
+            start = time.perf_counter()
+            # A failed reload is retried when the shards change again, not on every poll
+            self._signature = await asyncio.to_thread(shard_signature, self.patterns, self.manifests)
+            try:
+                # A separate process keeps the parsing off the event loop's GIL
+                with ProcessPoolExecutor(max_workers=1) as pool:
+                    index = await asyncio.get_running_loop().run_in_executor(
+                        pool, load_index, self.patterns, self.manifests, self.strict)
+            except (OSError, ValueError, CardError) as e:
+                self.metrics.inc("card_reloads", outcome="error")
+                print(f"Reload ({reason}) failed, keeping {len(self.index)} cards: {e}")
+                return False
+
+            changed = index.version != self.index.version
+            self.index = index
+            self.metrics.inc("card_reloads", outcome="changed" if changed else "unchanged")
+            print(f"Reload ({reason}): {len(index)} cards from {len(index.sources)} shards, "
+                  f"version {index.version} in {time.perf_counter() - start:.2f} s")
+            return changed
+
+    async def watch(self, interval: float):
+        """Reload whenever a shard appears, disappears or changes."""
+        while True:
+            await asyncio.sleep(interval)
+            signature = await asyncio.to_thread(shard_signature, self.patterns, self.manifests)
+            if signature != self._signature:
+                await self.reload("shards changed")
+
+    def route(self, method: str, target: str, headers: dict, body: bytes) -> Response:
+        url = urlsplit(target)
+        path = url.path
+        index = self.index
+
+        if path.startswith("/cards/") and path != "/cards/batch":
+            if method not in ("GET", "HEAD"):
+                return error(405, "method not allowed", ((b"Allow", b"GET, HEAD"),))
+            entry = index.entries.get(normalize_id(unquote(path[len("/cards/"):])))
+            if entry is None:
+                return error(404, "card not found")
+            return self.conditional(headers, *entry)
+
+        if path == "/cards" or path == "/cards/batch":
+            if path == "/cards" and method in ("GET", "HEAD"):
+                ids = [i for value in parse_qs(url.query).get("ids", []) for i in value.split(",") if i.strip()]
+            elif path == "/cards/batch" and method == "POST":
+                try:
+                    data = json.loads(body or b"null")
+                    ids = data["ids"] if isinstance(data, dict) else data
+                    if not isinstance(ids, list):
+                        raise ValueError
+                    ids = [str(i) for i in ids]
+                except (ValueError, KeyError, TypeError):
+                    return error(400, 'expected {"ids": [...]}')
+            else:
+                allow = b"GET, HEAD" if path == "/cards" else b"POST"
+                return error(405, "method not allowed", ((b"Allow", allow),))
+            if not ids:
+                return error(400, "no ids given")
+            if len(ids) > MAX_BATCH:
+                return error(413, f"at most {MAX_BATCH} ids per request")
+            return self.conditional(headers, *index.batch(ids))
+
+        if path == "/health" and method in ("GET", "HEAD"):
+            return Response(200, index.health)
+        if path == "/metrics" and method in ("GET", "HEAD"):
+            return Response(200, self.metrics.prometheus_text().encode(),
+                            headers=((b"Content-Type", b"text/plain; version=0.0.4"),))
+        return error(404, "not found")
+
+    @staticmethod
+    def conditional(headers: dict, body: bytes, etag: bytes) -> Response:
+        if etag_matches(headers.get("if-none-match"), etag):
+            return Response(304, etag=etag)
+        return Response(200, body, etag)
+
+    def http_date(self) -> bytes:
+        now = int(time.time())
+        if self._date[0] != now:
+            self._date = (now, formatdate(now, usegmt=True).encode())
+        return self._date[1]
+
+    def encode(self, response: Response, head_only: bool, keep_alive: bool) -> bytes:
+        lines = [b"HTTP/1.1 %d %s" % (response.status, REASONS[response.status].encode()),
+                 b"Date: " + self.http_date(),
+                 b"Connection: " + (b"keep-alive" if keep_alive else b"close")]
+        if response.etag is not None:
+            lines.append(b"ETag: " + response.etag)
+            lines.append(b"Cache-Control: no-cache")
+        if not any(name == b"Content-Type" for name, _ in response.headers):
+            lines.append(b"Content-Type: application/json; charset=utf-8")
+        lines.extend(name + b": " + value for name, value in response.headers)
+        if response.status != 304:
+            lines.append(b"Content-Length: %d" % len(response.body))
+        head = b"\r\n".join(lines) + b"\r\n\r\n"
+        return head if head_only else head + response.body
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), IDLE_TIMEOUT)
+                except asyncio.LimitOverrunError:
+                    writer.write(self.encode(error(431, "request headers too large"), False, False))
+                    break
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+
+                start = time.perf_counter()
+                request_line, *header_lines = head[:-4].decode("latin-1").split("\r\n")
+                headers = {}
+                for line in header_lines:
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    method, target, version = request_line.split(" ")
+                    length = int(headers.get("content-length") or 0)
+                    if length < 0:
+                        raise ValueError(length)
+                except ValueError:
+                    writer.write(self.encode(error(400, "malformed request"), False, False))
+                    break
+                if length > MAX_BODY_BYTES:
+                    writer.write(self.encode(error(413, "request body too large"), False, False))
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                response = self.route(method, target, headers, body)
+                writer.write(self.encode(response, method == "HEAD", keep_alive))
+                self.metrics.inc("card_requests", status=str(response.status))
+                self.metrics.observe("card_request_seconds", time.perf_counter() - start)
+
+                if not keep_alive:
+                    break
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(args: argparse.Namespace, patterns: list[str]):
+    index = await asyncio.to_thread(load_index, patterns, args.manifest, args.strict)
+    server = CardServer(index, patterns, args.manifest, args.strict)
+
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGHUP, lambda: asyncio.ensure_future(server.reload("SIGHUP")))
+    if args.watch:
+        asyncio.ensure_future(server.watch(args.watch))
+
+    listener = await asyncio.start_server(server.handle, args.host, args.port,
+                                          limit=MAX_HEADER_BYTES, backlog=1024, reuse_address=True)
+    print(f"Serving {len(index)} cards from {len(index.sources)} shards on "
+          f"http://{args.host}:{listener.sockets[0].getsockname()[1]} (version {index.version})", flush=True)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve merged cards over HTTP for HitsterCardRepository.")
+    add_input_arguments(parser)
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Address to listen on (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument("--watch", type=float, metavar="SECONDS",
+                        help="Poll the shards this often and reload when they change")
+    args = parser.parse_args()
+
+    patterns = args.shards or ([] if args.manifest else [DEFAULT_SHARD_PATTERN])
+    try:
+        asyncio.run(serve(args, patterns))
+    except (FileNotFoundError, ValueError) as e:
+        raise SystemExit(str(e))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
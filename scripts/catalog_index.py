@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Offline catalog index of Deezer tracks.
+
+Builds an inverted trigram index over the normalized title and artist of every
+track payload seen in earlier searches, so cards can be matched without the
+network. The index is a single file that is memory-mapped at load.
+
+Build from the search cache:
+    python catalog_index.py build
+Query it:
+    python catalog_index.py query "Africa" "Toto"
+
+File layout (little-endian):
+    header   magic "HCIX", version u16, reserved u16, track count u32,
+             key count u32, then the offsets of the sections below as u64
+    keys     key count x (trigram hash u32, postings start u32, postings count u32),
+             sorted by hash
+    postings u32 track numbers
+    offsets  (track count + 1) x u64 offsets into the track data
+    tracks   compact JSON payloads, one after the other
+"""
+
+import argparse
+import json
+import mmap
+import struct
+import zlib
+from collections import Counter
+from pathlib import Path
+
+from deezer_cache import DEFAULT_CACHE_PATH, ResponseCache
+from match_providers import CACHE_KEY_PREFIXES
+from match_scoring import ACCEPT_CONFIDENCE, best_candidate, normalize
+
+
+DEFAULT_INDEX_PATH = DEFAULT_CACHE_PATH.with_name("catalog.idx")
+
+MAGIC = b"HCIX"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIQQQQ")
+KEY = struct.Struct("<III")
+
+# Candidates passed to the scoring engine per lookup
+CANDIDATES = 20
+# Posting lists longer than this ("  th", "ove") are skipped once rarer
+# trigrams have produced candidates
+MAX_POSTINGS = 5000
+
+# Only the payload fields the matcher reads are stored
+TRACK_FIELDS = ("id", "title", "link", "preview", "duration", "release_date", "rank")
+
+
+def trigrams(text: str) -> set[str]:
+    """Trigrams of a normalized string, padded so short words still index."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def trigram_hash(trigram: str) -> int:
+    return zlib.crc32(trigram.encode("utf-8"))
+
+
+def track_text(track: dict) -> str:
+    artist = (track.get("artist") or {}).get("name") or ""
+    return f"{normalize(track.get('title') or '')} {normalize(artist)}"
+
+
+def compact_track(track: dict) -> dict:
+    compact = {k: track[k] for k in TRACK_FIELDS if track.get(k) is not None}
+    artist = track.get("artist") or {}
+    album = track.get("album") or {}
+    compact["artist"] = {k: artist[k] for k in ("id", "name") if k in artist}
+    compact["album"] = {k: album[k] for k in ("id", "title", "release_date") if k in album}
+    return compact
+
+
+def build_index(tracks, output_path: str | Path) -> int:
+    """Write an index over `tracks` (deduplicated by id). Returns the track count."""
+
+    payloads = []
+    seen = set()
+    postings: dict[int, list[int]] = {}
+
+    for track in tracks:
+        track_id = track.get("id")
+        if not track_id or track_id in seen or not track.get("title"):
+            continue
+        seen.add(track_id)
+
+        number = len(payloads)
+        payloads.append(json.dumps(compact_track(track), ensure_ascii=False,
+                                   separators=(",", ":")).encode("utf-8"))
+        for key in {trigram_hash(t) for t in trigrams(track_text(track))}:
+            postings.setdefault(key, []).append(number)
+
+    keys = sorted(postings)
+    keys_offset = HEADER.size
+    postings_offset = keys_offset + KEY.size * len(keys)
+    total_postings = sum(len(p) for p in postings.values())
+    offsets_offset = postings_offset + 4 * total_postings
+    tracks_offset = offsets_offset + 8 * (len(payloads) + 1)
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(payloads), len(keys),
+                            keys_offset, postings_offset, offsets_offset, tracks_offset))
+
+        start = 0
+        for key in keys:
+            f.write(KEY.pack(key, start, len(postings[key])))
+            start += len(postings[key])
+        for key in keys:
+            f.write(struct.pack(f"<{len(postings[key])}I", *postings[key]))
+
+        position = 0
+        for payload in payloads:
+            f.write(struct.pack("<Q", position))
+            position += len(payload)
+        f.write(struct.pack("<Q", position))
+        for payload in payloads:
+            f.write(payload)
+
+    tmp_path.replace(output_path)
+    return len(payloads)
+
+
+class CatalogIndex:
+    """Read-only, memory-mapped view of a catalog index file."""
+
+    def __init__(self, path: str | Path = DEFAULT_INDEX_PATH):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, _, self.track_count, self.key_count, self._keys,
+         self._postings, self._offsets, self._tracks) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path}: not a catalog index (version {VERSION})")
+
+    def __len__(self) -> int:
+        return self.track_count
+
+    def _find_key(self, key: int) -> tuple[int, int] | None:
+        """Binary search the key table. Returns (postings start, count)."""
+        low, high = 0, self.key_count
+        while low < high:
+            middle = (low + high) // 2
+            found, start, count = KEY.unpack_from(self._map, self._keys + middle * KEY.size)
+            if found < key:
+                low = middle + 1
+            elif found > key:
+                high = middle
+            else:
+                return start, count
+        return None
+
+    def track(self, number: int) -> dict:
+        start, end = struct.unpack_from("<QQ", self._map, self._offsets + number * 8)
+        return json.loads(self._map[self._tracks + start:self._tracks + end])
+
+    def candidates(self, title: str, artist: str, limit: int = CANDIDATES) -> list[dict]:
+        """Tracks sharing the most trigrams with the title and artist."""
+        entries = []
+        for trigram in trigrams(f"{normalize(title or '')} {normalize(artist or '')}"):
+            entry = self._find_key(trigram_hash(trigram))
+            if entry is not None:
+                entries.append(entry)
+
+        votes = Counter()
+        for start, count in sorted(entries, key=lambda e: e[1]):
+            if count > MAX_POSTINGS and votes:
+                break
+            votes.update(struct.unpack_from(f"<{count}I", self._map, self._postings + start * 4))
+        return [self.track(number) for number, _ in votes.most_common(limit)]
+
+    def best_match(self, title: str, artist: str, year: int = None) -> tuple[float, dict] | None:
+        """Most confident local candidate, or None if nothing shares a trigram."""
+        return best_candidate(self.candidates(title, artist), title, artist, year)
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+def iter_cached_tracks(cache_path: str | Path):
+    """Deezer track payloads from the search cache; other providers' searches and album dates are skipped."""
+    cache = ResponseCache(cache_path)
+    try:
+        for results in cache.iter_payloads(skip_prefixes=CACHE_KEY_PREFIXES):
+            yield from results
+    finally:
+        cache.close()
+
+
+def iter_file_tracks(path: str | Path):
+    """Track payloads from a JSON array or NDJSON file."""
+    with open(path, "r", encoding="utf-8") as f:
+        if str(path).endswith((".ndjson", ".jsonl")):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline catalog index of Deezer tracks.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser("build", help="Build the index from the search cache")
+    build_parser.add_argument("--cache", default=str(DEFAULT_CACHE_PATH))
+    build_parser.add_argument("--tracks", action="append", default=[],
+                              help="Additional track payloads (JSON array or NDJSON)")
+    build_parser.add_argument("-o", "--output", default=str(DEFAULT_INDEX_PATH))
+
+    query_parser = commands.add_parser("query", help="Look up a title and artist")
+    query_parser.add_argument("title")
+    query_parser.add_argument("artist")
+    query_parser.add_argument("--year", type=int)
+    query_parser.add_argument("--index", default=str(DEFAULT_INDEX_PATH))
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        def all_tracks():
+            if Path(args.cache).exists():
+                yield from iter_cached_tracks(args.cache)
+            for path in args.tracks:
+                yield from iter_file_tracks(path)
+
+        count = build_index(all_tracks(), args.output)
+        print(f"Indexed {count} tracks into {args.output}")
+    else:
+        index = CatalogIndex(args.index)
+        best = index.best_match(args.title, args.artist, args.year)
+        if best is None:
+            print("No candidates")
+        else:
+            confidence, track = best
+            status = "accept" if confidence >= ACCEPT_CONFIDENCE else "low confidence"
+            print(f"{confidence:.2f} ({status}): {track['artist'].get('name')} - {track['title']} [{track['id']}]")
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
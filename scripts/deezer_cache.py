@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Response caching for Deezer search queries.
+ResponseCache stores results in a single SQLite file, keyed on the normalized
+query and limit; QueryMemo deduplicates queries within one run.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "hitit" / "deezer_search.sqlite"
+DEFAULT_TTL_DAYS = 30
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query for use as a cache key.
+
+    Deezer search ignores case and repeated whitespace, so those do not
+    produce separate entries.
+    """
+    return " ".join(query.casefold().split())
+
+
+class ResponseCache:
+    """SQLite-backed search cache with a TTL and LRU eviction to a size cap."""
+
+    def __init__(self, path: str | Path = DEFAULT_CACHE_PATH,
+                 ttl: float = DEFAULT_TTL_DAYS * 86400,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                query TEXT NOT NULL,
+                lim INTEGER NOT NULL,
+                payload TEXT NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL,
+                PRIMARY KEY (query, lim)
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self._db.commit()
+        self._count = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, query: str, limit: int, allow_stale: bool = False) -> list | None:
+        """Return cached results, or None on a miss or an expired entry."""
+        key = normalize_query(query)
+        now = time.time()
+
+        with self._lock:
+            row = self._db.execute(
+                "SELECT payload, created FROM responses WHERE query = ? AND lim = ?",
+                (key, limit),
+            ).fetchone()
+
+            if row is None or (not allow_stale and now - row[1] > self.ttl):
+                self.misses += 1
+                return None
+
+            self._db.execute(
+                "UPDATE responses SET accessed = ? WHERE query = ? AND lim = ?",
+                (now, key, limit),
+            )
+            self._db.commit()
+            self.hits += 1
+
+        return json.loads(row[0])
+
+    def put(self, query: str, limit: int, results: list):
+        """Store results and evict the least recently used entries over the cap."""
+        key = normalize_query(query)
+        now = time.time()
+        payload = json.dumps(results, ensure_ascii=False, separators=(",", ":"))
+
+        with self._lock:
+            cursor = self._db.execute(
+                "UPDATE responses SET payload = ?, created = ?, accessed = ? WHERE query = ? AND lim = ?",
+                (payload, now, now, key, limit),
+            )
+            if cursor.rowcount == 0:
+                self._db.execute(
+                    "INSERT INTO responses (query, lim, payload, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                    (key, limit, payload, now, now),
+                )
+                self._count += 1
+
+            if self._count > self.max_entries:
+                excess = self._count - self.max_entries
+                self._db.execute(
+                    "DELETE FROM responses WHERE rowid IN "
+                    "(SELECT rowid FROM responses ORDER BY accessed LIMIT ?)",
+                    (excess,),
+                )
+                self._count -= excess
+
+            self._db.commit()
+
+    def iter_payloads(self, skip_prefixes: tuple[str, ...] = ()):
+        """Yield every cached result list, including expired ones.
+
+        Entries whose key starts with one of `skip_prefixes` are left out.
+        """
+        with self._lock:
+            rows = self._db.execute("SELECT query, payload FROM responses").fetchall()
+        for query, payload in rows:
+            if not query.startswith(skip_prefixes):
+                yield json.loads(payload)
+
+    def purge_expired(self) -> int:
+        """Delete expired entries. Returns the number removed."""
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM responses WHERE created < ?", (time.time() - self.ttl,))
+            self._db.commit()
+            self._count -= cursor.rowcount
+        return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class QueryMemo:
+    """In-run memo of search results with single-flight for concurrent callers.
+
+    The first caller for a normalized query runs the fetch; callers arriving
+    while it is in flight wait for that result instead of sending their own
+    request. Failures are shared with the waiters but not memoized, so a
+    later call retries.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.coalesced = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._results: dict[tuple[str, int], list] = {}
+        self._inflight: dict[tuple[str, int], Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    @property
+    def saved(self) -> int:
+        """Calls answered without running the fetch."""
+        return self.hits + self.coalesced
+
+    def get_or_fetch(self, query: str, limit: int, fetch) -> tuple[list, str]:
+        """Results for the query and how they were obtained: "hit", "coalesced" or "miss"."""
+        key = (normalize_query(query), limit)
+
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                return self._results[key], "hit"
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not owner:
+            return future.result(), "coalesced"
+
+        try:
+            results = fetch()
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._results[key] = results
+            del self._inflight[key]
+        future.set_result(results)
+        return results, "miss"
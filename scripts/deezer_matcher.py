@@ -1,105 +1,460 @@
 #!/usr/bin/env python3
 """
 Deezer Matcher for Hitster Cards
-Takes extracted card data and finds matching Deezer tracks.
+Takes extracted card data and finds matching Deezer tracks. With --providers,
+Spotify and YouTube are searched at the same time (see match_providers.py).
 """
 
-import json
-import csv
+import argparse
+import asyncio
+import collections
+import contextlib
+import itertools
+import os
+import random
+import threading
 import time
-import urllib.parse
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from artist_batch import DEFAULT_MIN_CARDS, ArtistTracks, group_by_artist
+from card_io import CardWriter, load_cards
+from card_model import CSV_FIELDS, INPUT_FIELDS, PROVIDER_FIELDS, Card, CardError
+from catalog_index import DEFAULT_INDEX_PATH, CatalogIndex
+from deezer_cache import DEFAULT_CACHE_PATH, DEFAULT_MAX_ENTRIES, DEFAULT_TTL_DAYS, QueryMemo, ResponseCache
+from match_journal import MatchJournal, input_fingerprint
+from match_scoring import ACCEPT_CONFIDENCE, MIN_CONFIDENCE, YEAR_WEIGHT, release_year, score_candidates
+from match_providers import ALBUM_CACHE_PREFIX, PROVIDERS, Provider, ProviderError
+from matcher_metrics import METRICS
+from rate_limiter import SharedTokenBucket, TokenBucket
 
-DEEZER_API_BASE = "https://api.deezer.com"
+
+# Overridable to point the matcher at a local stand-in server
+DEEZER_API_BASE = os.environ.get("DEEZER_API_BASE", "https://api.deezer.com")
+
+# Deezer allows 50 requests per 5 seconds. Every search request takes a token,
+# so the fallback strategies are paced as well.
+DEEZER_QUOTA_REQUESTS = 50
+DEEZER_QUOTA_PERIOD = 5.0
+DEEZER_RATE_LIMITER = TokenBucket.for_quota(DEEZER_QUOTA_REQUESTS, DEEZER_QUOTA_PERIOD)
+
+# Searches kept in flight by the async matcher
+DEFAULT_CONCURRENCY = 8
+# Finished cards the async matcher may hold back to keep the output in order,
+# per unit of concurrency
+ORDER_WINDOW = 4
+
+REQUEST_TIMEOUT = 10
+# Deezer reports an exceeded quota as HTTP 200 with {"error": {"code": 4, ...}}
+QUOTA_ERROR_CODE = 4
+QUOTA_RETRIES = 5
+# Seconds to wait after the first quota error, doubled on every further one
+QUOTA_BACKOFF = 1.0
+# Albums looked up per search at most to settle close candidates by year
+ALBUM_YEAR_LOOKUPS = 3
+
+
+class DeezerApiError(ProviderError):
+    """Deezer could not give a definitive answer (transport or API error)."""
+
+
+class DeezerQuotaError(DeezerApiError):
+    """The quota was still exceeded after all retries."""
+
+# Optional on-disk response cache, see set_response_cache()
+_response_cache: ResponseCache | None = None
+_offline = False
+
+# In-run memo and single-flight of search queries, see set_query_memo()
+_memo: QueryMemo | None = QueryMemo()
+
+# Optional offline catalog index, see set_catalog_index()
+_catalog: CatalogIndex | None = None
+
+# Tracks prefetched per artist in batch mode, see set_artist_tracks()
+_artist_tracks: ArtistTracks | None = None
+
+# Catalogs searched for every card, see set_providers(); None is Deezer alone
+_providers: list[Provider] | None = None
+
+# Speculative strategy cascade, see set_speculative(). The pool is shared
+# with the provider fan-out of search_providers().
+_speculative = False
+_speculation_pool: ThreadPoolExecutor | None = None
+_speculation_workers = DEFAULT_CONCURRENCY * 3
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def set_catalog_index(index: CatalogIndex | None):
+    """Check `index` before the API; only misses and low-confidence hits query Deezer."""
+    
+    global _catalog
+    _catalog = index
+
+
+def set_artist_tracks(tracks: ArtistTracks | None):
+    """Score cards against their artist's prefetched `tracks` before searching."""
+    
+    global _artist_tracks
+    _artist_tracks = tracks
+
+
+def set_speculative(enabled: bool, workers: int = DEFAULT_CONCURRENCY * 3):
+    """Run the fallback strategies of search_deezer in parallel with the first."""
+    
+    global _speculative, _speculation_workers
+    _speculative = enabled
+    _speculation_workers = workers
+
+
+def _get_speculation_pool() -> ThreadPoolExecutor:
+    global _speculation_pool
+    with _session_lock:
+        if _speculation_pool is None:
+            _speculation_pool = ThreadPoolExecutor(max_workers=_speculation_workers,
+                                                   thread_name_prefix="speculative")
+        return _speculation_pool
+
+
+def get_session() -> requests.Session:
+    """Shared keep-alive session with retries for transport and 5xx errors."""
+    
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({"GET"}),
+                respect_retry_after_header=True,
+            )
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=DEFAULT_CONCURRENCY * 4,
+                                  max_retries=retry)
+            _session = requests.Session()
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+def set_rate_limiter(limiter: TokenBucket | SharedTokenBucket):
+    """Replace the limiter every Deezer request draws from."""
+    
+    global DEEZER_RATE_LIMITER
+    DEEZER_RATE_LIMITER = limiter
+
+
+def set_response_cache(cache: ResponseCache | None, offline: bool = False):
+    """Route deezer_search through `cache`. With `offline`, never touch the network."""
+    
+    global _response_cache, _offline
+    _response_cache = cache
+    _offline = offline
+
+
+# Metric labels for the queries of search_queries(), in the same order
+STRATEGY_NAMES = ("artist_track", "artist_title", "title_only")
+
+
+def set_query_memo(memo: QueryMemo | None):
+    """Answer repeated and concurrent identical queries from `memo` (None disables it)."""
+    
+    global _memo
+    _memo = memo
+
+
+def search_queries(title: str, artist: str) -> list[str]:
+    """Search queries in order of preference."""
+    
+    return [
+        # Strategy 1: Search with artist and title
+        f'artist:"{artist}" track:"{title}"',
+        # Strategy 2: Simpler search without quotes
+        f"{artist} {title}",
+        # Strategy 3: Just title (for covers or compilation issues)
+        title,
+    ]
 
 
 def search_deezer(title: str, artist: str, year: int = None) -> dict | None:
-    """Search Deezer for a track and return best match."""
+    """Search Deezer for a track and return best match.
+    
+    The offline catalog index and the artist's prefetched tracks (batch
+    mode) are checked first. A local hit or a strategy
+    whose best result reaches ACCEPT_CONFIDENCE ends the search. Otherwise the
+    fallbacks are tried as well and the most confident result overall wins,
+    as long as it reaches MIN_CONFIDENCE.
+    """
+    
+    best, strategy = _local_candidate(title, artist, year)
+    if best and best[0] >= ACCEPT_CONFIDENCE:
+        return _accepted(best, strategy)
+    
+    queries = search_queries(title, artist)
     
-    # Strategy 1: Search with artist and title
-    query = f'artist:"{artist}" track:"{title}"'
-    results = deezer_search(query)
+    if _speculative:
+        return _search_speculative(queries, title, artist, year, best)
     
-    if results:
-        return pick_best_match(results, title, artist, year)
+    for query, name in zip(queries, STRATEGY_NAMES):
+        candidate = _best_candidate(deezer_search(query), title, artist, year)
+        
+        if candidate and (best is None or candidate[0] > best[0]):
+            best, strategy = candidate, name
+        if best and best[0] >= ACCEPT_CONFIDENCE:
+            break
     
-    # Strategy 2: Simpler search without quotes
-    query = f"{artist} {title}"
-    results = deezer_search(query)
+    return _accepted(best, strategy)
+
+
+def _local_candidate(title: str, artist: str, year: int = None) -> tuple[tuple[float, dict] | None, str]:
+    """Best candidate from the catalog index and the artist's prefetched tracks, and where it came from."""
     
-    if results:
-        return pick_best_match(results, title, artist, year)
+    best = None
+    strategy = "catalog"
     
-    # Strategy 3: Just title (for covers or compilation issues)
-    results = deezer_search(title)
+    if _catalog is not None:
+        best = _catalog.best_match(title, artist, year)
+        if best and best[0] >= ACCEPT_CONFIDENCE:
+            METRICS.inc("catalog_lookups", result="hit")
+            return best, strategy
+        METRICS.inc("catalog_lookups", result="miss")
     
-    if results:
-        return pick_best_match(results, title, artist, year)
+    tracks = _artist_tracks.get(artist) if _artist_tracks is not None else None
+    if tracks:
+        candidate = _best_candidate(tracks, title, artist, year)
+        if candidate and (best is None or candidate[0] > best[0]):
+            best, strategy = candidate, "artist"
+        if best and best[0] >= ACCEPT_CONFIDENCE:
+            METRICS.inc("artist_lookups", result="hit")
+            return best, strategy
+        METRICS.inc("artist_lookups", result="miss")
     
-    return None
+    return best, strategy
 
 
-def deezer_search(query: str, limit: int = 10) -> list:
-    """Execute a Deezer search query."""
+def _accepted(best: tuple[float, dict] | None, strategy: str) -> dict | None:
+    """The track of `best` if it is confident enough, counting the strategy that found it."""
     
-    url = f"{DEEZER_API_BASE}/search"
-    params = {
-        "q": query,
-        "limit": limit,
-    }
+    if best is None or best[0] < MIN_CONFIDENCE:
+        METRICS.inc("searches", strategy="none")
+        return None
+    METRICS.inc("searches", strategy=strategy)
+    return best[1]
+
+
+def _best_candidate(results: list, title: str, artist: str, year: int = None) -> tuple[float, dict] | None:
+    """Best scored candidate, looking up album years where they could change it.
     
+    Deezer's search results carry no release date, so the year only counts
+    once the album is known. Year proximity can cost a candidate up to
+    YEAR_WEIGHT of its confidence; when another candidate is closer than that
+    to the best one and some of them are undated, their albums are looked up
+    (at most ALBUM_YEAR_LOOKUPS) and the results scored again.
+    """
+    
+    scored = _score_candidates(results, title, artist, year)
+    if not scored or not year:
+        return scored[0] if scored else None
+    
+    floor = max(MIN_CONFIDENCE, scored[0][0] * (1 - YEAR_WEIGHT))
+    close = [track for confidence, track in scored if confidence >= floor]
+    undated = [album_id for album_id in dict.fromkeys((track.get("album") or {}).get("id")
+                                                      for track in close if release_year(track) is None)
+               if album_id is not None]
+    if len(close) < 2 or not undated:
+        return scored[0]
+    
+    dates = {album_id: album_release_date(album_id) for album_id in undated[:ALBUM_YEAR_LOOKUPS]}
+    dated = [_with_release_date(track, dates) for track in results]
+    return _score_candidates(dated, title, artist, year)[0]
+
+
+@METRICS.timed("pick_best_match")
+def _score_candidates(results: list, title: str, artist: str, year: int = None) -> list[tuple[float, dict]]:
+    return score_candidates(results, title, artist, year)
+
+
+def _with_release_date(track: dict, dates: dict) -> dict:
+    album = track.get("album") or {}
+    date = dates.get(album.get("id"))
+    if not date or release_year(track) is not None:
+        return track
+    return dict(track, album=dict(album, release_date=date))
+
+
+def album_release_date(album_id: int) -> str | None:
+    """Release date of a Deezer album, through the memo and the response cache.
+    
+    Offline runs only read the cache. A failed lookup is not remembered and
+    leaves the year unknown.
+    """
+    
+    key = f"{ALBUM_CACHE_PREFIX}{album_id}"
     try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        return data.get("data", [])
-    except requests.RequestException as e:
-        print(f"  Deezer API Fehler: {e}")
+        if _memo is None:
+            dates = _cached_album_dates(key, album_id)
+        else:
+            dates, outcome = _memo.get_or_fetch(key, 1, lambda: _cached_album_dates(key, album_id))
+            METRICS.inc("memo_lookups", result=outcome)
+    except DeezerApiError:
+        METRICS.inc("album_year_lookups", result="error")
+        return None
+    return dates[0] if dates else None
+
+
+def _cached_album_dates(key: str, album_id: int) -> list:
+    if _response_cache is not None:
+        cached = _response_cache.get(key, 1, allow_stale=_offline)
+        METRICS.inc("cache_lookups", result="hit" if cached is not None else "miss")
+        if cached is not None:
+            return cached
+    
+    if _offline:
         return []
+    
+    dates = [deezer_get(f"/album/{album_id}").get("release_date")]
+    METRICS.inc("album_year_lookups", result="fetched")
+    
+    if _response_cache is not None:
+        _response_cache.put(key, 1, dates)
+    
+    return dates
 
 
-def pick_best_match(results: list, title: str, artist: str, year: int = None) -> dict:
-    """Pick the best matching track from search results."""
+def _search_speculative(queries: list[str], title: str, artist: str, year: int = None,
+                        best: tuple[float, dict] | None = None) -> dict | None:
+    """Issue all strategies at once but keep the serial precedence.
+    
+    Every request that actually starts takes a rate limiter token; fallbacks
+    that have not started when an earlier strategy wins are cancelled, and
+    the results of those already running are discarded.
+    """
+    
+    futures = [_get_speculation_pool().submit(deezer_search, query) for query in queries]
+    strategy = "catalog"
     
-    title_lower = title.lower()
-    artist_lower = artist.lower()
+    try:
+        for future, name in zip(futures, STRATEGY_NAMES):
+            candidate = _best_candidate(future.result(), title, artist, year)
+            
+            if candidate and (best is None or candidate[0] > best[0]):
+                best, strategy = candidate, name
+            if best and best[0] >= ACCEPT_CONFIDENCE:
+                break
+        
+        return _accepted(best, strategy)
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def deezer_get(path: str, params: dict | None = None) -> dict:
+    """GET a Deezer API endpoint through the rate limiter and shared session.
     
-    scored_results = []
+    Quota errors are retried with exponential backoff and slow the limiter
+    down. Anything that is not a definitive answer raises DeezerApiError.
+    """
     
-    for track in results:
-        score = 0
-        track_title = track.get("title", "").lower()
-        track_artist = track.get("artist", {}).get("name", "").lower()
+    url = f"{DEEZER_API_BASE}{path}"
+    endpoint = path.split("/")[1]
+    
+    for attempt in range(QUOTA_RETRIES + 1):
+        waited = DEEZER_RATE_LIMITER.acquire()
+        if waited:
+            METRICS.inc("rate_limiter_wait_seconds", waited)
+        
+        start = time.perf_counter()
+        try:
+            response = get_session().get(url, params=params, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            data = response.json()
+        except (requests.RequestException, ValueError) as e:
+            METRICS.inc("deezer_requests", endpoint=endpoint, outcome="error")
+            raise DeezerApiError(f"{path}: {e}") from e
+        finally:
+            METRICS.observe("deezer_request_seconds", time.perf_counter() - start, endpoint=endpoint)
         
-        # Title match
-        if title_lower == track_title:
-            score += 100
-        elif title_lower in track_title or track_title in title_lower:
-            score += 50
+        # Retries urllib3 made inside this one call (transport errors, 429, 5xx)
+        retries = getattr(getattr(response, "raw", None), "retries", None)
+        if retries is not None and retries.history:
+            METRICS.inc("deezer_retries", len(retries.history), kind="transport")
         
-        # Artist match
-        if artist_lower == track_artist:
-            score += 100
-        elif artist_lower in track_artist or track_artist in artist_lower:
-            score += 50
+        error = data.get("error") if isinstance(data, dict) else None
+        if not error:
+            METRICS.inc("deezer_requests", endpoint=endpoint, outcome="ok")
+            DEEZER_RATE_LIMITER.on_success()
+            return data
         
-        # Prefer non-live, non-remix versions
-        if "live" not in track_title and "remix" not in track_title:
-            score += 10
+        code = error.get("code")
+        if code != QUOTA_ERROR_CODE:
+            METRICS.inc("deezer_requests", endpoint=endpoint, outcome="api_error")
+            raise DeezerApiError(f"{path}: {error.get('message')} (code {code})", code)
         
-        scored_results.append((score, track))
+        METRICS.inc("deezer_requests", endpoint=endpoint, outcome="throttled")
+        DEEZER_RATE_LIMITER.on_throttle()
+        if attempt < QUOTA_RETRIES:
+            METRICS.inc("deezer_retries", kind="quota")
+            time.sleep(QUOTA_BACKOFF * 2 ** attempt * random.uniform(1.0, 1.5))
+    
+    raise DeezerQuotaError(f"{path}: Quota nach {QUOTA_RETRIES} Wiederholungen überschritten",
+                           QUOTA_ERROR_CODE)
+
+
+@METRICS.timed("deezer_search")
+def deezer_search(query: str, limit: int = 10) -> list:
+    """Execute a Deezer search query.
+    
+    Within a run, a query is sent at most once: repeats are answered from the
+    memo and identical queries already in flight share that request.
+    """
+    
+    return provider_search(DEEZER, query, limit)
+
+
+def provider_search(provider: Provider, query: str, limit: int = 10) -> list:
+    """Search one catalog through the memo and the response cache."""
+    
+    key = provider.cache_key(query)
+    if _memo is None:
+        return _cached_search(provider, key, query, limit)
     
-    # Sort by score descending
-    scored_results.sort(key=lambda x: x[0], reverse=True)
+    results, outcome = _memo.get_or_fetch(key, limit, lambda: _cached_search(provider, key, query, limit))
+    METRICS.inc("memo_lookups", result=outcome)
+    return results
+
+
+def _cached_search(provider: Provider, key: str, query: str, limit: int) -> list:
+    if _response_cache is not None:
+        # Offline runs have nothing better than a stale answer
+        cached = _response_cache.get(key, limit, allow_stale=_offline)
+        METRICS.inc("cache_lookups", result="hit" if cached is not None else "miss")
+        if cached is not None:
+            return cached
+    
+    if _offline:
+        return []
     
-    if scored_results:
-        return scored_results[0][1]
+    results = provider.fetch(query, limit)
     
-    return results[0] if results else None
+    if _response_cache is not None:
+        _response_cache.put(key, limit, results)
+    
+    return results
 
 
+def pick_best_match(results: list, title: str, artist: str, year: int = None) -> dict:
+    """Pick the best matching track from search results."""
+    
+    best = _best_candidate(results, title, artist, year)
+    return best[1] if best else None
+
+
+@METRICS.timed("format_deezer_result")
 def format_deezer_result(track: dict) -> dict:
     """Extract relevant fields from Deezer track."""
     
@@ -114,93 +469,617 @@ def format_deezer_result(track: dict) -> dict:
     }
 
 
-def match_cards_with_deezer(cards: list[dict]) -> list[dict]:
-    """Match all cards with Deezer tracks."""
+class DeezerProvider(Provider):
+    """Deezer as one of several providers; draws from DEEZER_RATE_LIMITER."""
     
-    matched_cards = []
+    name = "deezer"
+    label = "Deezer"
     
-    for i, card in enumerate(cards, 1):
-        print(f"[{i}/{len(cards)}] {card['artist']} - {card['title']} ({card['year']})")
-        
-        if card.get('title') == 'UNLESBAR' or card.get('artist') == 'UNLESBAR':
-            print("  → Übersprungen (unlesbar)")
-            card['deezer_match'] = None
-            matched_cards.append(card)
-            continue
+    @property
+    def limiter(self):
+        return DEEZER_RATE_LIMITER
+    
+    def queries(self, title: str, artist: str) -> list[str]:
+        return search_queries(title, artist)
+    
+    def cache_key(self, query: str) -> str:
+        # Deezer queries keep the cache keys they had before there were other providers
+        return query
+    
+    def fetch(self, query: str, limit: int) -> list[dict]:
+        return deezer_get("/search", {"q": query, "limit": limit}).get("data", [])
+    
+    def format_result(self, track: dict) -> dict:
+        return format_deezer_result(track)
+
+
+DEEZER = DeezerProvider()
+
+
+def make_providers(names: list[str]) -> list[Provider]:
+    """Providers by name, in the given order.
+    
+    Raises ProviderError for unknown names and missing credentials.
+    """
+    
+    providers = []
+    for name in names:
+        if name == "deezer":
+            providers.append(DEEZER)
+        elif name in PROVIDERS:
+            providers.append(PROVIDERS[name]())
+        else:
+            raise ProviderError(f"Unbekannter Anbieter: {name} (möglich: deezer, {', '.join(PROVIDERS)})")
+    return providers
+
+
+def set_providers(providers: list[Provider] | None):
+    """Search all of `providers` for every card; None (or Deezer alone) is the plain Deezer search."""
+    
+    global _providers
+    _providers = None if not providers or providers == [DEEZER] else list(providers)
+
+
+def search_providers(title: str, artist: str, year: int = None) -> tuple[dict, dict]:
+    """Search every configured provider for a track at the same time.
+    
+    A confident hit in Deezer's local catalog index or prefetched artist
+    tracks settles the card without any request. Otherwise the first query of
+    every provider is sent at once, then the second query of those that have
+    one, and so on, until some provider's best result reaches
+    ACCEPT_CONFIDENCE. Going round by round keeps the outcome independent of
+    which provider answers first.
+    
+    Returns the best (confidence, track) per provider name that reaches
+    MIN_CONFIDENCE, and the ProviderError per provider that failed.
+    """
+    
+    best = {}
+    errors = {}
+    
+    if DEEZER in _providers:
+        local, _ = _local_candidate(title, artist, year)
+        if local:
+            best[DEEZER.name] = local
+    
+    queries = {provider.name: provider.queries(title, artist) for provider in _providers}
+    
+    for step in itertools.count():
+        if any(candidate[0] >= ACCEPT_CONFIDENCE for candidate in best.values()):
+            break
+        searches = [(provider, queries[provider.name][step]) for provider in _providers
+                    if provider.name not in errors and step < len(queries[provider.name])]
+        if not searches:
+            break
         
-        match = search_deezer(card['title'], card['artist'], card.get('year'))
+        # The calling thread runs the first search itself
+        futures = [_get_speculation_pool().submit(_search_or_error, *search) for search in searches[1:]]
+        outcomes = [_search_or_error(*searches[0]), *(future.result() for future in futures)]
         
-        if match:
-            deezer_info = format_deezer_result(match)
+        for (provider, _), results in zip(searches, outcomes):
+            if isinstance(results, ProviderError):
+                errors[provider.name] = results
+                continue
+            candidate = _best_candidate(results, title, artist, year)
+            if candidate and (provider.name not in best or candidate[0] > best[provider.name][0]):
+                best[provider.name] = candidate
+    
+    best = {name: candidate for name, candidate in best.items() if candidate[0] >= MIN_CONFIDENCE}
+    for provider in _providers:
+        result = "error" if provider.name in errors else "hit" if provider.name in best else "miss"
+        METRICS.inc("provider_searches", provider=provider.name, result=result)
+    return best, errors
+
+
+def _search_or_error(provider: Provider, query: str) -> list | ProviderError:
+    try:
+        return provider_search(provider, query)
+    except ProviderError as e:
+        return e
+
+
+def card_label(card: Card) -> str:
+    """Short description of a card for progress output."""
+    
+    return f"{card.artist} - {card.title} ({card.year})"
+
+
+def is_unreadable(card: Card) -> bool:
+    return card.title in (None, 'UNLESBAR') or card.artist in (None, 'UNLESBAR')
+
+
+def _skip_unreadable(card: Card) -> list[str]:
+    """Leave an unreadable card unmatched. Returns the log lines for it."""
+    
+    card.deezer_match = None
+    if card.title is None or card.artist is None:
+        return ["  → Warnung: Titel oder Interpret fehlt, übersprungen (unlesbar)"]
+    return ["  → Übersprungen (unlesbar)"]
+
+
+def _invalid_result(provider: Provider, fields: dict) -> str | None:
+    """Why a provider's result does not fit the card schema, or None if it does.
+    
+    A malformed result (say, a foreign payload in the catalog index) counts
+    as no match instead of failing the run.
+    """
+    
+    try:
+        Card(**fields)
+    except CardError as e:
+        METRICS.inc("malformed_results", provider=provider.name)
+        return f"  → {provider.label}: Ungültiges Ergebnis verworfen ({e})"
+    return None
+
+
+def _match_card(card: Card) -> list[str]:
+    """Match a single card in place. Returns the log lines for it."""
+    
+    if is_unreadable(card):
+        return _skip_unreadable(card)
+    
+    match = search_deezer(card.title, card.artist, card.year)
+    lines = []
+    
+    if match:
+        deezer_info = format_deezer_result(match)
+        problem = _invalid_result(DEEZER, deezer_info)
+        if problem is None:
             card.update(deezer_info)
-            print(f"  → Gefunden: {deezer_info['deezer_artist']} - {deezer_info['deezer_title']}")
-            print(f"     {deezer_info['deezer_link']}")
+            return [
+                f"  → Gefunden: {deezer_info['deezer_artist']} - {deezer_info['deezer_title']}",
+                f"     {deezer_info['deezer_link']}",
+            ]
+        lines.append(problem)
+    
+    card.deezer_id = None
+    return lines + ["  → Kein Match gefunden"]
+
+
+def _match_card_providers(card: Card) -> tuple[list[str], bool]:
+    """Match a single card in place against every provider.
+    
+    Each provider's match goes into its own fields, and match_provider names
+    the most confident one. Returns the log lines and whether a provider failed.
+    """
+    
+    if is_unreadable(card):
+        return _skip_unreadable(card), False
+    
+    best, errors = search_providers(card.title, card.artist, card.year)
+    lines = []
+    
+    for provider in _providers:
+        if provider.name in best:
+            fields = provider.format_result(best[provider.name][1])
+            problem = _invalid_result(provider, fields)
+            if problem is None:
+                card.update(fields)
+                name = provider.name
+                lines.append(f"  → {provider.label}: {fields[f'{name}_artist']} - {fields[f'{name}_title']}")
+                lines.append(f"     {fields[f'{name}_link']}")
+                continue
+            del best[provider.name]
+            lines.append(problem)
+        
+        if provider.name in errors:
+            lines.append(f"  → {provider.label} API Fehler: {errors[provider.name]}")
         else:
-            card['deezer_id'] = None
-            print("  → Kein Match gefunden")
+            card.update({f"{provider.name}_id": None})
+            lines.append(f"  → {provider.label}: Kein Match gefunden")
+    
+    # Ties go to the provider listed first
+    matched = [provider.name for provider in _providers if provider.name in best]
+    card.match_provider = max(matched, key=lambda name: best[name][0]) if matched else None
+    return lines, bool(errors)
+
+
+def _journal_key(card: Card) -> tuple[str, str]:
+    """Journal key and fingerprint of a card.
+    
+    With several providers the fingerprint covers them as well, so changing
+    --providers matches the cards again.
+    """
+    
+    inputs = card.inputs()
+    if _providers is not None:
+        inputs = {**inputs, "_providers": [provider.name for provider in _providers]}
+    return str(card.id), input_fingerprint(inputs)
+
+
+def _journaled_match(previous: dict | None) -> bool:
+    if not previous:
+        return False
+    return bool(previous.get('deezer_id') if _providers is None else previous.get('match_provider'))
+
+
+def match_card(card: Card, journal: MatchJournal | None = None) -> list[str]:
+    """Match a single card in place, reusing and recording journal results.
+    
+    A journaled match is reused only while the card's input fields are
+    unchanged; cards without a match are always queried again. API errors
+    leave the card unmatched without journaling it, so a rerun retries it.
+    With several providers, an error of one provider keeps the others'
+    matches on the card but still leaves it out of the journal.
+    """
+    
+    if journal is not None:
+        key, fingerprint = _journal_key(card)
         
-        matched_cards.append(card)
+        previous = journal.lookup(key, fingerprint)
+        if _journaled_match(previous):
+            card.update(previous)
+            METRICS.inc("cards", outcome="journal")
+            prefix = previous['match_provider'] if _providers is not None else "deezer"
+            return [f"  → Aus Journal: {previous[f'{prefix}_artist']} - {previous[f'{prefix}_title']}"]
+    
+    start = time.perf_counter()
+    failed = False
+    try:
+        if _providers is None:
+            lines = _match_card(card)
+        else:
+            lines, failed = _match_card_providers(card)
+    except DeezerApiError as e:
+        card.deezer_id = None
+        METRICS.inc("cards", outcome="error")
+        return [f"  → Deezer API Fehler: {e}"]
+    finally:
+        METRICS.observe("card_seconds", time.perf_counter() - start)
+    
+    result = 'deezer_id' if _providers is None else 'match_provider'
+    if card.get(result):
+        METRICS.inc("cards", outcome="matched")
+    elif failed:
+        METRICS.inc("cards", outcome="error")
+    else:
+        METRICS.inc("cards", outcome="skipped" if result not in card else "unmatched")
+    
+    if journal is not None and not failed:
+        journal.record(key, fingerprint, card.results())
+    return lines
+
+
+def prefetch_artists(cards: list[Card], journal: MatchJournal | None = None,
+                     workers: int = DEFAULT_CONCURRENCY, min_cards: int = DEFAULT_MIN_CARDS) -> ArtistTracks:
+    """Fetch the tracks of every artist with at least `min_cards` undecided cards.
+    
+    Cards the journal already answers and unreadable cards do not count.
+    An artist whose requests fail is left to the per-card search.
+    """
+    
+    def undecided(card):
+        if is_unreadable(card):
+            return False
+        if journal is None:
+            return True
+        return not _journaled_match(journal.lookup(*_journal_key(card)))
+    
+    groups = group_by_artist(filter(undecided, cards), min_cards)
+    tracks = ArtistTracks()
+    
+    def fetch(group):
+        try:
+            resolved = tracks.fetch(deezer_get, group)
+        except DeezerApiError as e:
+            METRICS.inc("artist_prefetch", outcome="error")
+            print(f"  → Künstler {group[0].artist}: Deezer API Fehler: {e}")
+            return 0
+        METRICS.inc("artist_prefetch", outcome="complete" if resolved == len(group) else "partial")
+        return resolved
+    
+    with METRICS.timer("artist_prefetch"), ThreadPoolExecutor(max_workers=workers) as executor:
+        resolved = sum(executor.map(fetch, groups.values()))
+    
+    print(f"Künstler-Vorabruf: {len(groups)} Künstler mit {sum(map(len, groups.values()))} Karten, "
+          f"{resolved} davon vorab gefunden, {tracks.requests} Anfragen")
+    return tracks
+
+
+def _progress(i: int, total: int | None) -> str:
+    return f"[{i}/{total}]" if total is not None else f"[{i}]"
+
+
+def iter_match_cards(cards, journal: MatchJournal | None = None, total: int | None = None):
+    """Match cards one after another, yielding each as soon as it is decided."""
+    
+    for i, card in enumerate(cards, 1):
+        print(f"{_progress(i, total)} {card_label(card)}")
+        
+        for line in match_card(card, journal):
+            print(line)
         
-        # Rate limiting: Deezer allows 50 requests per 5 seconds
-        time.sleep(0.15)
+        yield card
+
+
+async def iter_match_cards_async(cards, concurrency: int = DEFAULT_CONCURRENCY,
+                                 journal: MatchJournal | None = None, total: int | None = None):
+    """Match up to `concurrency` cards at a time, yielding them in input order.
+    
+    Requests still go through DEEZER_RATE_LIMITER, and per-card results are the
+    same as in iter_match_cards. Input is consumed lazily: at most
+    ORDER_WINDOW * concurrency cards are in flight or waiting for a slower
+    predecessor.
+    """
+    
+    loop = asyncio.get_running_loop()
+    pending = collections.deque()
+    
+    async def finish():
+        i, card, future = pending.popleft()
+        lines = await future
+        print("\n".join([f"{_progress(i, total)} {card_label(card)}", *lines]))
+        return card
+    
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        try:
+            for i, card in enumerate(cards, 1):
+                pending.append((i, card, loop.run_in_executor(executor, match_card, card, journal)))
+                if len(pending) >= ORDER_WINDOW * concurrency:
+                    yield await finish()
+            
+            while pending:
+                yield await finish()
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+
+
+def match_cards_with_deezer(cards: list[Card], journal: MatchJournal | None = None) -> list[Card]:
+    """Match all cards with Deezer tracks."""
     
-    return matched_cards
+    return list(iter_match_cards(cards, journal, total=len(cards)))
 
 
-def save_matched_results(cards: list[dict], output_base: str):
+async def match_cards_with_deezer_async(cards: list[Card],
+                                        concurrency: int = DEFAULT_CONCURRENCY,
+                                        journal: MatchJournal | None = None) -> list[Card]:
+    """Match all cards with up to `concurrency` cards in flight, keeping input order."""
+    
+    return [card async for card in iter_match_cards_async(cards, concurrency, journal, len(cards))]
+
+
+def print_summary(matched: int, total: int):
+    if total:
+        print(f"\nErgebnis: {matched}/{total} Karten gematcht ({matched/total*100:.1f}%)")
+
+
+def save_matched_results(cards: list[Card], output_base: str):
     """Save matched results to JSON and CSV."""
     
-    # JSON
-    json_path = f"{output_base}_deezer.json"
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(cards, f, ensure_ascii=False, indent=2)
-    print(f"\nJSON gespeichert: {json_path}")
-    
-    # CSV
-    csv_path = f"{output_base}_deezer.csv"
-    if cards:
-        # Get all possible fieldnames
-        fieldnames = list(cards[0].keys())
+    with CardWriter(output_base, formats=("json", "csv")) as writer:
         for card in cards:
-            for key in card.keys():
-                if key not in fieldnames:
-                    fieldnames.append(key)
+            writer.write(card)
+    
+    print(f"\nJSON gespeichert: {writer.paths['json']}")
+    print(f"CSV gespeichert: {writer.paths['csv']}")
+    print_summary(writer.matched, writer.count)
+
+
+def add_matching_arguments(parser: argparse.ArgumentParser):
+    """Options shared by every entry point that runs the matcher."""
+    
+    parser.add_argument("--gzip", action="store_true",
+                        help="Ausgabedateien gzip-komprimieren")
+    parser.add_argument("--providers", default="deezer",
+                        help="Kataloge, die für jede Karte gleichzeitig durchsucht werden, kommagetrennt: "
+                             f"deezer, {', '.join(PROVIDERS)} (Standard: deezer)")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="Mehrere Karten gleichzeitig abgleichen (gemeinsames Rate-Limit)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Gleichzeitige Karten im Async-Modus (Standard: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--speculative", action="store_true",
+                        help="Ausweich-Suchen parallel zur ersten Suche starten")
+    parser.add_argument("--by-artist", action="store_true",
+                        help="Titel von Künstlern mit mehreren Karten gesammelt abrufen "
+                             "(liest die ganze Eingabe vorab)")
+    parser.add_argument("--artist-min-cards", type=int, default=DEFAULT_MIN_CARDS,
+                        help=f"Mindestzahl Karten pro Künstler für den Sammelabruf (Standard: {DEFAULT_MIN_CARDS})")
+    parser.add_argument("--quota-file",
+                        help="Rate-Limit über diese Datei mit anderen Prozessen teilen")
+    parser.add_argument("--cache", default=str(DEFAULT_CACHE_PATH),
+                        help=f"SQLite-Cache für Suchanfragen (Standard: {DEFAULT_CACHE_PATH})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Suchanfragen nicht cachen")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_TTL_DAYS,
+                        help=f"Gültigkeit der Cache-Einträge in Tagen (Standard: {DEFAULT_TTL_DAYS})")
+    parser.add_argument("--cache-max", type=int, default=DEFAULT_MAX_ENTRIES,
+                        help=f"Maximale Anzahl Cache-Einträge (Standard: {DEFAULT_MAX_ENTRIES})")
+    parser.add_argument("--no-memo", action="store_true",
+                        help="Gleiche Suchanfragen innerhalb eines Laufs nicht zusammenfassen")
+    parser.add_argument("--no-journal", action="store_true",
+                        help="Kein Journal schreiben, alle Karten neu abgleichen")
+    parser.add_argument("--catalog", default=str(DEFAULT_INDEX_PATH),
+                        help=f"Lokaler Katalog-Index, wird zuerst gefragt (Standard: {DEFAULT_INDEX_PATH})")
+    parser.add_argument("--no-catalog", action="store_true",
+                        help="Lokalen Katalog-Index nicht verwenden")
+    parser.add_argument("--offline", action="store_true",
+                        help="Nur aus dem Cache antworten, keine Netzwerkzugriffe")
+    parser.add_argument("--metrics-json", metavar="PATH",
+                        help="Metriken (Zeiten, Anfragen, Cache-Trefferquoten) als JSON-Bericht schreiben")
+    parser.add_argument("--metrics-prom", metavar="PATH",
+                        help="Metriken als Prometheus-Textfile schreiben (node_exporter)")
+    parser.add_argument("--profile-dir", metavar="DIR",
+                        help="cProfile pro Stufe aufzeichnen und als <stufe>.prof hier ablegen")
+
+
+@contextlib.contextmanager
+def matching_session(args: argparse.Namespace, journal_path: str, compact_journal: bool = True):
+    """Configure the matcher from parsed options for one run.
+    
+    Yields the journal (or None) and closes the cache, catalog index,
+    journal and shared limiter afterwards.
+    """
+    
+    if args.offline and args.no_cache:
+        print("Fehler: --offline benötigt den Cache")
+        raise SystemExit(1)
+    
+    resources = contextlib.ExitStack()
+    
+    with resources:
+        resources.callback(write_metrics, args)
+        if args.profile_dir:
+            METRICS.enable_profiling(args.profile_dir)
         
-        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(cards)
-        print(f"CSV gespeichert: {csv_path}")
+        if args.quota_file:
+            limiter = SharedTokenBucket.for_quota(args.quota_file, DEEZER_QUOTA_REQUESTS, DEEZER_QUOTA_PERIOD)
+            resources.callback(limiter.close)
+            set_rate_limiter(limiter)
+        
+        if not args.no_cache:
+            cache = ResponseCache(args.cache, ttl=args.cache_ttl * 86400, max_entries=args.cache_max)
+            
+            def close_cache():
+                print(f"\nCache: {cache.hits} Treffer, {cache.misses} Fehlgriffe")
+                cache.close()
+            
+            resources.callback(close_cache)
+            set_response_cache(cache, offline=args.offline)
+        
+        try:
+            set_providers(make_providers(provider_names(args)))
+        except ProviderError as e:
+            print(f"Fehler: {e}")
+            raise SystemExit(1)
+        if _providers is not None:
+            print(f"Anbieter: {', '.join(provider.label for provider in _providers)}")
+        
+        set_speculative(args.speculative, workers=args.concurrency * 3)
+        
+        if args.no_memo:
+            set_query_memo(None)
+        else:
+            memo = QueryMemo()
+            
+            def report_memo():
+                if memo.saved:
+                    print(f"Memo: {memo.saved} Suchanfragen eingespart "
+                          f"({memo.coalesced} davon gleichzeitig gestellt)")
+            
+            resources.callback(report_memo)
+            set_query_memo(memo)
+        
+        if not args.no_catalog and Path(args.catalog).exists():
+            catalog = CatalogIndex(args.catalog)
+            resources.callback(catalog.close)
+            set_catalog_index(catalog)
+            print(f"Katalog-Index: {len(catalog)} Titel")
+        
+        journal = None
+        if not args.no_journal:
+            journal = MatchJournal(journal_path, compact_on_close=compact_journal)
+            resources.callback(journal.close)
+            if len(journal):
+                print(f"Journal: {len(journal)} Karten aus früheren Läufen")
+        
+        yield journal
+
+
+def provider_names(args: argparse.Namespace) -> list[str]:
+    return [name.strip() for name in args.providers.split(",") if name.strip()]
+
+
+def csv_fields(args: argparse.Namespace) -> list[str]:
+    """Default CSV columns: the input fields and those of every configured provider."""
     
-    # Summary
-    matched = sum(1 for c in cards if c.get('deezer_id'))
-    print(f"\nErgebnis: {matched}/{len(cards)} Karten gematcht ({matched/len(cards)*100:.1f}%)")
+    names = provider_names(args)
+    if names == ["deezer"]:
+        return list(CSV_FIELDS)
+    return [*INPUT_FIELDS, *(field for name in names for field in PROVIDER_FIELDS[name]), "match_provider"]
 
 
-def main():
-    import sys
+def write_metrics(args: argparse.Namespace, metrics=METRICS):
+    """Export `metrics` to the files requested on the command line."""
+    
+    if args.metrics_json:
+        metrics.write_json(args.metrics_json)
+        print(f"Metriken gespeichert: {args.metrics_json}")
+    if args.metrics_prom:
+        metrics.write_prometheus(args.metrics_prom)
+        print(f"Metriken gespeichert: {args.metrics_prom}")
+    for path in metrics.write_profiles():
+        print(f"Profil gespeichert: {path}")
+
+
+def match_to_writer(cards, writer: CardWriter, args: argparse.Namespace,
+                    journal: MatchJournal | None, total: int | None = None):
+    """Match `cards` with the configured mode and stream them into `writer`.
+    
+    Batch mode (--by-artist) reads all of `cards` before the first match.
+    """
     
-    if len(sys.argv) < 2:
-        print("Verwendung: python deezer_matcher.py <hitster_cards.json>")
-        print("\nNimmt die JSON-Ausgabe von hitster_ocr.py und findet Deezer-Matches.")
-        sys.exit(1)
+    if args.by_artist and not _offline and (_providers is None or DEEZER in _providers):
+        cards = list(cards)
+        set_artist_tracks(prefetch_artists(cards, journal, args.concurrency, args.artist_min_cards))
     
-    input_path = sys.argv[1]
+    try:
+        _match_to_writer(cards, writer, args, journal, total)
+    finally:
+        set_artist_tracks(None)
+
+
+def _match_to_writer(cards, writer: CardWriter, args: argparse.Namespace,
+                     journal: MatchJournal | None, total: int | None):
+    if args.use_async:
+        async def run():
+            async for card in iter_match_cards_async(cards, args.concurrency, journal, total):
+                writer.write(card)
+        
+        asyncio.run(run())
+    else:
+        for card in iter_match_cards(cards, journal, total):
+            writer.write(card)
+
+
+def output_base_for(input_path: str) -> str:
+    """Default output base name: the input file name without extensions."""
+    
+    return Path(input_path.removesuffix(".gz")).stem
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Nimmt die JSON-Ausgabe von hitster_ocr.py und findet Deezer-Matches.")
+    parser.add_argument("input_path", metavar="hitster_cards.json",
+                        help="Karten als JSON-Array oder NDJSON (auch .gz)")
+    parser.add_argument("-o", "--output",
+                        help="Basisname der Ausgabedateien (Standard: Name der Eingabedatei)")
+    parser.add_argument("--formats", default="json,ndjson,csv",
+                        help="Ausgabeformate, kommagetrennt (Standard: json,ndjson,csv)")
+    parser.add_argument("--csv-fields",
+                        help="CSV-Spalten, kommagetrennt (Standard: Eingabefelder, die Felder aller Anbieter "
+                             "und weitere Felder der ersten Karte)")
+    parser.add_argument("--journal",
+                        help="Journal für Zwischenergebnisse (Standard: <ausgabe>_deezer.journal.ndjson)")
+    add_matching_arguments(parser)
+    args = parser.parse_args()
+    
+    input_path = args.input_path
     
     if not Path(input_path).exists():
         print(f"Fehler: Datei nicht gefunden: {input_path}")
-        sys.exit(1)
-    
-    with open(input_path, 'r', encoding='utf-8') as f:
-        cards = json.load(f)
+        raise SystemExit(1)
     
-    print(f"Geladene Karten: {len(cards)}")
-    print("="*50)
+    output_base = args.output or output_base_for(input_path)
+    formats = [fmt.strip() for fmt in args.formats.split(",") if fmt.strip()]
+    fieldnames = args.csv_fields.split(",") if args.csv_fields else None
     
-    matched_cards = match_cards_with_deezer(cards)
+    with matching_session(args, args.journal or f"{output_base}_deezer.journal.ndjson") as journal:
+        print("="*50)
+        
+        with CardWriter(output_base, formats=formats, fieldnames=fieldnames or csv_fields(args),
+                        compress=args.gzip, extra_columns=not fieldnames) as writer:
+            try:
+                match_to_writer(load_cards(input_path), writer, args, journal)
+            except CardError as e:
+                print(f"Fehler: ungültige Karte: {e}")
+                raise SystemExit(1)
     
-    output_base = Path(input_path).stem
-    save_matched_results(matched_cards, output_base)
+    print()
+    for path in writer.paths.values():
+        print(f"Gespeichert: {path}")
+    print_summary(writer.matched, writer.count)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,747 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Deezer API.
+
+Serves /search, /track/{id}, /album/{id} and the artist and album listings
+(/search/artist, /artist/{id}/top, /artist/{id}/albums, /album/{id}/tracks)
+over a recorded or synthetic catalog with
+configurable latency, injected quota errors, timeouts, empty results and dead
+(unreadable) tracks, so the matching pipeline can be exercised and benchmarked
+without touching api.deezer.com. With --serve-previews it also stands in for
+the preview CDN, serving fake MP3s under signed, expiring URLs.
+
+The same catalog is also searchable like the Spotify Web API (/api/token,
+/v1/search) and the YouTube Data API (/youtube/v3/search), for the other
+providers of match_providers.py. --catalog-gaps leaves a different share of
+the tracks out of each of those two.
+
+    python fake_deezer_server.py --synthetic 5000 --latency lognormal:0.08,0.5 --quota-errors 0.02
+    DEEZER_API_BASE=http://127.0.0.1:8700 python deezer_matcher.py cards.json
+"""
+
+import argparse
+import base64
+import hashlib
+import html
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from match_scoring import normalize
+
+
+DEFAULT_PORT = 8700
+
+QUOTA_ERROR = {"error": {"type": "Exception", "message": "Quota limit exceeded", "code": 4}}
+NO_DATA_ERROR = {"error": {"type": "DataException", "message": "no data", "code": 800}}
+SPOTIFY_TOKEN_SECONDS = 3600
+
+_BASE62 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+_TRACK_PATH = re.compile(r"^/track/(\d+)$")
+_ARTIST_PATH = re.compile(r"^/artist/(\d+)/(top|albums)$")
+_ALBUM_PATH = re.compile(r"^/album/(\d+)$")
+_ALBUM_TRACKS_PATH = re.compile(r"^/album/(\d+)/tracks$")
+_PREVIEW_PATH = re.compile(r"^/preview/(\d+)\.mp3$")
+_RANGE = re.compile(r"^bytes=(\d+)-$")
+_ADVANCED_FIELD = re.compile(r'(artist|track|album):"([^"]*)"')
+
+_WORDS = (
+    "love night heart baby dance fire rain summer dream girl boy time world light moon "
+    "sky river road home wild blue gold city star money crazy sweet lonely forever tonight "
+    "heaven angel radio magic storm ocean fever shadow paradise thunder highway sunshine"
+).split()
+
+
+class Latency:
+    """Latency distribution parsed from "fixed:S", "uniform:A,B" or "lognormal:MEDIAN,SIGMA"."""
+
+    def __init__(self, spec: str = "fixed:0"):
+        kind, _, values = spec.partition(":")
+        self.kind = kind
+        self.values = [float(v) for v in values.split(",") if v]
+        if kind not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {spec}")
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            return self.values[0] if self.values else 0.0
+        if self.kind == "uniform":
+            return rng.uniform(self.values[0], self.values[1])
+        median, sigma = self.values
+        return median * rng.lognormvariate(0.0, sigma)
+
+
+class FakeCatalog:
+    """Track payloads with a token index for Deezer-like search."""
+
+    def __init__(self, tracks: list[dict]):
+        self.tracks = []
+        self.by_id = {}
+        self._tokens: dict[str, set[int]] = {}
+        self._fields = []
+        self.artists: dict[int, dict] = {}
+        self.albums: dict[int, dict] = {}
+        self._artist_tracks: dict[int, list[dict]] = {}
+        self._artist_albums: dict[int, list[int]] = {}
+        self._album_tracks: dict[int, list[dict]] = {}
+
+        for track in tracks:
+            if track.get("id") in self.by_id:
+                continue
+            number = len(self.tracks)
+            self.tracks.append(track)
+            self.by_id[track["id"]] = track
+            title = normalize(track.get("title") or "")
+            artist = normalize((track.get("artist") or {}).get("name") or "")
+            album = normalize((track.get("album") or {}).get("title") or "")
+            self._fields.append((title, artist, album))
+            for token in set(f"{title} {artist}".split()):
+                self._tokens.setdefault(token, set()).add(number)
+            self._add_listings(track)
+
+    def _add_listings(self, track: dict):
+        artist = track.get("artist") or {}
+        album = track.get("album") or {}
+        if "id" in artist:
+            self.artists.setdefault(artist["id"], {"id": artist["id"], "name": artist.get("name") or ""})
+            self._artist_tracks.setdefault(artist["id"], []).append(track)
+        if "id" in album:
+            self.albums.setdefault(album["id"], {key: album.get(key) for key in ("id", "title", "release_date")})
+            self._album_tracks.setdefault(album["id"], []).append(track)
+            albums = self._artist_albums.setdefault(artist.get("id"), [])
+            if album["id"] not in albums:
+                albums.append(album["id"])
+
+    def __len__(self) -> int:
+        return len(self.tracks)
+
+    def search_artists(self, query: str) -> list[dict]:
+        """Artists whose normalized name contains every query word, best known first."""
+        tokens = normalize(query).split()
+        if not tokens:
+            return []
+        found = [artist for artist in self.artists.values()
+                 if all(token in normalize(artist["name"]).split() for token in tokens)]
+        return sorted(found, key=lambda artist: -len(self._artist_tracks[artist["id"]]))
+
+    def artist_top(self, artist_id: int) -> list[dict]:
+        return sorted(self._artist_tracks.get(artist_id, []), key=lambda track: -track.get("rank", 0))
+
+    def artist_albums(self, artist_id: int) -> list[dict]:
+        return [self.albums[album_id] for album_id in self._artist_albums.get(artist_id, [])]
+
+    def album_tracks(self, album_id: int) -> list[dict] | None:
+        """Tracklist of an album; like Deezer, the entries carry no album object."""
+        if album_id not in self._album_tracks:
+            return None
+        return [{key: value for key, value in track.items() if key != "album"}
+                for track in self._album_tracks[album_id]]
+
+    def search(self, query: str, limit: int = 25) -> list[dict]:
+        """All query words must appear; advanced fields must match their field."""
+        fields = dict(_ADVANCED_FIELD.findall(query))
+        free_text = _ADVANCED_FIELD.sub(" ", query)
+        wanted = {name: normalize(value) for name, value in fields.items()}
+
+        tokens = normalize(" ".join([free_text, *fields.values()])).split()
+        if not tokens:
+            return []
+
+        candidates = None
+        for token in tokens:
+            numbers = self._tokens.get(token, set())
+            candidates = numbers if candidates is None else candidates & numbers
+            if not candidates:
+                return []
+
+        results = []
+        for number in sorted(candidates):
+            title, artist, album = self._fields[number]
+            if "track" in wanted and wanted["track"] not in title:
+                continue
+            if "artist" in wanted and wanted["artist"] not in artist:
+                continue
+            if "album" in wanted and wanted["album"] not in album:
+                continue
+            results.append(self.tracks[number])
+            if len(results) >= limit:
+                break
+        return results
+
+
+def spotify_id(track_id: int) -> str:
+    """Deterministic 22 character base62 id, like Spotify's."""
+    number = int.from_bytes(hashlib.blake2b(f"spotify:{track_id}".encode(), digest_size=16).digest(), "big")
+    digits = []
+    for _ in range(22):
+        number, digit = divmod(number, 62)
+        digits.append(_BASE62[digit])
+    return "".join(digits)
+
+
+def youtube_id(track_id: int) -> str:
+    """Deterministic 11 character video id, like YouTube's."""
+    digest = hashlib.blake2b(f"youtube:{track_id}".encode(), digest_size=9).digest()
+    return base64.urlsafe_b64encode(digest).decode()[:11]
+
+
+def spotify_item(track: dict) -> dict:
+    """A catalog track as a Spotify track object."""
+    item_id = spotify_id(track["id"])
+    album = track.get("album") or {}
+    return {
+        "id": item_id,
+        "type": "track",
+        "name": track.get("title") or "",
+        "artists": [{"id": spotify_id(track["artist"]["id"]), "name": track["artist"]["name"]}],
+        "album": {"id": spotify_id(album.get("id", 0)), "name": album.get("title"),
+                  "release_date": album.get("release_date")},
+        "duration_ms": (track.get("duration") or 0) * 1000,
+        "popularity": min(100, track.get("rank", 0) // 10000),
+        "external_urls": {"spotify": f"https://open.spotify.com/track/{item_id}"},
+        "preview_url": f"https://p.scdn.co/mp3-preview/{hashlib.sha1(item_id.encode()).hexdigest()}",
+    }
+
+
+def youtube_item(track: dict) -> dict:
+    """A catalog track as a YouTube search result.
+
+    Most tracks come from an auto-generated "Artist - Topic" channel; the
+    rest are official videos titled "Artist - Title (Official Video)".
+    """
+    artist = track["artist"]["name"]
+    title = track.get("title") or ""
+    if zlib.crc32(f"vevo:{track['id']}".encode()) % 3:
+        video_title, channel = title, f"{artist} - Topic"
+    else:
+        video_title, channel = f"{artist} - {title} (Official Video)", f"{artist.replace(' ', '')}VEVO"
+    year = ((track.get("album") or {}).get("release_date") or "2009")[:4]
+    return {
+        "kind": "youtube#searchResult",
+        "id": {"kind": "youtube#video", "videoId": youtube_id(track["id"])},
+        "snippet": {
+            "title": html.escape(video_title),
+            "channelTitle": html.escape(channel),
+            "publishedAt": f"{max(int(year), 2006)}-06-01T12:00:00Z",
+        },
+    }
+
+
+def synthetic_tracks(count: int, seed: int = 1) -> list[dict]:
+    """Deterministic catalog with several tracks per artist, live and remastered variants."""
+    rng = random.Random(seed)
+    tracks = []
+    artists = max(1, count // 6)
+
+    for i in range(count):
+        artist_number = rng.randrange(artists)
+        title = " ".join(rng.sample(_WORDS, rng.randint(1, 4))).title()
+        variant = rng.random()
+        if variant < 0.08:
+            title += " (Live)"
+        elif variant < 0.15:
+            title += " - Remastered 2011"
+        # Every album has one release year, that of its first track's draw
+        drawn_year = 1955 + rng.randrange(68)
+        if i % 10 == 0:
+            year = drawn_year
+        track_id = 1_000_000 + i
+        tracks.append({
+            "id": track_id,
+            "title": title,
+            "link": f"https://www.deezer.com/track/{track_id}",
+            "preview": f"https://cdnt-preview.dzcdn.net/api/1/1/a/b/c/0/{track_id}.mp3",
+            "duration": rng.randint(120, 360),
+            "rank": rng.randint(1000, 999999),
+            "artist": {"id": 5000 + artist_number, "name": f"The {_WORDS[artist_number % len(_WORDS)].title()} {artist_number}"},
+            "album": {"id": 9000 + i // 10, "title": f"Album {i // 10}", "release_date": f"{year}-01-01"},
+        })
+    return tracks
+
+
+def synthetic_cards(tracks: list[dict], count: int, seed: int = 2) -> list[dict]:
+    """Cards drawn from `tracks` with OCR-style noise; `expected_id` holds the truth."""
+    rng = random.Random(seed)
+    originals = [t for t in tracks if "(" not in t["title"] and " - " not in t["title"]]
+    cards = []
+
+    for card_id in range(1, count + 1):
+        track = rng.choice(originals)
+        title = track["title"]
+        artist = track["artist"]["name"]
+        noise = rng.random()
+        if noise < 0.15:
+            title = title.upper()
+        elif noise < 0.25:
+            artist = artist.lower()
+        elif noise < 0.3:
+            title = title[:-1]
+        cards.append({
+            "id": card_id,
+            "title": title,
+            "artist": artist,
+            "year": int(track["album"]["release_date"][:4]),
+            "expected_id": track["id"],
+        })
+    return cards
+
+
+class FakeDeezerServer(ThreadingHTTPServer):
+    """Threaded HTTP server answering like api.deezer.com for a fake catalog."""
+
+    daemon_threads = True
+
+    def __init__(self, catalog: FakeCatalog, port: int = 0, latency: Latency | None = None,
+                 quota_errors: float = 0.0, timeouts: float = 0.0, timeout_delay: float = 2.0,
+                 empty_results: float = 0.0, quota: tuple[int, float] | None = None, seed: int = 0,
+                 dead_tracks: float = 0.0, preview_ttl: float = 900.0, serve_previews: bool = False,
+                 preview_bytes: int = 64 * 1024, preview_drops: float = 0.0, catalog_gaps: float = 0.0):
+        super().__init__(("127.0.0.1", port), FakeDeezerHandler)
+        self.catalog = catalog
+        self.latency = latency or Latency()
+        self.quota_errors = quota_errors
+        self.timeouts = timeouts
+        self.timeout_delay = timeout_delay
+        self.empty_results = empty_results
+        self.quota = quota
+        self.dead_tracks = dead_tracks
+        self.preview_ttl = preview_ttl
+        self.serve_previews = serve_previews
+        self.preview_bytes = preview_bytes
+        self.preview_drops = preview_drops
+        self.catalog_gaps = catalog_gaps
+
+        self.stats = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._windows: dict[str, deque] = {}
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def roll(self) -> tuple[float, float]:
+        """Latency and a uniform draw for fault injection, from one seeded generator."""
+        with self._lock:
+            return self.latency.sample(self._rng), self._rng.random()
+
+    def over_quota(self, api: str = "deezer") -> bool:
+        """Enforce a real sliding-window quota per API, if configured."""
+        if self.quota is None:
+            return False
+        requests, period = self.quota
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.setdefault(api, deque())
+            while window and now - window[0] > period:
+                window.popleft()
+            if len(window) >= requests:
+                return True
+            window.append(now)
+            return False
+
+    def is_dead(self, track_id: int) -> bool:
+        """Deterministically unreadable (region-blocked or withdrawn) tracks."""
+        return zlib.crc32(str(track_id).encode()) / 2 ** 32 < self.dead_tracks
+
+    def is_missing(self, api: str, track_id: int) -> bool:
+        """Deterministically absent from the Spotify or YouTube catalog."""
+        return zlib.crc32(f"{api}:{track_id}".encode()) / 2 ** 32 < self.catalog_gaps
+
+    def sign_preview(self, url: str) -> str:
+        """Append an Akamai-style token like the one on real preview URLs."""
+        if not url:
+            return url
+        expires = int(time.time() + self.preview_ttl)
+        acl = urlparse(url).path
+        token = f"exp={expires}~acl={acl}*~data=user_id=0,application_id=42"
+        hmac = hashlib.sha256(token.encode()).hexdigest()
+        return f"{url}?hdnea={token}~hmac={hmac}"
+
+    def preview_url(self, track: dict) -> str:
+        url = track.get("preview") or ""
+        if url and self.serve_previews:
+            url = f"{self.base_url}/preview/{track['id']}.mp3"
+        return self.sign_preview(url)
+
+    def preview_audio(self, track_id: int) -> bytes:
+        """Deterministic stand-in for a preview MP3: an ID3 tag and MPEG frame headers."""
+        rng = random.Random(track_id)
+        frame = 417  # 128 kbit/s, 44.1 kHz
+        audio = bytearray(b"ID3\x04\x00\x00\x00\x00\x00\x00")
+        while len(audio) < self.preview_bytes:
+            audio += b"\xff\xfb\x90\x64" + rng.randbytes(frame - 4)
+        return bytes(audio[:self.preview_bytes])
+
+    def listed_track(self, track: dict) -> dict:
+        """A track as /search and /artist/{id}/top list it: like Deezer, without any release date."""
+        payload = {key: value for key, value in track.items() if key != "release_date"}
+        if "album" in track:
+            payload["album"] = {key: value for key, value in track["album"].items() if key != "release_date"}
+        payload["preview"] = self.preview_url(track)
+        return payload
+
+    def track_payload(self, track: dict) -> dict:
+        """The /track/{id} answer for a catalog track."""
+        payload = dict(track)
+        album = dict(track.get("album") or {})
+        cover = f"https://e-cdns-images.dzcdn.net/images/cover/{album.get('id', 0):032x}"
+        album.setdefault("cover_medium", f"{cover}/250x250-000000-80-0-0.jpg")
+        album.setdefault("cover_xl", f"{cover}/1000x1000-000000-80-0-0.jpg")
+        payload["album"] = album
+
+        readable = not self.is_dead(track["id"])
+        payload["readable"] = readable
+        payload["available_countries"] = ["DE", "AT", "CH", "FR", "GB", "US"] if readable else []
+        payload["preview"] = self.preview_url(track) if readable else ""
+        return payload
+
+    def count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def start(self) -> "FakeDeezerServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class FakeDeezerHandler(BaseHTTPRequestHandler):
+    server: FakeDeezerServer
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; with Nagle on, every request
+    # on a kept-alive connection would wait for the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, payload, status: int = 200, headers: dict | None = None):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up on an injected timeout
+            self.close_connection = True
+
+    def send_page(self, items: list[dict], params: dict):
+        """One page of a listing, with Deezer's index/limit paging and "next" link."""
+        index = int(params.get("index", 0))
+        limit = int(params.get("limit", 25))
+        page = {"data": items[index:index + limit], "total": len(items)}
+        if index + limit < len(items):
+            page["next"] = f"{self.server.base_url}{urlparse(self.path).path}?index={index + limit}&limit={limit}"
+        self.send_json(page)
+
+    def send_quota_error(self, api: str):
+        """Throttle the way the real API does."""
+        if api == "spotify":
+            self.send_json({"error": {"status": 429, "message": "API rate limit exceeded"}},
+                           status=429, headers={"Retry-After": "1"})
+        elif api == "youtube":
+            self.send_json({"error": {"code": 403, "message": "Rate limit exceeded",
+                                      "errors": [{"reason": "rateLimitExceeded", "domain": "usageLimits"}]}},
+                           status=403)
+        else:
+            self.send_json(QUOTA_ERROR)
+
+    def send_spotify_search(self, params: dict, empty: bool):
+        server = self.server
+        server.count("spotify_search")
+        if not self.headers.get("Authorization", "").startswith("Bearer "):
+            self.send_json({"error": {"status": 401, "message": "No token provided"}}, status=401)
+            return
+        limit = int(params.get("limit", 20))
+        tracks = [] if empty else server.catalog.search(params.get("q", ""), limit)
+        items = [spotify_item(track) for track in tracks if not server.is_missing("spotify", track["id"])]
+        self.send_json({"tracks": {"items": items, "limit": limit, "offset": 0, "total": len(items)}})
+
+    def send_youtube_search(self, params: dict, empty: bool):
+        server = self.server
+        server.count("youtube_search")
+        if not params.get("key"):
+            self.send_json({"error": {"code": 403, "message": "The request is missing a valid API key.",
+                                      "errors": [{"reason": "forbidden", "domain": "global"}]}},
+                           status=403)
+            return
+        limit = int(params.get("maxResults", 5))
+        tracks = [] if empty else server.catalog.search(params.get("q", ""), limit)
+        items = [youtube_item(track) for track in tracks if not server.is_missing("youtube", track["id"])]
+        self.send_json({"kind": "youtube#searchListResponse",
+                        "pageInfo": {"totalResults": len(items), "resultsPerPage": limit}, "items": items})
+
+    def do_POST(self):
+        """Spotify's client credentials token endpoint; any client is accepted."""
+        server = self.server
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode("utf-8")
+
+        if urlparse(self.path).path != "/api/token":
+            self.send_json(NO_DATA_ERROR, status=404)
+            return
+
+        server.count("spotify_tokens")
+        if not self.headers.get("Authorization", "").startswith("Basic ") \
+                or parse_qs(body).get("grant_type") != ["client_credentials"]:
+            self.send_json({"error": "invalid_client", "error_description": "Invalid client"}, status=400)
+            return
+        token = hashlib.sha256(f"{time.time()}:{server.stats['spotify_tokens']}".encode()).hexdigest()
+        self.send_json({"access_token": token, "token_type": "Bearer", "expires_in": SPOTIFY_TOKEN_SECONDS})
+
+    def send_preview(self, track_id: int, params: dict):
+        """Serve fake audio like the CDN: signed URLs only, Range requests honoured."""
+        server = self.server
+        server.count("previews")
+
+        token = dict(part.partition("=")[::2] for part in params.get("hdnea", "").split("~"))
+        if track_id not in server.catalog.by_id or not token.get("exp", "").isdigit() \
+                or int(token["exp"]) < time.time():
+            server.count("previews_forbidden")
+            self.send_response(403)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        audio = server.preview_audio(track_id)
+        start = 0
+        range_match = _RANGE.match(self.headers.get("Range", ""))
+        if range_match:
+            start = int(range_match.group(1))
+            if start >= len(audio):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(audio)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(audio) - 1}/{len(audio)}")
+        else:
+            self.send_response(200)
+
+        body = audio[start:]
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+
+        _, draw = server.roll()
+        if draw < server.preview_drops:
+            # Cut the transfer short to exercise resuming
+            server.count("previews_dropped")
+            body = body[:len(body) // 2]
+            self.close_connection = True
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        if url.path == "/__stats":
+            self.send_json(dict(server.stats))
+            return
+
+        match = _PREVIEW_PATH.match(url.path)
+        if match and server.serve_previews:
+            self.send_preview(int(match.group(1)), params)
+            return
+
+        server.count("requests")
+        latency, draw = server.roll()
+        api = "spotify" if url.path.startswith("/v1/") else "youtube" if url.path.startswith("/youtube/") else "deezer"
+
+        if server.over_quota(api):
+            server.count("quota_errors")
+            self.send_quota_error(api)
+            return
+
+        if draw < server.timeouts:
+            server.count("timeouts")
+            time.sleep(server.timeout_delay)
+        else:
+            time.sleep(latency)
+        draw -= server.timeouts
+
+        if 0 <= draw < server.quota_errors:
+            server.count("quota_errors")
+            self.send_quota_error(api)
+            return
+        draw -= server.quota_errors
+
+        if url.path == "/v1/search":
+            self.send_spotify_search(params, 0 <= draw < server.empty_results)
+            return
+
+        if url.path == "/youtube/v3/search":
+            self.send_youtube_search(params, 0 <= draw < server.empty_results)
+            return
+
+        if url.path == "/search/artist":
+            server.count("search_artist")
+            self.send_page(server.catalog.search_artists(params.get("q", "")), params)
+            return
+
+        if url.path == "/search":
+            server.count("search")
+            if 0 <= draw < server.empty_results:
+                server.count("empty_results")
+                self.send_json({"data": [], "total": 0})
+                return
+            results = server.catalog.search(params.get("q", ""), int(params.get("limit", 25)))
+            results = [server.listed_track(track) for track in results]
+            self.send_json({"data": results, "total": len(results)})
+            return
+
+        match = _TRACK_PATH.match(url.path)
+        if match:
+            server.count("track")
+            track = server.catalog.by_id.get(int(match.group(1)))
+            if track is not None:
+                self.send_json(server.track_payload(track))
+                return
+
+        match = _ARTIST_PATH.match(url.path)
+        if match:
+            artist_id, listing = int(match.group(1)), match.group(2)
+            server.count(f"artist_{listing}")
+            if artist_id in server.catalog.artists:
+                if listing == "top":
+                    items = [server.listed_track(track) for track in server.catalog.artist_top(artist_id)]
+                else:
+                    items = server.catalog.artist_albums(artist_id)
+                self.send_page(items, params)
+                return
+
+        match = _ALBUM_PATH.match(url.path)
+        if match:
+            server.count("album")
+            album = server.catalog.albums.get(int(match.group(1)))
+            if album is not None:
+                self.send_json(dict(album, nb_tracks=len(server.catalog.album_tracks(album["id"]))))
+                return
+
+        match = _ALBUM_TRACKS_PATH.match(url.path)
+        if match:
+            server.count("album_tracks")
+            tracks = server.catalog.album_tracks(int(match.group(1)))
+            if tracks is not None:
+                self.send_page([dict(track, preview=server.preview_url(track)) for track in tracks], params)
+                return
+
+        self.send_json(NO_DATA_ERROR)
+
+
+def load_tracks(path: str) -> list[dict]:
+    """Track payloads from a search cache (.sqlite), a JSON array or NDJSON."""
+    if path.endswith((".sqlite", ".db")):
+        from deezer_cache import ResponseCache
+        from match_providers import CACHE_KEY_PREFIXES
+        cache = ResponseCache(path)
+        try:
+            return [track for results in cache.iter_payloads(skip_prefixes=CACHE_KEY_PREFIXES)
+                    for track in results]
+        finally:
+            cache.close()
+
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith((".ndjson", ".jsonl")):
+            return [json.loads(line) for line in f if line.strip()]
+        return json.load(f)
+
+
+def add_server_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--catalog", help="Recorded tracks: search cache (.sqlite), JSON or NDJSON")
+    parser.add_argument("--synthetic", type=int, default=5000,
+                        help="Synthetic catalog size when no --catalog is given (default: 5000)")
+    parser.add_argument("--latency", default="fixed:0.05",
+                        help='"fixed:S", "uniform:A,B" or "lognormal:MEDIAN,SIGMA" (default: fixed:0.05)')
+    parser.add_argument("--quota-errors", type=float, default=0.0, help="Share of quota error answers")
+    parser.add_argument("--timeouts", type=float, default=0.0, help="Share of requests that hang")
+    parser.add_argument("--timeout-delay", type=float, default=2.0, help="Seconds a hanging request takes")
+    parser.add_argument("--empty-results", type=float, default=0.0, help="Share of empty search results")
+    parser.add_argument("--enforce-quota", default=None,
+                        help='Real quota as "REQUESTS/SECONDS", e.g. "50/5"')
+    parser.add_argument("--dead-tracks", type=float, default=0.0,
+                        help="Share of tracks /track reports as unreadable")
+    parser.add_argument("--preview-ttl", type=float, default=900.0,
+                        help="Lifetime of signed preview URLs in seconds (default: 900)")
+    parser.add_argument("--serve-previews", action="store_true",
+                        help="Point preview URLs at this server and serve fake MP3s")
+    parser.add_argument("--preview-bytes", type=int, default=64 * 1024,
+                        help="Size of each fake preview (default: 65536)")
+    parser.add_argument("--preview-drops", type=float, default=0.0,
+                        help="Share of preview downloads cut off halfway")
+    parser.add_argument("--catalog-gaps", type=float, default=0.0,
+                        help="Share of tracks missing from the Spotify and from the YouTube search")
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def server_from_args(args: argparse.Namespace, port: int = 0) -> FakeDeezerServer:
+    if args.catalog:
+        tracks = load_tracks(args.catalog)
+    else:
+        tracks = synthetic_tracks(args.synthetic, seed=args.seed + 1)
+
+    quota = None
+    if args.enforce_quota:
+        requests, period = args.enforce_quota.split("/")
+        quota = (int(requests), float(period))
+
+    return FakeDeezerServer(
+        FakeCatalog(tracks), port=port, latency=Latency(args.latency),
+        quota_errors=args.quota_errors, timeouts=args.timeouts, timeout_delay=args.timeout_delay,
+        empty_results=args.empty_results, quota=quota, seed=args.seed,
+        dead_tracks=args.dead_tracks, preview_ttl=args.preview_ttl,
+        serve_previews=args.serve_previews, preview_bytes=args.preview_bytes,
+        preview_drops=args.preview_drops, catalog_gaps=args.catalog_gaps,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Deezer API.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--write-cards", metavar="PATH",
+                        help="Also write a synthetic card pack drawn from the catalog")
+    parser.add_argument("--cards", type=int, default=300, help="Size of the synthetic card pack")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    server = server_from_args(args, port=args.port)
+
+    if args.write_cards:
+        cards = synthetic_cards(server.catalog.tracks, args.cards, seed=args.seed + 2)
+        Path(args.write_cards).write_text(json.dumps(cards, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"Wrote {len(cards)} cards to {args.write_cards}")
+
+    print(f"Serving {len(server.catalog)} tracks on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,91 +1,176 @@
 #!/usr/bin/env python3
 """
-Generate the complete MockHitsterCardRepository.kt file.
+Generate MockHitsterCardRepository.kt and its card data from Deezer JSON files.
+
+Cards are sorted by id and written as chunked data objects of parallel arrays
+(repository/cards/CardChunkNNN.kt) plus a small index of the first id of every
+chunk. A lookup binary-searches the index, then the chunk, so only the chunk
+holding the card is initialized, and no single class initializer comes near
+the JVM's 64 KB method size limit however many cards there are.
 """
-import json
-import os
-
-def escape_kotlin_string(s):
-    """Escape special characters for Kotlin strings."""
-    if s is None:
-        return ""
-    return s.replace('\\', '\\\\').replace('"', '\\"')
-
-def generate_kotlin_entry(card):
-    """Generate a single Kotlin map entry for a card."""
-    card_id = str(card['id']).zfill(5)
-    title = escape_kotlin_string(card.get('title', ''))
-    artist = escape_kotlin_string(card.get('artist', ''))
-    year = card.get('year', 0)
-    deezer_id = card.get('deezer_id', 0)
-    deezer_title = escape_kotlin_string(card.get('deezer_title', ''))
-    deezer_artist = escape_kotlin_string(card.get('deezer_artist', ''))
-    deezer_album = escape_kotlin_string(card.get('deezer_album', ''))
-
-    return f'''        "{card_id}" to HitsterCard(
-            hitsterId = "{card_id}",
-            title = "{title}",
-            artist = "{artist}",
-            year = {year},
-            deezerId = {deezer_id},
-            deezerTitle = "{deezer_title}",
-            deezerArtist = "{deezer_artist}",
-            deezerAlbum = "{deezer_album}"
-        )'''
+import argparse
+from pathlib import Path
 
-def main():
-    # Define the JSON files to process
-    json_files = [
-        'tmp/1-72/hitster-cards_deezer.json',
-        'tmp/73-144/hitster-cards_deezer.json',
-        'tmp/145-216/hitster-cards_deezer.json',
-        'tmp/217-308/hitster-cards_deezer.json'
-    ]
+from card_bundle import hitster_id, verify_bundle, write_bundle
+from card_merge import add_input_arguments, load_merged_cards
+from card_model import CardError
+from kotlin_codegen import card_id, kotlin_nullable_string, kotlin_string
+
+REPOSITORY_DIR = Path('composeApp/src/commonMain/kotlin/com/hitit/app/repository')
+DEFAULT_BUNDLE_PATH = Path('tmp/cards.bin')
+CARDS_PACKAGE = 'com.hitit.app.repository.cards'
+
+# Each card adds roughly 70 bytes of bytecode to its chunk's initializer
+DEFAULT_CHUNK_SIZE = 256
+MAX_CHUNK_SIZE = 512
+
+# Cards without a Deezer match are stored as 0 in the deezerIds array
+NO_DEEZER_ID = 0
+
+HEADER = '// Generated by scripts/generate_full_repository.py. Do not edit.\n'
+
+
+def id_sort_key(hitster_id):
+    """Same order as compareIds() in the generated Kotlin: shorter ids first."""
+    return len(hitster_id), hitster_id
+
+
+def kotlin_array(values, constructor="arrayOf", per_line=8):
+    """An array literal with a few values per line."""
+    lines = [", ".join(values[i:i + per_line]) for i in range(0, len(values), per_line)]
+    body = ",\n        ".join(lines)
+    return f"{constructor}(\n        {body}\n    )"
+
+
+def generate_chunk(name, cards):
+    """Kotlin source of one chunk object holding `cards` (sorted by id)."""
+    ids = [kotlin_string(card_id(card)) for card in cards]
+    titles = [kotlin_string(card.title) for card in cards]
+    artists = [kotlin_string(card.artist) for card in cards]
+    years = [str(card.year or 0) for card in cards]
+    deezer_ids = [f"{card.deezer_id or NO_DEEZER_ID}L" for card in cards]
+    deezer_titles = [kotlin_nullable_string(card.deezer_title) for card in cards]
+    deezer_artists = [kotlin_nullable_string(card.deezer_artist) for card in cards]
+    deezer_albums = [kotlin_nullable_string(card.deezer_album) for card in cards]
+
+    return f'''{HEADER}package {CARDS_PACKAGE}
 
-    all_cards = []
+internal object {name} : CardChunk(
+    ids = {kotlin_array(ids)},
+    titles = {kotlin_array(titles, per_line=1)},
+    artists = {kotlin_array(artists, per_line=1)},
+    years = {kotlin_array(years, "intArrayOf", per_line=16)},
+    deezerIds = {kotlin_array(deezer_ids, "longArrayOf", per_line=6)},
+    deezerTitles = {kotlin_array(deezer_titles, "arrayOf<String?>", per_line=1)},
+    deezerArtists = {kotlin_array(deezer_artists, "arrayOf<String?>", per_line=1)},
+    deezerAlbums = {kotlin_array(deezer_albums, "arrayOf<String?>", per_line=1)}
+)
+'''
+
+
+def generate_index(chunk_names, first_ids, card_count, chunk_size):
+    """Kotlin source of the chunk index and the shared chunk lookup code."""
+    branches = "\n".join(f"        {i} -> {name}" for i, name in enumerate(chunk_names))
+    first = kotlin_array([kotlin_string(i) for i in first_ids]) if first_ids else "emptyArray()"
+
+    return f'''{HEADER}package {CARDS_PACKAGE}
+
+import com.hitit.app.model.HitsterCard
+
+/**
+ * Index over {card_count} generated cards in chunks of up to {chunk_size}.
+ * A chunk's arrays are built the first time one of its cards is looked up.
+ */
+internal object CardChunks {{
+    const val CARD_COUNT = {card_count}
+
+    // First id of every chunk, in compareIds() order
+    private val firstIds: Array<String> = {first}
+
+    fun find(hitsterId: String): HitsterCard? {{
+        // Last chunk starting at or before the id
+        var low = 0
+        var high = firstIds.size - 1
+        var found = -1
+        while (low <= high) {{
+            val middle = (low + high) ushr 1
+            if (compareIds(firstIds[middle], hitsterId) <= 0) {{
+                found = middle
+                low = middle + 1
+            }} else {{
+                high = middle - 1
+            }}
+        }}
+        return if (found < 0) null else chunk(found).find(hitsterId)
+    }}
 
-    for json_file in json_files:
-        if os.path.exists(json_file):
-            with open(json_file, 'r', encoding='utf-8') as f:
-                cards = json.load(f)
-                all_cards.extend(cards)
-                print(f"Loaded {len(cards)} cards from {json_file}")
-        else:
-            print(f"Warning: {json_file} not found")
+    private fun chunk(index: Int): CardChunk = when (index) {{
+{branches}
+        else -> throw IndexOutOfBoundsException("No card chunk $index")
+    }}
+}}
 
-    # Sort by ID
-    all_cards.sort(key=lambda x: x['id'])
+/** Numeric order for zero-padded ids: shorter ids first, then lexicographic. */
+internal fun compareIds(a: String, b: String): Int =
+    if (a.length != b.length) a.length - b.length else a.compareTo(b)
 
-    print(f"\nTotal cards: {len(all_cards)}")
+/** Cards of one chunk as parallel arrays sorted by id. */
+internal abstract class CardChunk(
+    private val ids: Array<String>,
+    private val titles: Array<String>,
+    private val artists: Array<String>,
+    private val years: IntArray,
+    private val deezerIds: LongArray,
+    private val deezerTitles: Array<String?>,
+    private val deezerArtists: Array<String?>,
+    private val deezerAlbums: Array<String?>
+) {{
+    fun find(hitsterId: String): HitsterCard? {{
+        var low = 0
+        var high = ids.size - 1
+        while (low <= high) {{
+            val middle = (low + high) ushr 1
+            val order = compareIds(ids[middle], hitsterId)
+            when {{
+                order < 0 -> low = middle + 1
+                order > 0 -> high = middle - 1
+                else -> return card(middle)
+            }}
+        }}
+        return null
+    }}
 
-    # Generate Kotlin entries
-    kotlin_entries = []
-    for card in all_cards:
-        kotlin_entries.append(generate_kotlin_entry(card))
+    private fun card(index: Int) = HitsterCard(
+        hitsterId = ids[index],
+        title = titles[index],
+        artist = artists[index],
+        year = years[index],
+        deezerId = deezerIds[index].takeIf {{ it != {NO_DEEZER_ID}L }},
+        deezerTitle = deezerTitles[index],
+        deezerArtist = deezerArtists[index],
+        deezerAlbum = deezerAlbums[index]
+    )
+}}
+'''
 
-    # Join with commas
-    kotlin_map_content = ',\n'.join(kotlin_entries)
 
-    # Generate the full file content
-    kotlin_file = f'''package com.hitit.app.repository
+def generate_repository(card_count):
+    return f'''package com.hitit.app.repository
 
 import com.hitit.app.model.HitsterCard
+import com.hitit.app.repository.cards.CardChunks
 import kotlinx.coroutines.delay
 
 /**
  * Mock implementation of HitsterCardRepository.
- * Contains {len(all_cards)} Hitster cards with Deezer data.
+ * Contains {card_count} Hitster cards with Deezer data, generated into
+ * the cards package by scripts/generate_full_repository.py.
  */
 class MockHitsterCardRepository : HitsterCardRepository {{
 
     // Simulated network delay (ms)
     private val simulatedDelay = 300L
 
-    // Mock database of Hitster cards with Deezer matches
-    private val cardDatabase: Map<String, HitsterCard> = mapOf(
-{kotlin_map_content}
-    )
-
     override suspend fun getCardById(cardId: String): HitsterCard? {{
         // Simulate network delay
         delay(simulatedDelay)
@@ -93,17 +178,95 @@ class MockHitsterCardRepository : HitsterCardRepository {{
         // Normalize card ID (handle both "1" and "00001" formats)
         val normalizedId = cardId.padStart(5, '0')
 
-        return cardDatabase[normalizedId]
+        return CardChunks.find(normalizedId)
     }}
 }}
 '''
 
-    # Write to output file
-    output_file = 'composeApp/src/commonMain/kotlin/com/hitit/app/repository/MockHitsterCardRepository.kt'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(kotlin_file)
 
-    print(f"\nKotlin file written to {output_file}")
+def write_if_changed(path, content):
+    """Write `content` unless the file already holds it, so Gradle can skip it."""
+    path = Path(path)
+    if path.exists() and path.read_text(encoding='utf-8') == content:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding='utf-8')
+    return True
+
+
+def write_repository(cards, repository_dir=REPOSITORY_DIR, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Write the repository, the chunk index and the chunks. Returns the files changed."""
+    if not 1 <= chunk_size <= MAX_CHUNK_SIZE:
+        raise ValueError(f"chunk size must be between 1 and {MAX_CHUNK_SIZE}")
+
+    repository_dir = Path(repository_dir)
+    cards_dir = repository_dir / 'cards'
+    cards = sorted(cards, key=lambda card: id_sort_key(card_id(card)))
+
+    files = {}
+    chunk_names = []
+    first_ids = []
+    for start in range(0, len(cards), chunk_size):
+        chunk = cards[start:start + chunk_size]
+        name = f"CardChunk{len(chunk_names):03d}"
+        chunk_names.append(name)
+        first_ids.append(card_id(chunk[0]))
+        files[cards_dir / f"{name}.kt"] = generate_chunk(name, chunk)
+
+    files[cards_dir / 'CardChunks.kt'] = generate_index(chunk_names, first_ids, len(cards), chunk_size)
+    files[repository_dir / 'MockHitsterCardRepository.kt'] = generate_repository(len(cards))
+
+    changed = [path for path, content in files.items() if write_if_changed(path, content)]
+
+    # Chunks left over from a larger card set
+    for stale in cards_dir.glob('CardChunk[0-9]*.kt'):
+        if stale not in files:
+            stale.unlink()
+            changed.append(stale)
+
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate MockHitsterCardRepository.kt and its card chunks.")
+    add_input_arguments(parser)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Cards per generated chunk (default: {DEFAULT_CHUNK_SIZE}, max {MAX_CHUNK_SIZE})")
+    parser.add_argument("--output-dir", default=str(REPOSITORY_DIR),
+                        help="Repository source directory")
+    parser.add_argument("--mode", choices=("kotlin", "bundle", "both"), default="kotlin",
+                        help="Generate Kotlin sources, a binary card bundle, or both (default: kotlin)")
+    parser.add_argument("--bundle", default=str(DEFAULT_BUNDLE_PATH),
+                        help=f"Path of the binary card bundle (default: {DEFAULT_BUNDLE_PATH})")
+    args = parser.parse_args()
+
+    # Merged and deduplicated by ID
+    all_cards = load_merged_cards(args)
+
+    if args.mode in ("bundle", "both"):
+        # Bundle records need numeric ids; fail before any output is written
+        try:
+            for card in all_cards:
+                hitster_id(card.id)
+        except CardError as e:
+            raise SystemExit(f"Invalid card for the bundle: {e}")
+
+    if args.mode in ("kotlin", "both"):
+        changed = write_repository(all_cards, args.output_dir, args.chunk_size)
+
+        print(f"\nKotlin sources written to {args.output_dir} ({len(changed)} changed)")
+        for path in changed:
+            print(f"  {path}")
+
+    if args.mode in ("bundle", "both"):
+        count = write_bundle(all_cards, args.bundle)
+        problems = verify_bundle(args.bundle, all_cards)
+        for problem in problems:
+            print(f"  {problem}")
+        if problems:
+            raise SystemExit(f"Bundle {args.bundle} failed verification")
+        print(f"\nBundle with {count} cards written to {args.bundle} ({Path(args.bundle).stat().st_size} bytes, verified)")
+
 
 if __name__ == '__main__':
     main()
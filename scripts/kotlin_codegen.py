@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Kotlin source helpers shared by the card generators.
+"""
+
+from card_model import Card
+
+
+def escape_kotlin_string(s):
+    """Escape special characters for Kotlin strings."""
+    if s is None:
+        return ""
+    return (s.replace('\\', '\\\\').replace('"', '\\"').replace('$', '\\$')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+def kotlin_string(s):
+    return f'"{escape_kotlin_string(s)}"'
+
+
+def kotlin_nullable_string(s):
+    return "null" if s is None else kotlin_string(s)
+
+
+def kotlin_long(value):
+    return "null" if value is None else f"{int(value)}L"
+
+
+def card_id(card: Card):
+    """The id as used by getCardById: zero-padded to five digits."""
+    return str(card.id).zfill(5)
+
+
+def generate_kotlin_entry(card: Card):
+    """Generate a single Kotlin map entry for a card."""
+    hitster_id = card_id(card)
+
+    return f'''        "{hitster_id}" to HitsterCard(
+            hitsterId = "{hitster_id}",
+            title = {kotlin_string(card.title)},
+            artist = {kotlin_string(card.artist)},
+            year = {card.year or 0},
+            deezerId = {kotlin_long(card.deezer_id)},
+            deezerTitle = {kotlin_nullable_string(card.deezer_title)},
+            deezerArtist = {kotlin_nullable_string(card.deezer_artist)},
+            deezerAlbum = {kotlin_nullable_string(card.deezer_album)}
+        )'''
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Crash-safe matching journal.
+Every decided card is appended to an NDJSON file right away, so an interrupted
+run loses nothing and a rerun only re-queries new, edited or unmatched cards.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+
+def input_fingerprint(fields: dict) -> str:
+    """Stable hash over a card's input fields."""
+    encoded = json.dumps(fields, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+class MatchJournal:
+    """Append-only NDJSON journal of per-card match results.
+
+    Each line holds the card key, the fingerprint of its input fields and the
+    result fields. Later lines win, and a torn last line from a crash is ignored.
+    Several processes may append to the same journal as long as none of them
+    compacts it while the others are running.
+    """
+
+    def __init__(self, path: str | Path, compact_on_close: bool = True):
+        self.path = Path(path)
+        self.compact_on_close = compact_on_close
+        self._entries: dict[str, dict] = {}
+        self._lines = 0
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self._entries[entry["key"]] = entry
+                    self._lines += 1
+
+        self._file = open(self.path, "a", encoding="utf-8")
+        if self._file.tell() > 0 and not self._ends_with_newline():
+            # Terminate a torn line so the next entry starts on its own line
+            self._file.write("\n")
+            self._file.flush()
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: str, fingerprint: str) -> dict | None:
+        """Return the recorded result if the card's input is unchanged."""
+        entry = self._entries.get(key)
+        if entry is None or entry["input"] != fingerprint:
+            return None
+        return entry["result"]
+
+    def record(self, key: str, fingerprint: str, result: dict):
+        """Append a result and make sure it reaches the disk."""
+        entry = {"key": key, "input": fingerprint, "result": result}
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._entries[key] = entry
+            self._lines += 1
+
+    def compact(self):
+        """Rewrite the journal with only the latest entry per card."""
+        with self._lock:
+            self._file.close()
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for entry in self._entries.values():
+                    f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            self._lines = len(self._entries)
+            self._file = open(self.path, "a", encoding="utf-8")
+
+    def close(self):
+        """Close the journal, compacting it if it is mostly superseded entries."""
+        if self.compact_on_close and self._lines > 2 * len(self._entries):
+            self.compact()
+        with self._lock:
+            self._file.close()
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Music catalogs the matcher can search next to Deezer.
+
+A provider turns a search query into Deezer-shaped tracks (title,
+artist.name, album.title and album.release_date, link, preview, duration), so
+match_scoring ranks them unchanged, and maps the winning track to its own card
+fields (spotify_*, youtube_*). Every provider paces its requests with its own
+token bucket and retries throttled requests itself.
+
+    SPOTIFY_CLIENT_ID=... SPOTIFY_CLIENT_SECRET=... YOUTUBE_API_KEY=... \\
+        python deezer_matcher.py cards.json --providers deezer,spotify,youtube
+
+fake_deezer_server.py stands in for all three APIs:
+
+    SPOTIFY_API_BASE=http://127.0.0.1:8700 SPOTIFY_AUTH_URL=http://127.0.0.1:8700/api/token \\
+        YOUTUBE_API_BASE=http://127.0.0.1:8700 DEEZER_API_BASE=http://127.0.0.1:8700 ...
+"""
+
+import html
+import os
+import random
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from card_model import PROVIDER_FIELDS
+from matcher_metrics import METRICS
+from rate_limiter import TokenBucket
+
+
+# Overridable to point the providers at a local stand-in server
+SPOTIFY_API_BASE = os.environ.get("SPOTIFY_API_BASE", "https://api.spotify.com")
+SPOTIFY_AUTH_URL = os.environ.get("SPOTIFY_AUTH_URL", "https://accounts.spotify.com/api/token")
+# Tracks that cannot be played in this market are left out of the results
+SPOTIFY_MARKET = os.environ.get("SPOTIFY_MARKET", "DE")
+YOUTUBE_API_BASE = os.environ.get("YOUTUBE_API_BASE", "https://www.googleapis.com")
+
+# Spotify does not publish its limit, only that it counts requests over a
+# rolling 30 second window; this stays well below what apps get in practice.
+SPOTIFY_QUOTA_REQUESTS = 90
+SPOTIFY_QUOTA_PERIOD = 30.0
+# YouTube bills a search with 100 of the default 10,000 daily quota units, so
+# the daily quota runs out long before this pacing matters
+YOUTUBE_QUOTA_REQUESTS = 20
+YOUTUBE_QUOTA_PERIOD = 10.0
+YOUTUBE_MUSIC_CATEGORY = "10"
+
+REQUEST_TIMEOUT = 10
+QUOTA_RETRIES = 5
+# Seconds to wait after the first throttled answer, doubled on every further one
+QUOTA_BACKOFF = 1.0
+# Renew an access token this many seconds before it expires
+TOKEN_MARGIN = 60
+
+# Bracketed video decorations: "(Official Video)", "[Lyrics]", "(HD Remaster)"
+_VIDEO_DECORATION = re.compile(
+    r"\s*[\(\[][^\)\]]*\b(?:official|video|audio|lyrics?|visuali[sz]er|hd|hq|4k|clip)\b[^\)\]]*[\)\]]",
+    re.IGNORECASE)
+
+
+class ProviderError(Exception):
+    """A catalog could not give a definitive answer (transport, auth or API error)."""
+
+    def __init__(self, message: str, code: int | None = None):
+        super().__init__(message)
+        self.code = code
+
+
+class ProviderQuotaError(ProviderError):
+    """The catalog kept throttling after all retries, or its quota is used up."""
+
+
+class Provider(ABC):
+    """One catalog the matcher searches for every card.
+
+    Subclasses implement fetch() and format_result(). `fields` are the card
+    fields format_result() sets.
+    """
+
+    name = ""
+    label = ""
+    limiter: TokenBucket | None = None
+
+    def __init__(self, limiter: TokenBucket | None = None):
+        if limiter is not None:
+            self.limiter = limiter
+        self.fields = PROVIDER_FIELDS[self.name]
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    def queries(self, title: str, artist: str) -> list[str]:
+        """Search queries in order of preference."""
+        return [f"{artist} {title}"]
+
+    def cache_key(self, query: str) -> str:
+        """Key of `query` in the shared response cache and memo."""
+        return f"{self.name}:{query}"
+
+    @abstractmethod
+    def fetch(self, query: str, limit: int) -> list[dict]:
+        """Run one search and return Deezer-shaped tracks."""
+
+    @abstractmethod
+    def format_result(self, track: dict) -> dict:
+        """Card fields for a track returned by fetch()."""
+
+    def session(self) -> requests.Session:
+        """Keep-alive session with retries for transport and 5xx errors.
+
+        Throttling (429) is left to get_json() so it also slows the limiter down.
+        """
+        with self._session_lock:
+            if self._session is None:
+                retry = Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=(500, 502, 503, 504),
+                    allowed_methods=frozenset({"GET"}),
+                    # urllib3 would otherwise retry a 429 that carries Retry-After itself
+                    respect_retry_after_header=False,
+                )
+                self._session = requests.Session()
+                self._session.mount("https://", HTTPAdapter(pool_maxsize=32, max_retries=retry))
+                self._session.mount("http://", HTTPAdapter(pool_maxsize=32, max_retries=retry))
+            return self._session
+
+    def throttled(self, response: requests.Response) -> bool:
+        """Whether `response` asks to slow down and try again."""
+        return response.status_code == 429
+
+    def get_json(self, url: str, params: dict, headers: dict | None = None) -> dict:
+        """GET through the limiter, retrying throttled answers with exponential backoff."""
+        for attempt in range(QUOTA_RETRIES + 1):
+            waited = self.limiter.acquire()
+            if waited:
+                METRICS.inc("rate_limiter_wait_seconds", waited, provider=self.name)
+
+            start = time.perf_counter()
+            try:
+                response = self.session().get(url, params=params, headers=self.headers(headers),
+                                              timeout=REQUEST_TIMEOUT)
+            except requests.RequestException as e:
+                METRICS.inc("provider_requests", provider=self.name, outcome="error")
+                raise ProviderError(f"{self.name}: {e}") from e
+            finally:
+                METRICS.observe("provider_request_seconds", time.perf_counter() - start, provider=self.name)
+
+            if not self.throttled(response):
+                data = self.decode(response)
+                METRICS.inc("provider_requests", provider=self.name, outcome="ok")
+                self.limiter.on_success()
+                return data
+
+            METRICS.inc("provider_requests", provider=self.name, outcome="throttled")
+            self.limiter.on_throttle()
+            if attempt < QUOTA_RETRIES:
+                delay = QUOTA_BACKOFF * 2 ** attempt * random.uniform(1.0, 1.5)
+                retry_after = response.headers.get("Retry-After", "")
+                time.sleep(max(delay, float(retry_after)) if retry_after.isdigit() else delay)
+
+        raise ProviderQuotaError(f"{self.name}: still throttled after {QUOTA_RETRIES} retries",
+                                 response.status_code)
+
+    def headers(self, headers: dict | None) -> dict | None:
+        """Headers for the next request; lets subclasses add authentication."""
+        return headers
+
+    def decode(self, response: requests.Response) -> dict:
+        """The JSON body of a successful answer; anything else raises ProviderError."""
+        try:
+            data = response.json()
+        except ValueError:
+            data = None
+        if response.ok and isinstance(data, dict):
+            return data
+
+        METRICS.inc("provider_requests", provider=self.name, outcome="api_error")
+        error = data.get("error") if isinstance(data, dict) else None
+        message = error.get("message") if isinstance(error, dict) else response.reason
+        raise ProviderError(f"{self.name}: {message} (HTTP {response.status_code})", response.status_code)
+
+
+class SpotifyProvider(Provider):
+    """Spotify Web API search, authenticated with the client credentials flow."""
+
+    name = "spotify"
+    label = "Spotify"
+
+    def __init__(self, client_id: str, client_secret: str, limiter: TokenBucket | None = None,
+                 api_base: str = SPOTIFY_API_BASE, auth_url: str = SPOTIFY_AUTH_URL,
+                 market: str = SPOTIFY_MARKET):
+        super().__init__(limiter or TokenBucket.for_quota(SPOTIFY_QUOTA_REQUESTS, SPOTIFY_QUOTA_PERIOD))
+        self.api_base = api_base
+        self.auth_url = auth_url
+        self.market = market
+        self._credentials = (client_id, client_secret)
+        self._token = None
+        self._token_expires = 0.0
+        self._token_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "SpotifyProvider":
+        client_id = os.environ.get("SPOTIFY_CLIENT_ID")
+        client_secret = os.environ.get("SPOTIFY_CLIENT_SECRET")
+        if not client_id or not client_secret:
+            raise ProviderError("spotify: SPOTIFY_CLIENT_ID and SPOTIFY_CLIENT_SECRET must be set")
+        return cls(client_id, client_secret)
+
+    def access_token(self, renew: bool = False) -> str:
+        """A bearer token, fetched once and renewed shortly before it expires."""
+        with self._token_lock:
+            if renew or self._token is None or time.monotonic() > self._token_expires:
+                try:
+                    response = self.session().post(self.auth_url, data={"grant_type": "client_credentials"},
+                                                   auth=self._credentials, timeout=REQUEST_TIMEOUT)
+                except requests.RequestException as e:
+                    raise ProviderError(f"spotify: token request failed: {e}") from e
+                data = self.decode(response)
+                self._token = data["access_token"]
+                self._token_expires = time.monotonic() + data.get("expires_in", 3600) - TOKEN_MARGIN
+            return self._token
+
+    def headers(self, headers: dict | None) -> dict:
+        return {**(headers or {}), "Authorization": f"Bearer {self.access_token()}"}
+
+    def queries(self, title: str, artist: str) -> list[str]:
+        return [f'track:"{title}" artist:"{artist}"', f"{artist} {title}", title]
+
+    def fetch(self, query: str, limit: int) -> list[dict]:
+        params = {"q": query, "type": "track", "limit": limit, "market": self.market}
+        try:
+            data = self.get_json(f"{self.api_base}/v1/search", params)
+        except ProviderError as e:
+            if e.code != 401:
+                raise
+            # The token was revoked or expired early
+            self.access_token(renew=True)
+            data = self.get_json(f"{self.api_base}/v1/search", params)
+        return [self.track(item) for item in (data.get("tracks") or {}).get("items") or [] if item]
+
+    @staticmethod
+    def track(item: dict) -> dict:
+        album = item.get("album") or {}
+        artists = item.get("artists") or [{}]
+        return {
+            "id": item.get("id"),
+            "title": item.get("name") or "",
+            "artist": {"name": artists[0].get("name") or ""},
+            "album": {"title": album.get("name"), "release_date": album.get("release_date")},
+            "link": (item.get("external_urls") or {}).get("spotify"),
+            "preview": item.get("preview_url"),
+            "duration": (item.get("duration_ms") or 0) // 1000 or None,
+        }
+
+    def format_result(self, track: dict) -> dict:
+        return {
+            "spotify_id": track.get("id"),
+            "spotify_title": track.get("title"),
+            "spotify_artist": track.get("artist", {}).get("name"),
+            "spotify_album": track.get("album", {}).get("title"),
+            "spotify_link": track.get("link"),
+            "spotify_preview": track.get("preview"),
+        }
+
+
+class YouTubeProvider(Provider):
+    """YouTube Data API video search in the music category.
+
+    Videos have no artist field: auto-generated "Artist - Topic" channels
+    upload under the plain track title, everyone else uses "Artist - Title".
+    Searching is expensive, so there is a single query per card, and once the
+    daily quota is used up the provider fails fast for the rest of the run.
+    """
+
+    name = "youtube"
+    label = "YouTube"
+
+    def __init__(self, api_key: str, limiter: TokenBucket | None = None,
+                 api_base: str = YOUTUBE_API_BASE):
+        super().__init__(limiter or TokenBucket.for_quota(YOUTUBE_QUOTA_REQUESTS, YOUTUBE_QUOTA_PERIOD))
+        self.api_base = api_base
+        self._api_key = api_key
+        self.exhausted = False
+
+    @classmethod
+    def from_env(cls) -> "YouTubeProvider":
+        api_key = os.environ.get("YOUTUBE_API_KEY")
+        if not api_key:
+            raise ProviderError("youtube: YOUTUBE_API_KEY must be set")
+        return cls(api_key)
+
+    @staticmethod
+    def reason(response: requests.Response) -> str | None:
+        try:
+            errors = response.json()["error"]["errors"]
+            return errors[0]["reason"]
+        except (ValueError, KeyError, IndexError, TypeError):
+            return None
+
+    def throttled(self, response: requests.Response) -> bool:
+        if response.status_code != 403:
+            return False
+        reason = self.reason(response)
+        if reason == "quotaExceeded":
+            self.exhausted = True
+        return reason in ("rateLimitExceeded", "userRateLimitExceeded")
+
+    def fetch(self, query: str, limit: int) -> list[dict]:
+        if self.exhausted:
+            raise ProviderQuotaError("youtube: daily quota exceeded", 403)
+        params = {"part": "snippet", "type": "video", "videoCategoryId": YOUTUBE_MUSIC_CATEGORY,
+                  "maxResults": limit, "q": query, "key": self._api_key}
+        data = self.get_json(f"{self.api_base}/youtube/v3/search", params)
+        return [self.track(item) for item in data.get("items") or []
+                if (item.get("id") or {}).get("videoId")]
+
+    @staticmethod
+    def track(item: dict) -> dict:
+        video_id = item["id"]["videoId"]
+        snippet = item.get("snippet") or {}
+        # The API returns titles HTML-escaped ("Don&#39;t Stop")
+        video_title = html.unescape(snippet.get("title") or "")
+        channel = html.unescape(snippet.get("channelTitle") or "")
+
+        title = _VIDEO_DECORATION.sub("", video_title).strip()
+        if channel.endswith(" - Topic"):
+            artist = channel.removesuffix(" - Topic")
+        elif " - " in title:
+            artist, title = title.split(" - ", 1)
+        else:
+            artist = channel.removesuffix("VEVO")
+
+        return {
+            "id": video_id,
+            "title": title,
+            "artist": {"name": artist},
+            "video_title": video_title,
+            "channel": channel,
+            "link": f"https://www.youtube.com/watch?v={video_id}",
+        }
+
+    def format_result(self, track: dict) -> dict:
+        return {
+            "youtube_id": track.get("id"),
+            "youtube_title": track.get("video_title"),
+            "youtube_artist": track.get("artist", {}).get("name"),
+            "youtube_channel": track.get("channel"),
+            "youtube_link": track.get("link"),
+        }
+
+
+# Catalogs besides Deezer, by the name used on the command line
+PROVIDERS = {
+    "spotify": SpotifyProvider.from_env,
+    "youtube": YouTubeProvider.from_env,
+}
+
+# Response cache key prefix of Deezer album release dates
+ALBUM_CACHE_PREFIX = "album:"
+
+# Response cache keys that hold no Deezer tracks: the searches of these
+# catalogs (see Provider.cache_key) and album release dates
+CACHE_KEY_PREFIXES = tuple(f"{name}:" for name in PROVIDERS) + (ALBUM_CACHE_PREFIX,)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Scoring engine for Deezer search results.
+Normalizes titles and artists once (cached) and scores a whole result set in
+one pass, returning a confidence between 0 and 1 for every candidate.
+"""
+
+import re
+import unicodedata
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+
+# A result at or above this confidence is accepted without trying fallbacks
+ACCEPT_CONFIDENCE = 0.8
+# Below this a result is treated as no match at all
+MIN_CONFIDENCE = 0.35
+
+TITLE_WEIGHT = 0.5
+ARTIST_WEIGHT = 0.4
+VERSION_WEIGHT = 0.1
+# Share of the confidence that depends on year proximity, when it is known
+YEAR_WEIGHT = 0.15
+
+# Words that mark a recording variant rather than a different song
+VERSION_WORDS = (
+    "remaster", "remastered", "live", "version", "edit", "mix", "remix", "mono",
+    "stereo", "deluxe", "single", "demo", "acoustic", "instrumental", "bonus",
+    "anniversary", "karaoke", "re-recorded", "rerecorded", "mtv unplugged", "unplugged",
+)
+# Variants that should lose against the original recording
+PENALIZED_VERSIONS = ("live", "remix", "karaoke", "instrumental", "demo", "re-recorded", "rerecorded")
+
+_VERSION_PATTERN = "|".join(re.escape(word) for word in VERSION_WORDS)
+# "(Remastered 2011)", "[Live]", "(feat. X)"
+_BRACKETED = re.compile(r"[\(\[][^\)\]]*(?:\b(?:%s)\b|feat\.?|ft\.)[^\)\]]*[\)\]]" % _VERSION_PATTERN)
+# "- Live", "- 2011 Remaster", "- Radio Edit"
+_DASH_SUFFIX = re.compile(r"\s+-\s+[^-]*\b(?:%s)\b.*$" % _VERSION_PATTERN)
+# "feat. X", "ft. X", "featuring X" outside brackets
+_FEATURING = re.compile(r"\s+(?:feat\.?|ft\.|featuring)\s+.*$")
+_NON_ALNUM = re.compile(r"[^\w]+")
+
+
+@lru_cache(maxsize=65536)
+def fold(text: str) -> str:
+    """Casefold and strip diacritics ("Beyoncé" -> "beyonce")."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return stripped.casefold().replace("&", " and ")
+
+
+@lru_cache(maxsize=65536)
+def normalize(text: str) -> str:
+    """Normalized form of a title or artist name used for comparison."""
+    folded = fold(text)
+    folded = _BRACKETED.sub(" ", folded)
+    folded = _DASH_SUFFIX.sub("", folded)
+    folded = _FEATURING.sub("", folded)
+    return " ".join(_NON_ALNUM.sub(" ", folded).split())
+
+
+@lru_cache(maxsize=65536)
+def version_markers(text: str) -> frozenset:
+    """Penalized variant words ("live", "remix", ...) present in a title."""
+    folded = fold(text)
+    return frozenset(word for word in PENALIZED_VERSIONS if re.search(r"\b%s\b" % re.escape(word), folded))
+
+
+@lru_cache(maxsize=65536)
+def similarity(a: str, b: str) -> float:
+    """Similarity of two normalized strings in [0, 1]."""
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+
+    ratio = SequenceMatcher(None, a, b, autojunk=False).ratio()
+
+    # Token overlap catches reordered names ("Simon & Garfunkel" vs "Garfunkel, Simon")
+    tokens_a, tokens_b = set(a.split()), set(b.split())
+    overlap = len(tokens_a & tokens_b) / len(tokens_a | tokens_b)
+
+    # One side fully containing the other ("Africa" vs "Africa (Toto)") is a strong hint
+    containment = 0.9 if (f" {a} " in f" {b} " or f" {b} " in f" {a} ") else 0.0
+
+    return max(ratio, overlap, containment)
+
+
+def release_year(track: dict) -> int | None:
+    """Release year of a track payload, if it has one.
+
+    Deezer's /search and /artist/top tracks have none; /track/{id}, album
+    listings and Spotify tracks do. deezer_matcher looks albums up when the
+    year could decide between close candidates.
+    """
+    date = track.get("release_date") or (track.get("album") or {}).get("release_date")
+    if date and len(date) >= 4 and date[:4].isdigit():
+        return int(date[:4])
+    return None
+
+
+def year_score(card_year: int | None, track_year: int | None) -> float | None:
+    """Year proximity in [0, 1], or None if either year is unknown.
+
+    Compilations and remasters are released after the original, so a later
+    album year costs much less than an earlier one.
+    """
+    if not card_year or not track_year:
+        return None
+    delta = track_year - card_year
+    if abs(delta) <= 1:
+        return 1.0
+    if delta > 0:
+        return max(0.0, 1.0 - delta / 40)
+    return max(0.0, 1.0 + delta / 5)
+
+
+def score_candidates(results: list, title: str, artist: str, year: int = None) -> list[tuple[float, dict]]:
+    """Score every candidate, best first.
+
+    Ties go to a candidate whose raw title matches the card exactly (the
+    original over "- Remastered 2011"), then keep Deezer's ranking.
+    """
+
+    title_folded = fold(title or "")
+    title_norm = normalize(title or "")
+    artist_norm = normalize(artist or "")
+    card_markers = version_markers(title or "")
+
+    scored = []
+    for track in results:
+        track_title = track.get("title") or ""
+        track_artist = (track.get("artist") or {}).get("name") or ""
+
+        title_sim = similarity(title_norm, normalize(track_title))
+        artist_sim = similarity(artist_norm, normalize(track_artist))
+        unwanted = version_markers(track_title) - card_markers
+        version_ok = 0.0 if unwanted else 1.0
+
+        confidence = TITLE_WEIGHT * title_sim + ARTIST_WEIGHT * artist_sim + VERSION_WEIGHT * version_ok
+
+        proximity = year_score(year, release_year(track))
+        if proximity is not None:
+            confidence *= (1 - YEAR_WEIGHT) + YEAR_WEIGHT * proximity
+
+        scored.append((confidence, fold(track_title) == title_folded, track))
+
+    scored.sort(key=lambda x: (x[0], x[1]), reverse=True)
+    return [(confidence, track) for confidence, _, track in scored]
+
+
+def best_candidate(results: list, title: str, artist: str, year: int = None) -> tuple[float, dict] | None:
+    """The highest scoring candidate with its confidence, or None for no results."""
+
+    scored = score_candidates(results, title, artist, year)
+    return scored[0] if scored else None
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Instrumentation for the Deezer matching pipeline.
+Counters and latency histograms collected during a run, exported as a JSON
+report or as a Prometheus textfile (for node_exporter's textfile collector),
+with optional cProfile capture per pipeline stage.
+"""
+
+import contextlib
+import cProfile
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+PROMETHEUS_PREFIX = "hitster_matcher_"
+
+# Upper bounds in seconds, Prometheus style
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Fixed-bucket histogram; percentiles are estimated from the bucket bounds."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.sum += value
+
+    def percentile(self, fraction: float) -> float | None:
+        """Upper bound of the bucket holding the given fraction of observations."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else None,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "buckets": dict(zip([*map(str, self.buckets), "+Inf"], self.counts)),
+        }
+
+    def merge(self, data: dict):
+        for i, count in enumerate(data["buckets"].values()):
+            self.counts[i] += count
+        self.count += data["count"]
+        self.sum += data["sum"]
+
+
+def _labels_key(labels: dict) -> tuple:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: tuple, extra: tuple = ()) -> str:
+    pairs = [*key, *extra]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+
+class Metrics:
+    """Thread-safe registry of labelled counters and histograms."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, tuple], float] = {}
+        self._histograms: dict[tuple[str, tuple], Histogram] = {}
+        self.started = time.time()
+
+        self._profile_dir: Path | None = None
+        self._profiles: dict[str, cProfile.Profile] = {}
+        # Only one profiler can be active at a time (Python 3.12 enforces it
+        # process-wide), so concurrent stages are sampled rather than queued
+        self._profile_lock = threading.Lock()
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._profiles.clear()
+            self.started = time.time()
+
+    def inc(self, name: str, amount: float = 1, **labels):
+        key = (name, _labels_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels):
+        key = (name, _labels_key(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def counter(self, name: str, **labels) -> float:
+        with self._lock:
+            return self._counters.get((name, _labels_key(labels)), 0)
+
+    def total(self, name: str) -> float:
+        """Sum of a counter over all label values."""
+        with self._lock:
+            return sum(v for (n, _), v in self._counters.items() if n == name)
+
+    def enable_profiling(self, directory: str | Path):
+        """Capture a cProfile per stage, written by write_profiles()."""
+        self._profile_dir = Path(directory)
+
+    @contextlib.contextmanager
+    def timer(self, stage: str):
+        """Time a block as `stage` (and profile it, when enabled)."""
+        profile = None
+        if self._profile_dir is not None and self._profile_lock.acquire(blocking=False):
+            with self._lock:
+                profile = self._profiles.setdefault(stage, cProfile.Profile())
+            try:
+                profile.enable()
+            except ValueError:
+                # Another profiler (e.g. python -m cProfile) is already active
+                self._profile_lock.release()
+                profile = None
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            if profile is not None:
+                profile.disable()
+                self._profile_lock.release()
+            self.observe("stage_seconds", elapsed, stage=stage)
+
+    def timed(self, stage: str):
+        """Decorator form of timer()."""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(stage):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def ratio(self, name: str, hits: tuple[str, ...] = ("hit",), label: str = "result") -> float | None:
+        """Share of a counter's total carried by the given label values."""
+        matched = sum(self.counter(name, **{label: hit}) for hit in hits)
+        total = self.total(name)
+        return round(matched / total, 4) if total else None
+
+    def report(self) -> dict:
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(key), "value": value}
+                for (name, key), value in sorted(self._counters.items())
+            ]
+            histograms = [
+                {"name": name, "labels": dict(key), **histogram.to_dict()}
+                for (name, key), histogram in sorted(self._histograms.items())
+            ]
+        return {
+            "started": self.started,
+            "seconds": round(time.time() - self.started, 3),
+            "counters": counters,
+            "histograms": histograms,
+            "ratios": {
+                "cache_hit": self.ratio("cache_lookups"),
+                "catalog_hit": self.ratio("catalog_lookups"),
+                "memo_saved": self.ratio("memo_lookups", hits=("hit", "coalesced")),
+            },
+        }
+
+    def merge(self, report: dict):
+        """Add the counters and histograms of another run's report (e.g. a shard)."""
+        with self._lock:
+            self.started = min(self.started, report["started"])
+            for entry in report["counters"]:
+                key = (entry["name"], _labels_key(entry["labels"]))
+                self._counters[key] = self._counters.get(key, 0) + entry["value"]
+            for entry in report["histograms"]:
+                key = (entry["name"], _labels_key(entry["labels"]))
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = Histogram()
+                histogram.merge(entry)
+
+    def prometheus_text(self) -> str:
+        lines = []
+        typed = set()
+
+        with self._lock:
+            for (name, key), value in sorted(self._counters.items()):
+                metric = f"{PROMETHEUS_PREFIX}{name}_total"
+                if metric not in typed:
+                    lines.append(f"# TYPE {metric} counter")
+                    typed.add(metric)
+                lines.append(f"{metric}{_format_labels(key)} {value:g}")
+
+            for (name, key), histogram in sorted(self._histograms.items()):
+                metric = f"{PROMETHEUS_PREFIX}{name}"
+                if metric not in typed:
+                    lines.append(f"# TYPE {metric} histogram")
+                    typed.add(metric)
+                cumulative = 0
+                for bound, count in zip([*map(str, histogram.buckets), "+Inf"], histogram.counts):
+                    cumulative += count
+                    lines.append(f"{metric}_bucket{_format_labels(key, (('le', bound),))} {cumulative}")
+                lines.append(f"{metric}_sum{_format_labels(key)} {histogram.sum:.6f}")
+                lines.append(f"{metric}_count{_format_labels(key)} {histogram.count}")
+
+        lines.append(f"# TYPE {PROMETHEUS_PREFIX}last_run_timestamp_seconds gauge")
+        lines.append(f"{PROMETHEUS_PREFIX}last_run_timestamp_seconds {time.time():.0f}")
+        return "\n".join(lines) + "\n"
+
+    def write_json(self, path: str | Path):
+        _write_atomic(path, json.dumps(self.report(), indent=2) + "\n")
+
+    def write_prometheus(self, path: str | Path):
+        # The textfile collector must never see a half-written file
+        _write_atomic(path, self.prometheus_text())
+
+    def write_profiles(self) -> list[Path]:
+        """Dump one .prof file per profiled stage (readable with pstats/snakeviz)."""
+        if self._profile_dir is None:
+            return []
+        self._profile_dir.mkdir(parents=True, exist_ok=True)
+        paths = []
+        with self._lock:
+            profiles = dict(self._profiles)
+        for stage, profile in sorted(profiles.items()):
+            path = self._profile_dir / f"{stage}.prof"
+            profile.dump_stats(str(path))
+            paths.append(path)
+        return paths
+
+
+def _write_atomic(path: str | Path, text: str):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    tmp_path.replace(path)
+
+
+# Process-wide registry the matcher records into
+METRICS = Metrics()
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Offline preview pack: the 30-second Deezer previews of a card set in one file.
+
+Downloads the preview MP3 of every matched card concurrently into a staging
+directory (resuming partial downloads, storing each distinct file once by
+SHA-256), then packs them within a size budget into an indexed archive the
+app can seek into by hitsterId instead of streaming at scan time.
+
+    python preview_pack.py build --shards 'tmp/*/hitster-cards_deezer.json' --max-mb 200
+    python preview_pack.py get tmp/previews.hpak 00042 -o 42.mp3
+    python preview_pack.py verify tmp/previews.hpak
+
+Expired or rejected preview URLs are refreshed through /track/{id} with the
+matcher's rate limiter.
+
+File layout (little-endian):
+    header   magic "HPAK", version u16, reserved u16, entry count u32,
+             blob count u32, index offset u64, blobs offset u64
+    index    entry count x (hitsterId u32, reserved u32, blob offset u64,
+             blob length u32, first 4 bytes of the blob's SHA-256),
+             sorted by hitsterId; several ids may share a blob
+    blobs    MP3 data, each distinct file once
+"""
+
+import argparse
+import contextlib
+import hashlib
+import json
+import mmap
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+
+import deezer_matcher
+from card_bundle import hitster_id
+from card_merge import add_input_arguments, load_merged_cards
+from track_checker import preview_expiry
+
+
+MAGIC = b"HPAK"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIQQ")
+ENTRY = struct.Struct("<IIQI4s")
+
+DEFAULT_PACK_PATH = Path("tmp/previews.hpak")
+DEFAULT_CONCURRENCY = 8
+DOWNLOAD_RETRIES = 4
+DOWNLOAD_TIMEOUT = 30
+CHUNK_SIZE = 64 * 1024
+# Small network reads, so a dropped connection loses little of the file
+DOWNLOAD_CHUNK = 8 * 1024
+# Refresh preview URLs that expire sooner than this many seconds
+EXPIRY_MARGIN = 60
+# Budget reserved per download before any preview is staged: 30 s at 128 kbit/s
+TYPICAL_PREVIEW_BYTES = 480_000
+
+
+class Staging:
+    """Download directory: partial files, content-addressed blobs and a done-list.
+
+    Layout: parts/<id>.part while downloading, blobs/<sha256>.mp3 once
+    complete, and done.ndjson mapping each card id to its blob.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.parts = self.path / "parts"
+        self.blobs = self.path / "blobs"
+        self.parts.mkdir(parents=True, exist_ok=True)
+        self.blobs.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+        self.done: dict[int, dict] = {}
+        self._sizes: dict[str, int] = {}
+        self._reserved = 0
+
+        done_path = self.path / "done.ndjson"
+        if done_path.exists():
+            for line in done_path.read_text(encoding="utf-8").splitlines():
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn last line of an interrupted run
+                if self.blob_path(entry["sha256"]).exists():
+                    self.done[entry["id"]] = entry
+                    self._sizes[entry["sha256"]] = entry["size"]
+        self._done_file = open(done_path, "a", encoding="utf-8")
+
+    def reserve(self, max_bytes: int) -> int | None:
+        """Claim blob budget for one download about to start; None once it is spent.
+
+        Downloads in flight count against the budget with the mean staged
+        size, so concurrent workers stop at the pack's limit rather than past
+        it. While other downloads are in flight and the budget looks full,
+        waits for them to settle the real sizes. Hand the returned amount
+        back to release().
+        """
+        with self._released:
+            while True:
+                staged = sum(self._sizes.values())
+                expected = staged // len(self._sizes) if self._sizes else TYPICAL_PREVIEW_BYTES
+                if staged + self._reserved + expected <= max_bytes:
+                    self._reserved += expected
+                    return expected
+                if not self._reserved:
+                    return None
+                self._released.wait()
+
+    def release(self, reserved: int):
+        with self._released:
+            self._reserved -= reserved
+            self._released.notify_all()
+
+    def blob_path(self, sha256: str) -> Path:
+        return self.blobs / f"{sha256}.mp3"
+
+    def complete(self, card_id: int, part: Path) -> dict:
+        """Move a finished download into the blob store, deduplicating by content."""
+        digest = hashlib.sha256()
+        with open(part, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+        sha256 = digest.hexdigest()
+        entry = {"id": card_id, "sha256": sha256, "size": part.stat().st_size}
+
+        with self._lock:
+            blob = self.blob_path(sha256)
+            if blob.exists():
+                part.unlink()
+            else:
+                part.replace(blob)
+            self._sizes[sha256] = entry["size"]
+            self.done[card_id] = entry
+            self._done_file.write(json.dumps(entry) + "\n")
+            self._done_file.flush()
+        return entry
+
+    def close(self):
+        self._done_file.close()
+
+
+def fresh_preview_url(card: dict) -> str | None:
+    """A newly signed preview URL from /track/{id}."""
+    track = deezer_matcher.deezer_get(f"/track/{card['deezer_id']}")
+    return track.get("preview") or None
+
+
+def download_preview(card: dict, staging: Staging, session: requests.Session) -> dict:
+    """Download one card's preview into the staging area, resuming a partial file."""
+
+    card_id = hitster_id(card["id"])
+    url = card.get("deezer_preview")
+    refreshed = False
+
+    expires = preview_expiry(url)
+    if not url or (expires is not None and expires < time.time() + EXPIRY_MARGIN):
+        url, refreshed = fresh_preview_url(card), True
+    if not url:
+        raise ValueError("no preview available")
+
+    part = staging.parts / f"{card_id}.part"
+
+    for attempt in range(DOWNLOAD_RETRIES):
+        offset = part.stat().st_size if part.exists() else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+
+        try:
+            with session.get(url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+                if response.status_code == 403 and not refreshed:
+                    url, refreshed = fresh_preview_url(card), True
+                    continue
+                if response.status_code == 416:
+                    return staging.complete(card_id, part)
+                response.raise_for_status()
+
+                # A server that ignores Range sends the whole file again
+                mode = "ab" if response.status_code == 206 else "wb"
+                expected = int(response.headers.get("Content-Length", -1))
+                written = 0
+                with open(part, mode) as f:
+                    for chunk in response.iter_content(DOWNLOAD_CHUNK):
+                        f.write(chunk)
+                        written += len(chunk)
+
+            if expected < 0 or written == expected:
+                return staging.complete(card_id, part)
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError):
+            pass
+
+        time.sleep(0.5 * 2 ** attempt)
+
+    raise IOError(f"download incomplete after {DOWNLOAD_RETRIES} attempts")
+
+
+def download_all(cards: list[dict], staging: Staging, concurrency: int = DEFAULT_CONCURRENCY,
+                 max_bytes: int | None = None) -> dict[str, int]:
+    """Download every card's preview not yet staged. Returns counts per outcome."""
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=concurrency)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    outcomes = {"downloaded": 0, "staged": 0, "over_budget": 0, "failed": 0}
+    lock = threading.Lock()
+    # The pack's header and index take their share of the budget first
+    blob_budget = None if max_bytes is None else max_bytes - pack_overhead(len(cards))
+
+    def fetch(card):
+        label = f"{card['id']}: {card.get('artist')} - {card.get('title')}"
+        reserved = None
+        try:
+            if hitster_id(card["id"]) in staging.done:
+                outcome = "staged"
+            elif blob_budget is not None and (reserved := staging.reserve(blob_budget)) is None:
+                outcome = "over_budget"
+            else:
+                entry = download_preview(card, staging, session)
+                outcome = "downloaded"
+                print(f"  {label} ({entry['size']} bytes)")
+        except (deezer_matcher.DeezerApiError, requests.RequestException, IOError, ValueError) as e:
+            outcome = "failed"
+            print(f"  {label}: {e}")
+        finally:
+            if reserved is not None:
+                staging.release(reserved)
+        with lock:
+            outcomes[outcome] += 1
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(fetch, cards))
+    session.close()
+    return outcomes
+
+
+def pack_overhead(card_count: int) -> int:
+    """Bytes of header and index in a pack of up to `card_count` entries."""
+    return HEADER.size + ENTRY.size * card_count
+
+
+def write_pack(staging: Staging, card_ids: list[int], path: str | Path,
+               max_bytes: int | None = None) -> tuple[int, int]:
+    """Pack staged previews for `card_ids` (in order) within the size budget.
+
+    The budget covers the whole file, header and index included. Returns
+    (entries, blobs) written.
+    """
+
+    entries = []
+    blobs: dict[str, int] = {}
+    total = pack_overhead(len(card_ids))
+
+    for card_id in card_ids:
+        staged = staging.done.get(card_id)
+        if staged is None:
+            continue
+        if staged["sha256"] not in blobs:
+            if max_bytes is not None and total + staged["size"] > max_bytes:
+                continue
+            blobs[staged["sha256"]] = staged["size"]
+            total += staged["size"]
+        entries.append((card_id, staged["sha256"]))
+
+    entries.sort()
+    blobs_offset = HEADER.size + ENTRY.size * len(entries)
+
+    offsets = {}
+    position = blobs_offset
+    for sha256, size in blobs.items():
+        offsets[sha256] = position
+        position += size
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(entries), len(blobs), HEADER.size, blobs_offset))
+        for card_id, sha256 in entries:
+            f.write(ENTRY.pack(card_id, 0, offsets[sha256], blobs[sha256], bytes.fromhex(sha256)[:4]))
+        for sha256 in blobs:
+            with open(staging.blob_path(sha256), "rb") as blob:
+                while chunk := blob.read(CHUNK_SIZE):
+                    f.write(chunk)
+
+    tmp_path.replace(path)
+    return len(entries), len(blobs)
+
+
+class PreviewPack:
+    """Read-only, memory-mapped view of a preview pack."""
+
+    def __init__(self, path: str | Path = DEFAULT_PACK_PATH):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, self.entry_count, self.blob_count, self._index, self._blobs = \
+            HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path}: not a preview pack (version {VERSION})")
+
+    def __len__(self) -> int:
+        return self.entry_count
+
+    def entry(self, index: int) -> tuple[int, int, int, bytes]:
+        """(hitsterId, blob offset, blob length, SHA-256 prefix) of the index entry."""
+        card_id, _, offset, length, prefix = ENTRY.unpack_from(self._map, self._index + index * ENTRY.size)
+        return card_id, offset, length, prefix
+
+    def span(self, card_id) -> tuple[int, int] | None:
+        """(offset, length) of the card's MP3 within the file, for seeking players."""
+        wanted = hitster_id(card_id)
+        low, high = 0, self.entry_count
+        while low < high:
+            middle = (low + high) // 2
+            found, offset, length, _ = self.entry(middle)
+            if found < wanted:
+                low = middle + 1
+            elif found > wanted:
+                high = middle
+            else:
+                return offset, length
+        return None
+
+    def get(self, card_id) -> memoryview | None:
+        """The card's MP3 as a zero-copy view, or None."""
+        span = self.span(card_id)
+        if span is None:
+            return None
+        offset, length = span
+        return memoryview(self._map)[offset:offset + length]
+
+    def verify(self) -> list[str]:
+        problems = []
+        for index in range(self.entry_count):
+            card_id, offset, length, prefix = self.entry(index)
+            if offset + length > len(self._map):
+                problems.append(f"{card_id}: blob outside the file")
+            elif hashlib.sha256(self._map[offset:offset + length]).digest()[:4] != prefix:
+                problems.append(f"{card_id}: checksum mismatch")
+        return problems
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline pack of Deezer preview MP3s keyed by hitsterId.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser("build", help="Download previews and write the pack")
+    add_input_arguments(build_parser)
+    build_parser.add_argument("-o", "--output", default=str(DEFAULT_PACK_PATH))
+    build_parser.add_argument("--staging", help="Download directory (default: <output>.parts)")
+    build_parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    build_parser.add_argument("--max-mb", type=float, help="Size budget for the pack in MB")
+
+    get_parser = commands.add_parser("get", help="Extract one card's preview")
+    get_parser.add_argument("pack")
+    get_parser.add_argument("card_id")
+    get_parser.add_argument("-o", "--output", required=True)
+
+    verify_parser = commands.add_parser("verify", help="Check every blob against its index checksum")
+    verify_parser.add_argument("pack")
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        cards = [card for card in load_merged_cards(args) if card.get("deezer_id")]
+        max_bytes = int(args.max_mb * 1024 * 1024) if args.max_mb else None
+        staging = Staging(args.staging or f"{args.output}.parts")
+
+        print(f"\nDownloading previews for {len(cards)} matched cards")
+        try:
+            outcomes = download_all(cards, staging, args.concurrency, max_bytes)
+        finally:
+            staging.close()
+        print(", ".join(f"{count} {name.replace('_', ' ')}" for name, count in outcomes.items()))
+
+        # Cards whose id is not a number failed above and have no preview
+        card_ids = []
+        for card in cards:
+            with contextlib.suppress(ValueError):
+                card_ids.append(hitster_id(card["id"]))
+        entries, blobs = write_pack(staging, card_ids, args.output, max_bytes)
+        size = Path(args.output).stat().st_size
+        print(f"\nPacked {entries} previews ({blobs} distinct files, {size / 1024 / 1024:.1f} MB) into {args.output}")
+    elif args.command == "get":
+        with PreviewPack(args.pack) as pack:
+            audio = pack.get(args.card_id)
+            if audio is None:
+                print(f"No preview for {args.card_id}")
+                raise SystemExit(1)
+            Path(args.output).write_bytes(audio)
+            audio.release()
+        print(f"Wrote {args.output}")
+    else:
+        with PreviewPack(args.pack) as pack:
+            problems = pack.verify()
+            for problem in problems:
+                print(problem)
+            if problems:
+                raise SystemExit(1)
+            print(f"{args.pack}: {len(pack)} previews OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Rate limiting for the Deezer pipeline scripts.
+A single token bucket is shared by every request that counts against a quota;
+SharedTokenBucket extends that budget across processes.
+"""
+
+import contextlib
+import fcntl
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+
+
+class TokenBucket:
+    """Thread-safe token bucket with AIMD rate adaptation.
+
+    A bucket with capacity ``burst`` refilling at ``rate`` tokens per second
+    admits at most ``burst + rate * period`` requests in any window of
+    ``period`` seconds, so ``for_quota`` sizes the rate to keep that sum
+    within the quota.
+
+    When the server still reports throttling, ``on_throttle`` halves the rate
+    and drains the bucket; ``on_success`` then raises it additively back
+    towards the configured maximum.
+    """
+
+    # Fraction of the maximum rate regained per successful request
+    ADDITIVE_STEP = 0.02
+    # Lowest rate as a fraction of the maximum
+    MIN_FRACTION = 0.05
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.max_rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_quota(cls, requests: int, period: float, burst: int = 10) -> "TokenBucket":
+        """Create a bucket that never exceeds `requests` per sliding `period`."""
+        return cls(rate=(requests - burst) / period, capacity=burst)
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until `tokens` are available. Returns the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def on_success(self):
+        """Additive increase after a request that was not throttled."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * self.ADDITIVE_STEP)
+
+    def on_throttle(self):
+        """Multiplicative decrease after the server reported a quota error."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.max_rate * self.MIN_FRACTION, self.rate / 2)
+            self._tokens = 0.0
+
+
+class SharedTokenBucket:
+    """Token bucket shared between processes through a locked state file.
+
+    Every process that opens the same `path` draws from one budget, so
+    parallel matcher runs together stay within the quota. The state holds
+    the tokens, the time of the last refill and the current AIMD rate.
+    """
+
+    STATE = struct.Struct("<ddd")
+
+    ADDITIVE_STEP = TokenBucket.ADDITIVE_STEP
+    MIN_FRACTION = TokenBucket.MIN_FRACTION
+
+    def __init__(self, path: str | Path, rate: float, capacity: float):
+        self.path = Path(path)
+        self.max_rate = rate
+        self.capacity = capacity
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        with self._locked() as state:
+            if state is None:
+                self._write((capacity, time.time(), rate))
+
+    @classmethod
+    def for_quota(cls, path: str | Path, requests: int, period: float, burst: int = 10) -> "SharedTokenBucket":
+        """Create a shared bucket that never exceeds `requests` per sliding `period`."""
+        return cls(path, rate=(requests - burst) / period, capacity=burst)
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """Hold the thread and file lock; yields the current state."""
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield self._read()
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _read(self) -> tuple[float, float, float] | None:
+        data = os.pread(self._fd, self.STATE.size, 0)
+        if len(data) < self.STATE.size:
+            return None
+        return self.STATE.unpack(data)
+
+    def _write(self, state: tuple[float, float, float]):
+        os.pwrite(self._fd, self.STATE.pack(*state), 0)
+
+    def _refilled(self, state) -> tuple[float, float, float]:
+        tokens, updated, rate = state
+        now = time.time()
+        tokens = min(self.capacity, tokens + max(0.0, now - updated) * rate)
+        return tokens, now, rate
+
+    @property
+    def rate(self) -> float:
+        with self._locked() as state:
+            return state[2]
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until `tokens` are available. Returns the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._locked() as state:
+                available, now, rate = self._refilled(state)
+                if available >= tokens:
+                    self._write((available - tokens, now, rate))
+                    return waited
+                self._write((available, now, rate))
+                wait = (tokens - available) / rate
+            time.sleep(wait)
+            waited += wait
+
+    def on_success(self):
+        """Additive increase after a request that was not throttled."""
+        with self._locked() as state:
+            tokens, updated, rate = state
+            if rate < self.max_rate:
+                self._write((tokens, updated, min(self.max_rate, rate + self.max_rate * self.ADDITIVE_STEP)))
+
+    def on_throttle(self):
+        """Multiplicative decrease after the server reported a quota error."""
+        with self._locked() as state:
+            _, now, rate = self._refilled(state)
+            self._write((0.0, now, max(self.max_rate * self.MIN_FRACTION, rate / 2)))
+
+    def close(self):
+        os.close(self._fd)
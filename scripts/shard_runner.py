@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Sharded Deezer matching across worker processes.
+
+Splits a card file into N contiguous shards, matches them in parallel worker
+processes that share one rate budget through a locked quota file, and merges
+the results back in id order. Replaces splitting packs by hand into
+tmp/1-72, tmp/73-144, ... and running deezer_matcher.py on each slice.
+
+    python shard_runner.py hitster-cards.json --shards 4 --async
+"""
+
+import argparse
+import copy
+import heapq
+import json
+import multiprocessing
+import queue
+import sys
+import time
+from pathlib import Path
+
+import deezer_matcher
+from card_io import CardWriter, card_sort_key, load_cards, read_cards
+from match_journal import MatchJournal
+from matcher_metrics import Metrics
+
+
+DEFAULT_SHARDS = 4
+PROGRESS_INTERVAL = 2.0
+
+
+def split_cards(input_path: str, work_dir: Path, shards: int) -> list[tuple[Path, int]]:
+    """Write contiguous NDJSON shards. Returns (path, card count) per shard."""
+
+    total = sum(1 for _ in read_cards(input_path))
+    shards = max(1, min(shards, total))
+    bounds = [total * k // shards for k in range(shards + 1)]
+
+    result = []
+    cards = read_cards(input_path)
+    for k in range(shards):
+        path = work_dir / f"shard-{k:02d}.ndjson"
+        count = bounds[k + 1] - bounds[k]
+        with open(path, "w", encoding="utf-8") as f:
+            for _ in range(count):
+                f.write(json.dumps(next(cards), ensure_ascii=False) + "\n")
+        result.append((path, count))
+    return result
+
+
+def run_shard(index: int, shard_path: str, total: int, args: argparse.Namespace,
+              journal_path: str, progress):
+    """Worker process: match one shard, logging per-card output to a file.
+
+    All workers append to the same journal, so a rerun with a different
+    shard count still reuses every decided card.
+    """
+
+    base = str(Path(shard_path).with_suffix(""))
+    log_path = f"{base}.log"
+    
+    # Each worker reports its own metrics; main() merges them
+    args = copy.copy(args)
+    args.metrics_json = shard_metrics_path(shard_path) if wants_metrics(args) else None
+    args.metrics_prom = None
+    if args.profile_dir:
+        args.profile_dir = str(Path(args.profile_dir) / Path(base).name)
+
+    with open(log_path, "a", encoding="utf-8", buffering=1) as log:
+        sys.stdout = log
+
+        class ProgressWriter(CardWriter):
+            def write(self, card):
+                super().write(card)
+                progress.put((index, self.count, self.matched))
+
+        with deezer_matcher.matching_session(args, journal_path, compact_journal=False) as journal:
+            with ProgressWriter(base, formats=("ndjson",)) as writer:
+                deezer_matcher.match_to_writer(load_cards(shard_path), writer, args, journal, total)
+
+
+def wants_metrics(args: argparse.Namespace) -> bool:
+    return bool(args.metrics_json or args.metrics_prom)
+
+
+def shard_metrics_path(shard_path: str | Path) -> str:
+    return f"{Path(shard_path).with_suffix('')}.metrics.json"
+
+
+def merge_metrics(shard_paths: list[Path]) -> Metrics:
+    metrics = Metrics()
+    for path in shard_paths:
+        report_path = Path(shard_metrics_path(path))
+        if report_path.exists():
+            metrics.merge(json.loads(report_path.read_text(encoding="utf-8")))
+    return metrics
+
+
+def is_ordered(path: str) -> bool:
+    previous = None
+    for card in read_cards(path):
+        key = card_sort_key(card)
+        if previous is not None and key < previous:
+            return False
+        previous = key
+    return True
+
+
+def merge_shards(paths: list[str], writer: CardWriter):
+    """Merge shard outputs by id, streaming unless a shard is out of order."""
+
+    if all(is_ordered(path) for path in paths):
+        cards = heapq.merge(*(load_cards(path) for path in paths), key=card_sort_key)
+    else:
+        print("Eingabe nicht nach id sortiert, sortiere das Ergebnis im Speicher")
+        cards = sorted((card for path in paths for card in load_cards(path)), key=card_sort_key)
+
+    for card in cards:
+        writer.write(card)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Deezer-Abgleich in parallelen Prozessen mit gemeinsamem Rate-Limit.")
+    parser.add_argument("input_path", metavar="hitster_cards.json",
+                        help="Karten als JSON-Array oder NDJSON (auch .gz)")
+    parser.add_argument("--shards", type=int, default=DEFAULT_SHARDS,
+                        help=f"Anzahl der Shards und Prozesse (Standard: {DEFAULT_SHARDS})")
+    parser.add_argument("-o", "--output",
+                        help="Basisname der Ausgabedateien (Standard: Name der Eingabedatei)")
+    parser.add_argument("--formats", default="json,ndjson,csv",
+                        help="Ausgabeformate, kommagetrennt (Standard: json,ndjson,csv)")
+    parser.add_argument("--work-dir",
+                        help="Verzeichnis für Shards und Logs (Standard: <ausgabe>_shards)")
+    deezer_matcher.add_matching_arguments(parser)
+    args = parser.parse_args()
+
+    if not Path(args.input_path).exists():
+        print(f"Fehler: Datei nicht gefunden: {args.input_path}")
+        raise SystemExit(1)
+
+    output_base = args.output or deezer_matcher.output_base_for(args.input_path)
+    work_dir = Path(args.work_dir or f"{output_base}_shards")
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    # All workers draw from one budget
+    args.quota_file = args.quota_file or str(work_dir / "quota.bin")
+    journal_path = f"{output_base}_deezer.journal.ndjson"
+
+    shards = split_cards(args.input_path, work_dir, args.shards)
+    print(f"{sum(count for _, count in shards)} Karten in {len(shards)} Shards ({work_dir})")
+    print("=" * 50)
+
+    context = multiprocessing.get_context()
+    progress = context.Queue()
+    workers = [
+        context.Process(target=run_shard, args=(k, str(path), count, args, journal_path, progress),
+                        daemon=True)
+        for k, (path, count) in enumerate(shards)
+    ]
+    for worker in workers:
+        worker.start()
+
+    done = [0] * len(shards)
+    matched = [0] * len(shards)
+    last_report = 0.0
+
+    def report():
+        parts = [f"#{k}: {done[k]}/{count}" for k, (_, count) in enumerate(shards)]
+        print(f"{sum(done)}/{sum(c for _, c in shards)} Karten, {sum(matched)} gematcht | " + "  ".join(parts))
+
+    try:
+        while any(w.is_alive() for w in workers) or not progress.empty():
+            try:
+                index, count, hits = progress.get(timeout=0.5)
+                done[index], matched[index] = count, hits
+            except queue.Empty:
+                pass
+            if time.monotonic() - last_report >= PROGRESS_INTERVAL:
+                report()
+                last_report = time.monotonic()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.terminate()
+        print("\nAbgebrochen. Das Journal bleibt erhalten.")
+        raise SystemExit(130)
+
+    report()
+
+    if not args.no_journal:
+        # Compact only now that no worker appends anymore
+        MatchJournal(journal_path).close()
+
+    failed = [k for k, w in enumerate(workers) if w.exitcode != 0]
+    if failed:
+        print(f"Fehler in Shard(s) {failed}, siehe Logs in {work_dir}")
+        raise SystemExit(1)
+
+    formats = [fmt.strip() for fmt in args.formats.split(",") if fmt.strip()]
+    shard_outputs = [f"{path.with_suffix('')}_deezer.ndjson" for path, _ in shards]
+
+    with CardWriter(output_base, formats=formats, fieldnames=deezer_matcher.csv_fields(args),
+                    compress=args.gzip) as writer:
+        merge_shards(shard_outputs, writer)
+
+    print()
+    for path in writer.paths.values():
+        print(f"Gespeichert: {path}")
+    if wants_metrics(args):
+        deezer_matcher.write_metrics(args, merge_metrics([path for path, _ in shards]))
+    deezer_matcher.print_summary(writer.matched, writer.count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Liveness check for the Deezer tracks of a merged card set.
+
+Calls /track/{id} for every matched card, concurrently but through the
+matcher's rate limiter, and records whether the track is still readable,
+when its preview URL expires and its cover art. Dead entries are written to
+a card file that can be fed straight back into deezer_matcher.py.
+
+    python track_checker.py --shards 'tmp/*/hitster-cards_deezer.json'
+    DEEZER_API_BASE=http://127.0.0.1:8700 python track_checker.py --shards cards_deezer.json
+"""
+
+import argparse
+import json
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import deezer_matcher
+from card_io import open_text
+from card_model import Card
+from card_merge import add_input_arguments, load_merged_cards
+from matcher_metrics import METRICS
+from rate_limiter import SharedTokenBucket
+
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_REPORT = "tmp/track_status.ndjson"
+DEFAULT_REMATCH = "tmp/rematch_cards.json"
+DEFAULT_COUNTRY = "DE"
+
+# Deezer's "no data" error: the id no longer exists
+NO_DATA_CODE = 800
+
+# Statuses that send a card back to the matcher
+DEAD_STATUSES = ("gone", "unreadable", "blocked")
+
+
+def preview_expiry(url: str | None) -> int | None:
+    """Expiry (Unix time) from a signed preview URL's hdnea=exp=...~... token."""
+    if not url:
+        return None
+    for value in parse_qs(urlparse(url).query).get("hdnea", []):
+        for part in value.split("~"):
+            key, _, number = part.partition("=")
+            if key == "exp" and number.isdigit():
+                return int(number)
+    return None
+
+
+def check_track(card: Card, country: str = DEFAULT_COUNTRY, now: float | None = None) -> dict:
+    """Liveness record for one card."""
+
+    now = time.time() if now is None else now
+    deezer_id = card.get("deezer_id")
+    record = {"id": card.get("id"), "deezer_id": deezer_id}
+
+    if not deezer_id:
+        record["status"] = "unmatched"
+        return record
+
+    stored_expiry = preview_expiry(card.get("deezer_preview"))
+    record["stored_preview_expired"] = stored_expiry is not None and stored_expiry <= now
+
+    try:
+        track = deezer_matcher.deezer_get(f"/track/{deezer_id}")
+    except deezer_matcher.DeezerApiError as e:
+        record["status"] = "gone" if e.code == NO_DATA_CODE else "error"
+        record["error"] = str(e)
+        return record
+
+    album = track.get("album") or {}
+    countries = track.get("available_countries")
+    preview = track.get("preview") or None
+
+    record.update({
+        "readable": bool(track.get("readable", True)),
+        "preview": preview,
+        "preview_expires": preview_expiry(preview),
+        "cover": album.get("cover_medium"),
+        "cover_xl": album.get("cover_xl"),
+    })
+    if track.get("alternative"):
+        record["alternative_id"] = track["alternative"].get("id")
+
+    if not record["readable"]:
+        record["status"] = "unreadable"
+    elif countries is not None and country and country not in countries:
+        record["status"] = "blocked"
+    elif not preview:
+        record["status"] = "no_preview"
+    else:
+        record["status"] = "ok"
+    return record
+
+
+def check_cards(cards: list[Card], concurrency: int = DEFAULT_CONCURRENCY,
+                country: str = DEFAULT_COUNTRY):
+    """Yield (card, record) in input order, checking up to `concurrency` tracks at once."""
+
+    def check(card):
+        record = check_track(card, country)
+        METRICS.inc("track_checks", status=record["status"])
+        return record
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        yield from zip(cards, executor.map(check, cards))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that matched Deezer tracks are still playable.")
+    add_input_arguments(parser)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Tracks checked at once (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--country", default=DEFAULT_COUNTRY,
+                        help=f"Country the game is played in (default: {DEFAULT_COUNTRY})")
+    parser.add_argument("--report", default=DEFAULT_REPORT,
+                        help=f"Per-card status as NDJSON (default: {DEFAULT_REPORT})")
+    parser.add_argument("--rematch", default=DEFAULT_REMATCH,
+                        help=f"Cards to rematch, as deezer_matcher.py input (default: {DEFAULT_REMATCH})")
+    parser.add_argument("--quota-file",
+                        help="Share the rate limit with other processes through this file")
+    args = parser.parse_args()
+
+    cards = load_merged_cards(args)
+
+    if args.quota_file:
+        deezer_matcher.set_rate_limiter(SharedTokenBucket.for_quota(
+            args.quota_file, deezer_matcher.DEEZER_QUOTA_REQUESTS, deezer_matcher.DEEZER_QUOTA_PERIOD))
+
+    statuses = Counter()
+    rematch = []
+    Path(args.report).parent.mkdir(parents=True, exist_ok=True)
+
+    with open_text(args.report, "w") as report:
+        for i, (card, record) in enumerate(check_cards(cards, args.concurrency, args.country), 1):
+            statuses[record["status"]] += 1
+            report.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+            if record["status"] in DEAD_STATUSES:
+                print(f"[{i}/{len(cards)}] {record['status']}: {card.get('artist')} - {card.get('title')} "
+                      f"(Deezer {record['deezer_id']})")
+                # Back to the matcher's input format
+                rematch.append(card.inputs())
+
+    print(f"\nChecked {len(cards)} cards: " + ", ".join(f"{n} {s}" for s, n in statuses.most_common()))
+    print(f"Report written to {args.report}")
+
+    if rematch:
+        Path(args.rematch).parent.mkdir(parents=True, exist_ok=True)
+        with open_text(args.rematch, "w") as f:
+            json.dump(rematch, f, ensure_ascii=False, indent=2)
+        print(f"{len(rematch)} cards to rematch written to {args.rematch}")
+
+
+if __name__ == "__main__":
+    main()